@@ -0,0 +1,322 @@
+import argparse
+import asyncio
+import inspect
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from collections import abc, deque
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, TypedDict, get_args, get_origin, get_type_hints
+
+from httpx import Client, AsyncClient
+from typing_extensions import is_typeddict
+
+from benchmarks.mock_gateway import build_mock_transport, USER_ID, ACCOUNT_ID, CARD_ID, OPERATION_ID
+from clients.http.gateway.accounts.client import AccountsGatewayHTTPClient, AccountsGatewayAsyncHTTPClient
+from clients.http.gateway.cards.client import CardsGatewayHTTPClient, CardsGatewayAsyncHTTPClient
+from clients.http.gateway.documents.client import DocumentsGatewayHTTPClient, DocumentsGatewayAsyncHTTPClient
+from clients.http.gateway.operations.client import OperationsGatewayHTTPClient, OperationsGatewayAsyncHTTPClient
+from clients.http.gateway.users.client import UsersGatewayHTTPClient, UsersGatewayAsyncHTTPClient
+from metrics.recorder import MetricsRecorder
+
+BASE_URL = "http://gateway.benchmark"
+DEFAULT_BASELINE = Path(__file__).with_name("baseline.json")
+
+CLIENTS: dict[str, tuple[type, type]] = {
+    "users": (UsersGatewayHTTPClient, UsersGatewayAsyncHTTPClient),
+    "accounts": (AccountsGatewayHTTPClient, AccountsGatewayAsyncHTTPClient),
+    "cards": (CardsGatewayHTTPClient, CardsGatewayAsyncHTTPClient),
+    "documents": (DocumentsGatewayHTTPClient, DocumentsGatewayAsyncHTTPClient),
+    "operations": (OperationsGatewayHTTPClient, OperationsGatewayAsyncHTTPClient),
+}
+
+# Значения аргументов методов и полей TypedDict-запросов по имени
+ARGUMENTS: dict[str, Any] = {
+    "user_id": USER_ID,
+    "account_id": ACCOUNT_ID,
+    "card_id": CARD_ID,
+    "operation_id": OPERATION_ID,
+    "userId": USER_ID,
+    "accountId": ACCOUNT_ID,
+    "cardId": CARD_ID,
+    "status": "COMPLETED",
+    "amount": 55.77,
+    "category": "taxi",
+    "email": "user@example.com",
+    "lastName": "string",
+    "firstName": "string",
+    "middleName": "string",
+    "phoneNumber": "string",
+    "user_ids": [USER_ID] * 10,
+    "account_ids": [ACCOUNT_ID] * 10,
+    "operation_ids": [OPERATION_ID] * 10,
+}
+
+
+class BenchmarkResultDict(TypedDict):
+    """
+    Описание структуры результата одного бенчмарка.
+    """
+    ns_per_op: float
+    ops_per_sec: float
+    bytes_per_op: float
+    blocks_per_op: float
+
+
+@dataclass(frozen=True)
+class BenchmarkCase:
+    """
+    Один метод клиента с подготовленными аргументами.
+
+    :param name: Имя вида "sync operations.make_purchase_operation".
+    :param call: Вызов метода; для асинхронных клиентов возвращает корутину.
+    :param is_async: Относится ли метод к асинхронному клиенту.
+    """
+    name: str
+    call: Callable[[], Any]
+    is_async: bool
+
+
+def _build_argument(name: str, annotation: Any) -> Any:
+    # Для *_api методов, принимающих TypedDict или готовое тело, используется TypedDict
+    for option in get_args(annotation) or (annotation,):
+        if is_typeddict(option):
+            return {key: ARGUMENTS[key] for key in get_type_hints(option)}
+    return ARGUMENTS[name]
+
+
+async def _consume(iterator: Any) -> None:
+    async for _ in iterator:
+        pass
+
+
+def _build_call(method: Callable, arguments: list[Any], returns: Any) -> Callable[[], Any]:
+    # Потоковые и пакетные методы (iter_operations, *_many) измеряются вместе с чтением всех элементов
+    if get_origin(returns) is abc.AsyncIterator:
+        return lambda: _consume(method(*arguments))
+    if get_origin(returns) is abc.Iterator:
+        return lambda: deque(method(*arguments), maxlen=0)
+    return lambda: method(*arguments)
+
+
+def _public_methods(client_class: type) -> list[str]:
+    # Методы базового клиента (request, get, post) измеряются косвенно через методы gateway-клиентов
+    base = client_class.__mro__[1]
+    return [
+        name for name, _ in inspect.getmembers(client_class, inspect.isfunction)
+        if not name.startswith("_") and not hasattr(base, name)
+    ]
+
+
+def collect_cases(recorder: MetricsRecorder | None = None, operations: int = 10) -> list[BenchmarkCase]:
+    """
+    Собирает бенчмарки по всем *_api и высокоуровневым методам синхронных и асинхронных клиентов http-gateway.
+
+    Клиенты работают через httpx.MockTransport без сети, поэтому замер показывает только
+    стоимость клиентской стороны: сборку запроса, кодирование JSON, обработку ответа httpx и response.json().
+
+    :param recorder: Хранилище метрик, если нужно измерить клиентов вместе со сбором метрик.
+    :param operations: Сколько операций в ответе на получение списка операций.
+    :return: Список бенчмарков.
+    """
+    transport = build_mock_transport(operations)
+    sync_client = Client(transport=transport, base_url=BASE_URL)
+    async_client = AsyncClient(transport=transport, base_url=BASE_URL)
+
+    cases = []
+    for group, (sync_class, async_class) in CLIENTS.items():
+        clients = (("sync", sync_class(sync_client, recorder)), ("async", async_class(async_client, recorder)))
+        for mode, client in clients:
+            for name in _public_methods(type(client)):
+                method = getattr(client, name)
+                hints = get_type_hints(method)
+                arguments = [
+                    _build_argument(argument, hints.get(argument))
+                    for argument, parameter in inspect.signature(method).parameters.items()
+                    if parameter.default is inspect.Parameter.empty
+                ]
+                cases.append(
+                    BenchmarkCase(
+                        name=f"{mode} {group}.{name}",
+                        call=_build_call(method, arguments, hints.get("return")),
+                        is_async=mode == "async"
+                    )
+                )
+    return cases
+
+
+def _run(case: BenchmarkCase, iterations: int) -> int:
+    """
+    :return: Затраченное время в наносекундах.
+    """
+    call = case.call
+    if not case.is_async:
+        started = time.perf_counter_ns()
+        for _ in range(iterations):
+            call()
+        return time.perf_counter_ns() - started
+
+    async def loop() -> int:
+        started = time.perf_counter_ns()
+        for _ in range(iterations):
+            await call()
+        return time.perf_counter_ns() - started
+
+    return asyncio.run(loop())
+
+
+def _measure_allocations(case: BenchmarkCase, iterations: int) -> tuple[float, float]:
+    """
+    Считает память одного вызова под tracemalloc: пиковый объём, выделенный во время вызова,
+    и количество блоков, оставшихся занятыми после него (в первую очередь это разобранный ответ).
+
+    :return: Средние пиковый объём в байтах и количество блоков на один вызов.
+    """
+    results = []
+    peak_total = 0
+    blocks_total = 0
+
+    def begin() -> tuple[int, int]:
+        tracemalloc.reset_peak()
+        return tracemalloc.get_traced_memory()[0], sys.getallocatedblocks()
+
+    def end(current: int, blocks: int) -> None:
+        nonlocal peak_total, blocks_total
+        peak_total += tracemalloc.get_traced_memory()[1] - current
+        blocks_total += sys.getallocatedblocks() - blocks
+
+    async def measure_async() -> None:
+        for _ in range(iterations):
+            state = begin()
+            results.append(await case.call())
+            end(*state)
+
+    tracemalloc.start()
+    try:
+        if case.is_async:
+            asyncio.run(measure_async())
+        else:
+            for _ in range(iterations):
+                state = begin()
+                results.append(case.call())
+                end(*state)
+    finally:
+        tracemalloc.stop()
+    return peak_total / iterations, max(blocks_total / iterations, 0)
+
+
+def run_case(
+        case: BenchmarkCase,
+        iterations: int,
+        repeat: int = 5,
+        allocation_iterations: int = 20
+) -> BenchmarkResultDict:
+    """
+    Выполняет один бенчмарк.
+
+    Время берётся как лучшее из repeat прогонов по iterations вызовов: минимум меньше всего
+    зависит от шума планировщика ОС и фоновых процессов.
+
+    :param case: Бенчмарк.
+    :param iterations: Количество вызовов в одном прогоне.
+    :param repeat: Количество прогонов.
+    :param allocation_iterations: Количество вызовов для подсчёта памяти под tracemalloc.
+    :return: Результат бенчмарка.
+    """
+    _run(case, max(iterations // 10, 1))
+    ns_per_op = min(_run(case, iterations) for _ in range(repeat)) / iterations
+    bytes_per_op, blocks_per_op = _measure_allocations(case, allocation_iterations)
+    return BenchmarkResultDict(
+        ns_per_op=ns_per_op,
+        ops_per_sec=1e9 / ns_per_op,
+        bytes_per_op=bytes_per_op,
+        blocks_per_op=blocks_per_op
+    )
+
+
+def compare(
+        results: dict[str, BenchmarkResultDict],
+        baseline: dict[str, BenchmarkResultDict],
+        threshold: float
+) -> list[str]:
+    """
+    Сравнивает результаты с базовыми.
+
+    :param threshold: Допустимое падение пропускной способности, например 0.1 — на 10%.
+    :return: Описания бенчмарков, которые просели сильнее порога.
+    """
+    regressions = []
+    for name, result in results.items():
+        base = baseline.get(name)
+        if base is None:
+            continue
+        change = result["ops_per_sec"] / base["ops_per_sec"] - 1
+        if change < -threshold:
+            regressions.append(
+                f"{name}: {base['ops_per_sec']:,.0f} -> {result['ops_per_sec']:,.0f} ops/s ({change:+.1%})"
+            )
+    return regressions
+
+
+def format_results(results: dict[str, BenchmarkResultDict], baseline: dict[str, BenchmarkResultDict]) -> str:
+    width = max(len(name) for name in results)
+    lines = [f"{'benchmark':<{width}} {'ns/op':>10} {'ops/s':>10} {'B/op':>9} {'blocks/op':>10} {'vs base':>8}"]
+    for name, result in results.items():
+        base = baseline.get(name)
+        change = f"{result['ops_per_sec'] / base['ops_per_sec'] - 1:+.1%}" if base else "-"
+        lines.append(
+            f"{name:<{width}} {result['ns_per_op']:>10,.0f} {result['ops_per_sec']:>10,.0f} "
+            f"{result['bytes_per_op']:>9,.0f} {result['blocks_per_op']:>10.1f} {change:>8}"
+        )
+    return "\n".join(lines)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Микробенчмарки клиентов http-gateway без сети (httpx.MockTransport)")
+    parser.add_argument("-k", "--filter", default="", help="Запускать только бенчмарки, имя которых содержит строку")
+    parser.add_argument("-n", "--iterations", type=int, default=2000, help="Вызовов в одном прогоне")
+    parser.add_argument("-r", "--repeat", type=int, default=5, help="Количество прогонов")
+    parser.add_argument("--operations", type=int, default=10, help="Операций в ответе на получение списка операций")
+    parser.add_argument("--recorder", action="store_true", help="Измерять клиентов со сбором метрик")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE, help="JSON-файл с базовыми результатами")
+    parser.add_argument("--save", action="store_true", help="Сохранить результаты как базовые")
+    parser.add_argument("--threshold", type=float, default=0.1, help="Допустимое падение ops/s относительно базы")
+    args = parser.parse_args()
+    if not args.save and not args.baseline.exists():
+        # Без базы сравнивать не с чем: молчаливый успех скрыл бы любую регрессию
+        parser.error(f"baseline {args.baseline} not found, record it first with --save")
+
+    recorder = MetricsRecorder() if args.recorder else None
+    cases = [case for case in collect_cases(recorder, args.operations) if args.filter in case.name]
+    results = {case.name: run_case(case, args.iterations, args.repeat) for case in cases}
+
+    stored = json.loads(args.baseline.read_text()) if args.baseline.exists() else {}
+    baseline = stored.get("results", {})
+    print(format_results(results, baseline))
+
+    if args.save:
+        args.baseline.write_text(
+            json.dumps(
+                {
+                    "python": platform.python_version(),
+                    "platform": platform.platform(),
+                    "results": {**baseline, **results}
+                },
+                indent=2
+            )
+        )
+        print(f"\nBaseline saved to {args.baseline}")
+        return 0
+
+    regressions = compare(results, baseline, args.threshold)
+    if regressions:
+        print(f"\nThroughput regressed by more than {args.threshold:.0%}:", *regressions, sep="\n", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,160 @@
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TypedDict
+
+ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_BASELINE = Path(__file__).with_name("imports_baseline.json")
+
+
+@dataclass(frozen=True)
+class ImportCase:
+    """
+    Запуск интерпретатора, время которого измеряется.
+
+    :param name: Имя бенчмарка.
+    :param arguments: Аргументы python, например ("-m", "perf", "--help").
+    :param budget_ms: Допустимое время сверх запуска пустого интерпретатора, мс (None — без ограничения).
+    """
+    name: str
+    arguments: tuple[str, ...]
+    budget_ms: float | None = None
+
+
+class ImportResultDict(TypedDict):
+    wall_ms: float
+    net_ms: float
+
+
+# Пустой интерпретатор: его время вычитается из остальных, чтобы не зависеть от site и окружения
+INTERPRETER = ImportCase("python", ("-c", "pass"))
+CASES = (
+    ImportCase("perf --help", ("-m", "perf", "--help"), budget_ms=100),
+    ImportCase("perf report", ("-c", "import perf.report")),
+    ImportCase("perf compare", ("-c", "import perf.compare")),
+    ImportCase("perf seed", ("-c", "import fixtures.__main__")),
+    ImportCase("perf run", ("-c", "import perf.run")),
+    ImportCase("perf capacity", ("-c", "import perf.capacity")),
+    ImportCase("worker", ("-c", "import load.multiprocess")),
+)
+
+
+def measure(case: ImportCase, repeat: int) -> float:
+    """
+    Запускает интерпретатор repeat раз и возвращает лучшее время в миллисекундах:
+    минимум меньше всего зависит от прогрева дискового кэша и фоновых процессов.
+    """
+    times = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        subprocess.run(
+            [sys.executable, *case.arguments],
+            cwd=ROOT,
+            check=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL
+        )
+        times.append((time.perf_counter() - started) * 1000)
+    return min(times)
+
+
+def run_cases(cases: list[ImportCase], repeat: int) -> dict[str, ImportResultDict]:
+    # Первый запуск прогревает кэш байткода, в измерения он не попадает
+    for case in [INTERPRETER, *cases]:
+        measure(case, 1)
+    interpreter = measure(INTERPRETER, repeat)
+    results = {INTERPRETER.name: ImportResultDict(wall_ms=interpreter, net_ms=0)}
+    for case in cases:
+        wall_ms = measure(case, repeat)
+        results[case.name] = ImportResultDict(wall_ms=wall_ms, net_ms=max(wall_ms - interpreter, 0))
+    return results
+
+
+def compare(
+        results: dict[str, ImportResultDict],
+        baseline: dict[str, ImportResultDict],
+        cases: list[ImportCase],
+        threshold: float
+) -> list[str]:
+    """
+    Проверяет бюджеты и сравнивает результаты с базовыми.
+
+    :param threshold: Допустимый рост времени импорта, например 0.2 — на 20%.
+    :return: Описания бенчмарков, которые превысили бюджет или выросли сильнее порога.
+    """
+    regressions = []
+    for case in cases:
+        result = results[case.name]
+        if case.budget_ms is not None and result["net_ms"] > case.budget_ms:
+            regressions.append(f"{case.name}: {result['net_ms']:.1f} ms > budget {case.budget_ms:.0f} ms")
+        base = baseline.get(case.name)
+        if base is None or not base["net_ms"]:
+            continue
+        change = result["net_ms"] / base["net_ms"] - 1
+        if change > threshold:
+            regressions.append(f"{case.name}: {base['net_ms']:.1f} -> {result['net_ms']:.1f} ms ({change:+.1%})")
+    return regressions
+
+
+def format_results(
+        results: dict[str, ImportResultDict],
+        baseline: dict[str, ImportResultDict],
+        cases: list[ImportCase]
+) -> str:
+    budgets = {case.name: case.budget_ms for case in cases}
+    width = max(len(name) for name in results)
+    lines = [f"{'benchmark':<{width}} {'wall ms':>9} {'net ms':>9} {'budget':>8} {'vs base':>8}"]
+    for name, result in results.items():
+        base = baseline.get(name)
+        change = f"{result['net_ms'] / base['net_ms'] - 1:+.1%}" if base and base["net_ms"] else "-"
+        budget = f"{budgets[name]:.0f}" if budgets.get(name) is not None else "-"
+        lines.append(f"{name:<{width}} {result['wall_ms']:>9.1f} {result['net_ms']:>9.1f} {budget:>8} {change:>8}")
+    return "\n".join(lines)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Время запуска CLI perf и воркеров нагрузки (сверх запуска пустого интерпретатора)"
+    )
+    parser.add_argument("-k", "--filter", default="", help="Запускать только бенчмарки, имя которых содержит строку")
+    parser.add_argument("-r", "--repeat", type=int, default=10, help="Количество запусков интерпретатора")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE, help="JSON-файл с базовыми результатами")
+    parser.add_argument("--save", action="store_true", help="Сохранить результаты как базовые")
+    parser.add_argument("--threshold", type=float, default=0.2, help="Допустимый рост времени относительно базы")
+    args = parser.parse_args()
+
+    cases = [case for case in CASES if args.filter in case.name]
+    results = run_cases(cases, args.repeat)
+
+    stored = json.loads(args.baseline.read_text()) if args.baseline.exists() else {}
+    baseline = stored.get("results", {})
+    print(format_results(results, baseline, cases))
+
+    if args.save:
+        args.baseline.write_text(
+            json.dumps(
+                {
+                    "python": platform.python_version(),
+                    "platform": platform.platform(),
+                    "results": {**baseline, **results}
+                },
+                indent=2
+            )
+        )
+        print(f"\nBaseline saved to {args.baseline}")
+        return 0
+
+    regressions = compare(results, baseline, cases, args.threshold)
+    if regressions:
+        print("\nImport time regressed:", *regressions, sep="\n", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
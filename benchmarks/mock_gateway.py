@@ -0,0 +1,82 @@
+import json
+
+from httpx import MockTransport, Request, Response
+
+from fake_gateway.server import FakeGatewayApp
+
+USER_ID = "user-id"
+ACCOUNT_ID = "account-id"
+CARD_ID = "card-id"
+OPERATION_ID = "operation-id"
+
+
+def build_canned_responses(operations: int = 10) -> dict[tuple[str, str], bytes]:
+    """
+    Готовит тела ответов для всех эндпоинтов http-gateway по одному набору сущностей.
+
+    Ответы генерируются фейковым gateway один раз, чтобы в замер попадала только работа клиента.
+
+    :param operations: Сколько операций вернуть в списке операций счёта.
+    :return: Словарь {(метод, путь без query): тело ответа}.
+    """
+    app = FakeGatewayApp()
+    state = app.state
+    user = state.create_user(
+        {
+            "email": "user@example.com",
+            "lastName": "string",
+            "firstName": "string",
+            "middleName": "string",
+            "phoneNumber": "string"
+        }
+    )["user"]
+    account = state.open_account(user["id"], "CREDIT_CARD")["account"]
+    card = account["cards"][0]
+    operation = None
+    for _ in range(operations):
+        operation = state.make_operation(
+            "PURCHASE",
+            {"status": "COMPLETED", "amount": 55.77, "cardId": card["id"], "accountId": account["id"], "category": "taxi"}
+        )["operation"]
+
+    def body(result: dict) -> bytes:
+        return json.dumps(result, separators=(",", ":")).encode()
+
+    responses: dict[tuple[str, str], bytes] = {
+        ("GET", f"/api/v1/users/{USER_ID}"): body(state.get_user(user["id"])),
+        ("POST", "/api/v1/users"): body({"user": user}),
+        ("GET", "/api/v1/accounts"): body(state.get_accounts(user["id"])),
+        ("GET", f"/api/v1/documents/tariff-document/{ACCOUNT_ID}"): body(state.get_document("tariff", account["id"])),
+        ("GET", f"/api/v1/documents/contract-document/{ACCOUNT_ID}"): body(
+            state.get_document("contract", account["id"])
+        ),
+        ("GET", f"/api/v1/operations/{OPERATION_ID}"): body({"operation": operation}),
+        ("GET", f"/api/v1/operations/operation-receipt/{OPERATION_ID}"): body(
+            state.get_operation_receipt(operation["id"])
+        ),
+        ("GET", "/api/v1/operations"): body(state.get_operations(account["id"])),
+        ("GET", "/api/v1/operations/operations-summary"): body(state.get_operations_summary(account["id"])),
+    }
+    for account_route in ("open-deposit-account", "open-savings-account", "open-debit-card-account",
+                          "open-credit-card-account"):
+        responses[("POST", f"/api/v1/accounts/{account_route}")] = body({"account": account})
+    for card_route in ("issue-virtual-card", "issue-physical-card"):
+        responses[("POST", f"/api/v1/cards/{card_route}")] = body({"card": card})
+    for operation_route in ("fee", "top-up", "cashback", "transfer", "purchase", "bill-payment", "cash-withdrawal"):
+        responses[("POST", f"/api/v1/operations/make-{operation_route}-operation")] = body({"operation": operation})
+    return responses
+
+
+def build_mock_transport(operations: int = 10) -> MockTransport:
+    """
+    Транспорт без сети, отвечающий заранее подготовленными телами (подходит и для Client, и для AsyncClient).
+
+    :param operations: Сколько операций вернуть в списке операций счёта.
+    """
+    responses = build_canned_responses(operations)
+    headers = {"Content-Type": "application/json"}
+
+    def handler(request: Request) -> Response:
+        return Response(200, headers=headers, content=responses[(request.method, request.url.path)])
+
+    return MockTransport(handler)
@@ -1,32 +1,280 @@
-from typing import Any
-from httpx import Client, URL, Response, QueryParams
+import time
+from contextlib import contextmanager, asynccontextmanager
+from typing import Any, AsyncIterator, Iterator
+from httpx import Client, AsyncClient, URL, Response, QueryParams
+
+from clients.http.decoding import ResponseDecoder, DEFAULT_RESPONSE_DECODER
+from clients.http.encoding import JSON_HEADERS, dumps_json
+from metrics.phases import PhaseTimer
+from metrics.recorder import MetricsRecorder
 
 
 class HTTPClient:
     """
     Базовый HTTP API клиент, принимающий объект httpx.Client.
     :param client: экземпляр httpx.Client для выполнения HTTP-запросов
+    :param recorder: хранилище метрик; если передано, для каждого запроса сохраняются
+        латентность, код ответа и размер тела по шаблону эндпоинта, а при recorder.trace_phases
+        ещё и разбивка времени по стадиям запроса через trace-события httpcore
+    :param decoder: разбор и проверка тел ответов высокоуровневых методов
+        (по умолчанию тела только разбираются, без проверки по схеме)
     """
 
-    def __init__(self, client: Client) -> None:
+    def __init__(
+            self,
+            client: Client,
+            recorder: MetricsRecorder | None = None,
+            decoder: ResponseDecoder | None = None
+    ) -> None:
         self.client = client
+        self.recorder = recorder
+        self.decoder = decoder or DEFAULT_RESPONSE_DECODER
+
+    def request(self, method: str, url: URL | str, route: str | None = None, **kwargs: Any) -> Response:
+        """
+        Выполняет запрос и, если включены метрики, сохраняет замер под именем "<метод> <шаблон эндпоинта>".
+
+        :param method: HTTP-метод.
+        :param url: URL-адрес эндпоинта.
+        :param route: Шаблон эндпоинта, например /api/v1/operations/{operation_id}.
+            Используется вместо конкретного URL, чтобы количество метрик не зависело от идентификаторов.
+        :return: Объект Response с данными ответа.
+        """
+        if self.recorder is None:
+            return self.client.request(method, url, **kwargs)
 
-    def get(self, url: URL | str, params: QueryParams | None = None) -> Response:
+        timer = None
+        if self.recorder.trace_phases:
+            timer = PhaseTimer()
+            kwargs["extensions"] = {**(kwargs.get("extensions") or {}), "trace": timer}
+
+        name = f"{method} {route or url}"
+        started = time.perf_counter_ns()
+        try:
+            response = self.client.request(method, url, **kwargs)
+        except Exception:
+            self.recorder.record(name, time.perf_counter_ns() - started, error=True)
+            raise
+        finished = time.perf_counter_ns()
+        self.recorder.record(
+            name,
+            finished - started,
+            error=response.is_error,
+            status=response.status_code,
+            size=len(response.content),
+            phases=timer.phases(finished) if timer is not None else None
+        )
+        return response
+
+    @contextmanager
+    def stream(self, method: str, url: URL | str, route: str | None = None, **kwargs: Any) -> Iterator[Response]:
+        """
+        Выполняет запрос, тело ответа которого читается по частям (response.iter_bytes()) внутри блока with.
+
+        Замер сохраняется при выходе из блока: латентность включает чтение тела,
+        а размер — количество фактически полученных байт.
+
+        :param method: HTTP-метод.
+        :param url: URL-адрес эндпоинта.
+        :param route: Шаблон эндпоинта для метрик.
+        :return: Контекстный менеджер с объектом Response, тело которого ещё не прочитано.
+        """
+        if self.recorder is None:
+            with self.client.stream(method, url, **kwargs) as response:
+                yield response
+            return
+
+        timer = None
+        if self.recorder.trace_phases:
+            timer = PhaseTimer()
+            kwargs["extensions"] = {**(kwargs.get("extensions") or {}), "trace": timer}
+
+        name = f"{method} {route or url}"
+        started = time.perf_counter_ns()
+        response, error = None, False
+        try:
+            with self.client.stream(method, url, **kwargs) as response:
+                yield response
+        except Exception:
+            error = True
+            raise
+        finally:
+            finished = time.perf_counter_ns()
+            if response is None:
+                self.recorder.record(name, finished - started, error=True)
+            else:
+                self.recorder.record(
+                    name,
+                    finished - started,
+                    error=error or response.is_error,
+                    status=response.status_code,
+                    size=response.num_bytes_downloaded,
+                    phases=timer.phases(finished) if timer is not None else None
+                )
+
+    def get(self, url: URL | str, params: QueryParams | None = None, route: str | None = None) -> Response:
         """
         Выполняет GET-запрос.
 
         :param url: URL-адрес эндпоинта.
         :param params: GET-параметры запроса (например, ?key=value).
+        :param route: Шаблон эндпоинта для метрик.
         :return: Объект Response с данными ответа.
         """
-        return self.client.get(url, params=params)
+        return self.request("GET", url, route=route, params=params)
 
-    def post(self, url: str, json: Any | None = None) -> Response:
+    def post(self, url: str, json: Any | None = None, route: str | None = None) -> Response:
         """
         Выполняет POST-запрос.
 
+        Тело кодируется в компактный JSON через clients.http.encoding.dumps_json (orjson, если установлен)
+        и отправляется как content с заголовком Content-Type: application/json.
+
+        :param url: URL-адрес эндпоинта.
+        :param json: Данные в формате JSON или уже закодированное JSON-тело в bytes (см. BodyTemplate).
+        :param route: Шаблон эндпоинта для метрик.
+        :return: Объект Response с данными ответа.
+        """
+        if json is None:
+            return self.request("POST", url, route=route)
+        content = json if json.__class__ is bytes else dumps_json(json)
+        return self.request("POST", url, route=route, content=content, headers=JSON_HEADERS)
+
+
+class AsyncHTTPClient:
+    """
+    Базовый асинхронный HTTP API клиент, принимающий объект httpx.AsyncClient.
+    :param client: экземпляр httpx.AsyncClient для выполнения HTTP-запросов
+    :param recorder: хранилище метрик; если передано, для каждого запроса сохраняются
+        латентность, код ответа и размер тела по шаблону эндпоинта, а при recorder.trace_phases
+        ещё и разбивка времени по стадиям запроса через trace-события httpcore
+    :param decoder: разбор и проверка тел ответов высокоуровневых методов
+        (по умолчанию тела только разбираются, без проверки по схеме)
+    """
+
+    def __init__(
+            self,
+            client: AsyncClient,
+            recorder: MetricsRecorder | None = None,
+            decoder: ResponseDecoder | None = None
+    ) -> None:
+        self.client = client
+        self.recorder = recorder
+        self.decoder = decoder or DEFAULT_RESPONSE_DECODER
+
+    async def request(self, method: str, url: URL | str, route: str | None = None, **kwargs: Any) -> Response:
+        """
+        Выполняет асинхронный запрос и, если включены метрики,
+        сохраняет замер под именем "<метод> <шаблон эндпоинта>".
+
+        :param method: HTTP-метод.
+        :param url: URL-адрес эндпоинта.
+        :param route: Шаблон эндпоинта, например /api/v1/operations/{operation_id}.
+        :return: Объект Response с данными ответа.
+        """
+        if self.recorder is None:
+            return await self.client.request(method, url, **kwargs)
+
+        timer = None
+        if self.recorder.trace_phases:
+            timer = PhaseTimer()
+            kwargs["extensions"] = {**(kwargs.get("extensions") or {}), "trace": timer.atrace}
+
+        name = f"{method} {route or url}"
+        started = time.perf_counter_ns()
+        try:
+            response = await self.client.request(method, url, **kwargs)
+        except Exception:
+            self.recorder.record(name, time.perf_counter_ns() - started, error=True)
+            raise
+        finished = time.perf_counter_ns()
+        self.recorder.record(
+            name,
+            finished - started,
+            error=response.is_error,
+            status=response.status_code,
+            size=len(response.content),
+            phases=timer.phases(finished) if timer is not None else None
+        )
+        return response
+
+    @asynccontextmanager
+    async def stream(
+            self,
+            method: str,
+            url: URL | str,
+            route: str | None = None,
+            **kwargs: Any
+    ) -> AsyncIterator[Response]:
+        """
+        Выполняет асинхронный запрос, тело ответа которого читается по частям (response.aiter_bytes())
+        внутри блока async with.
+
+        Замер сохраняется при выходе из блока: латентность включает чтение тела,
+        а размер — количество фактически полученных байт.
+
+        :param method: HTTP-метод.
+        :param url: URL-адрес эндпоинта.
+        :param route: Шаблон эндпоинта для метрик.
+        :return: Контекстный менеджер с объектом Response, тело которого ещё не прочитано.
+        """
+        if self.recorder is None:
+            async with self.client.stream(method, url, **kwargs) as response:
+                yield response
+            return
+
+        timer = None
+        if self.recorder.trace_phases:
+            timer = PhaseTimer()
+            kwargs["extensions"] = {**(kwargs.get("extensions") or {}), "trace": timer.atrace}
+
+        name = f"{method} {route or url}"
+        started = time.perf_counter_ns()
+        response, error = None, False
+        try:
+            async with self.client.stream(method, url, **kwargs) as response:
+                yield response
+        except Exception:
+            error = True
+            raise
+        finally:
+            finished = time.perf_counter_ns()
+            if response is None:
+                self.recorder.record(name, finished - started, error=True)
+            else:
+                self.recorder.record(
+                    name,
+                    finished - started,
+                    error=error or response.is_error,
+                    status=response.status_code,
+                    size=response.num_bytes_downloaded,
+                    phases=timer.phases(finished) if timer is not None else None
+                )
+
+    async def get(self, url: URL | str, params: QueryParams | None = None, route: str | None = None) -> Response:
+        """
+        Выполняет асинхронный GET-запрос.
+
+        :param url: URL-адрес эндпоинта.
+        :param params: GET-параметры запроса (например, ?key=value).
+        :param route: Шаблон эндпоинта для метрик.
+        :return: Объект Response с данными ответа.
+        """
+        return await self.request("GET", url, route=route, params=params)
+
+    async def post(self, url: str, json: Any | None = None, route: str | None = None) -> Response:
+        """
+        Выполняет асинхронный POST-запрос.
+
+        Тело кодируется в компактный JSON через clients.http.encoding.dumps_json (orjson, если установлен)
+        и отправляется как content с заголовком Content-Type: application/json.
+
         :param url: URL-адрес эндпоинта.
-        :param json: Данные в формате JSON.
+        :param json: Данные в формате JSON или уже закодированное JSON-тело в bytes (см. BodyTemplate).
+        :param route: Шаблон эндпоинта для метрик.
         :return: Объект Response с данными ответа.
         """
-        return self.client.post(url=url, json=json)
+        if json is None:
+            return await self.request("POST", url, route=route)
+        content = json if json.__class__ is bytes else dumps_json(json)
+        return await self.request("POST", url, route=route, content=content, headers=JSON_HEADERS)
@@ -0,0 +1,143 @@
+import itertools
+import json
+from collections.abc import Iterator, Mapping
+from typing import TYPE_CHECKING, Any
+
+from httpx import Response
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if TYPE_CHECKING:
+    from pydantic import TypeAdapter
+
+DECODING_MODES = ("off", "lazy", "sampled", "full")
+
+_adapters: dict[Any, "TypeAdapter"] = {}
+
+
+def get_type_adapter(schema: Any) -> "TypeAdapter":
+    """
+    Возвращает закэшированный pydantic.TypeAdapter для схемы ответа (TypedDict или модели).
+
+    Построение адаптера стоит миллисекунды, поэтому каждая схема компилируется один раз на процесс.
+    pydantic импортируется только при первой проверке.
+    """
+    adapter = _adapters.get(schema)
+    if adapter is None:
+        from pydantic import TypeAdapter
+
+        adapter = _adapters[schema] = TypeAdapter(schema)
+    return adapter
+
+
+def loads_json(content: bytes) -> Any:
+    """
+    Разбирает JSON-тело ответа: через orjson, если он установлен, иначе через json.
+    """
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+class LazyJSON(Mapping):
+    """
+    Тело ответа, которое разбирается только при первом обращении к полю.
+
+    До первого обращения хранятся только байты ответа, поэтому ответы, поля которых сценарий
+    не читает (например, get_operations в цепочке шагов), не разбираются вовсе.
+    После разбора байты освобождаются, а вложенные значения — обычные dict и list.
+    """
+    __slots__ = ("_content", "_value")
+
+    def __init__(self, content: bytes) -> None:
+        self._content = content
+        self._value: dict[str, Any] | None = None
+
+    @property
+    def value(self) -> dict[str, Any]:
+        """
+        Разобранное тело ответа.
+        """
+        if self._value is None:
+            self._value = loads_json(self._content)
+            self._content = b""
+        return self._value
+
+    @property
+    def is_decoded(self) -> bool:
+        return self._value is not None
+
+    def __getitem__(self, key: str) -> Any:
+        return self.value[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.value)
+
+    def __len__(self) -> int:
+        return len(self.value)
+
+    def __reduce__(self) -> tuple:
+        return dict, (self.value,)
+
+    def __repr__(self) -> str:
+        if self._value is None:
+            return f"LazyJSON(<{len(self._content)} bytes>)"
+        return f"LazyJSON({self._value!r})"
+
+
+class ResponseDecoder:
+    """
+    Разбор тел ответов высокоуровневыми методами клиентов с проверкой по схеме ответа.
+
+    Режимы:
+    - off — тело только разбирается, без проверки (по умолчанию);
+    - lazy — тело разбирается при первом обращении к полю (см. LazyJSON), без проверки;
+    - sampled — каждый sample_every-й ответ проверяется по схеме, остальные только разбираются;
+    - full — проверяется каждый ответ.
+
+    Проверка выполняется через pydantic.TypeAdapter.validate_json прямо по байтам ответа,
+    без промежуточного json.loads, и возвращает те же словари, что описаны в TypedDict клиентов.
+    Несоответствие схеме приводит к pydantic.ValidationError.
+
+    :param mode: off, lazy, sampled или full.
+    :param sample_every: Как часто проверять ответы в режиме sampled.
+    """
+
+    def __init__(self, mode: str = "off", sample_every: int = 100) -> None:
+        if mode not in DECODING_MODES:
+            raise ValueError(f"Unknown decoding mode: {mode}, expected one of {', '.join(DECODING_MODES)}")
+        if sample_every < 1:
+            raise ValueError("sample_every must be positive")
+
+        self.mode = mode
+        self.sample_every = sample_every
+        self._counter = itertools.count()
+
+    def __getstate__(self) -> dict[str, Any]:
+        return {"mode": self.mode, "sample_every": self.sample_every}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__init__(**state)
+
+    def should_validate(self) -> bool:
+        if self.mode in ("off", "lazy"):
+            return False
+        return self.mode == "full" or next(self._counter) % self.sample_every == 0
+
+    def decode(self, response: Response, schema: Any) -> Any:
+        """
+        :param response: Ответ http-gateway.
+        :param schema: Схема тела ответа, например GetUserResponseDict.
+        :return: Разобранное тело.
+        """
+        if self.mode == "lazy":
+            return LazyJSON(response.content)
+        if self.should_validate():
+            return get_type_adapter(schema).validate_json(response.content)
+        return loads_json(response.content)
+
+
+DEFAULT_RESPONSE_DECODER = ResponseDecoder()
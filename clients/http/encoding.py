@@ -0,0 +1,74 @@
+import json
+from json.encoder import encode_basestring_ascii
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def dumps_json(value: Any) -> bytes:
+    """
+    Кодирует тело запроса в компактный JSON: через orjson, если он установлен, иначе через json.
+    """
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"), allow_nan=False).encode()
+
+
+def _encode_value(value: Any) -> str:
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"), allow_nan=False)
+
+
+class Variable:
+    """
+    Отметка поля, значение которого подставляется при каждом запросе (см. BodyTemplate).
+    """
+
+    def __repr__(self) -> str:
+        return "VARIABLE"
+
+
+VARIABLE = Variable()
+_PLACEHOLDER = "\x00variable\x00"
+
+
+class BodyTemplate:
+    """
+    Заранее закодированное JSON-тело запроса, в котором меняются только отдельные поля.
+
+    Постоянная часть тела кодируется один раз при создании шаблона, а при запросе
+    в неё подставляются только закодированные значения переменных полей,
+    без построения словаря и полной сериализации (в несколько раз быстрее json.dumps):
+
+        CARD_BODY = BodyTemplate({"userId": VARIABLE, "accountId": VARIABLE})
+        CARD_BODY.render(user_id, account_id)  # b'{"userId":"...","accountId":"..."}'
+
+    :param fields: Поля тела в нужном порядке; переменные поля отмечаются значением VARIABLE.
+    """
+
+    def __init__(self, fields: dict[str, Any]) -> None:
+        self.variables = tuple(name for name, value in fields.items() if value is VARIABLE)
+        encoded = json.dumps(
+            {name: _PLACEHOLDER if value is VARIABLE else value for name, value in fields.items()},
+            ensure_ascii=False,
+            separators=(",", ":")
+        )
+        self._format = "%s".join(
+            part.replace("%", "%%") for part in encoded.split(json.dumps(_PLACEHOLDER))
+        )
+
+    def render(self, *values: Any) -> bytes:
+        """
+        :param values: Значения переменных полей в порядке self.variables.
+        :return: Готовое JSON-тело.
+        """
+        if len(values) != len(self.variables):
+            raise TypeError(f"Expected values for {', '.join(self.variables)}")
+        encoded = tuple(
+            [encode_basestring_ascii(value) if value.__class__ is str else _encode_value(value) for value in values]
+        )
+        return (self._format % encoded).encode()
@@ -0,0 +1,166 @@
+import asyncio
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Awaitable, Callable, Generic, Iterable, Iterator, TypeVar
+
+T = TypeVar("T")
+
+# Одновременных запросов по умолчанию: при большем числе пул соединений httpcore
+# тратит на распределение запросов больше времени, чем экономится на параллельности
+DEFAULT_FANOUT_CONCURRENCY = 20
+# Во сколько раз больше concurrency готовых результатов может ждать отстающий запрос при ordered=True
+ORDERED_WINDOW_FACTOR = 16
+
+
+@dataclass(frozen=True)
+class FanoutResult(Generic[T]):
+    """
+    Результат одного запроса пакета.
+
+    :param key: Аргумент запроса, например идентификатор счёта.
+    :param value: Ответ, если запрос выполнен успешно.
+    :param error: Исключение, если запрос завершился ошибкой.
+    """
+    key: Any
+    value: T | None = None
+    error: Exception | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class _Window:
+    """
+    Порядок выдачи результатов: по мере завершения или в порядке аргументов.
+
+    В режиме ordered готовые результаты ждут отстающий запрос в буфере, а новые запросы
+    не запускаются, пока буфер заполнен, поэтому память пакета ограничена при любом количестве аргументов.
+    """
+
+    def __init__(self, ordered: bool, concurrency: int) -> None:
+        self.ordered = ordered
+        self.limit = concurrency * ORDERED_WINDOW_FACTOR
+        self.buffered: dict[int, FanoutResult] = {}
+        self.next_index = 0
+
+    def has_room(self) -> bool:
+        return not self.ordered or len(self.buffered) < self.limit
+
+    def add(self, index: int, result: FanoutResult) -> list[FanoutResult]:
+        if not self.ordered:
+            return [result]
+        self.buffered[index] = result
+        ready = []
+        while self.next_index in self.buffered:
+            ready.append(self.buffered.pop(self.next_index))
+            self.next_index += 1
+        return ready
+
+
+async def _call_async(call: Callable[[Any], Awaitable[T]], key: Any) -> FanoutResult[T]:
+    try:
+        return FanoutResult(key, value=await call(key))
+    except Exception as error:
+        return FanoutResult(key, error=error)
+
+
+async def fan_out(
+        call: Callable[[Any], Awaitable[T]],
+        keys: Iterable[Any],
+        concurrency: int = DEFAULT_FANOUT_CONCURRENCY,
+        ordered: bool = True
+) -> AsyncIterator[FanoutResult[T]]:
+    """
+    Выполняет call(key) для каждого аргумента, держа не больше concurrency запросов одновременно.
+
+    Аргументы читаются из keys по мере выполнения, поэтому пакет может быть сколь угодно большим
+    (например, генератор идентификаторов из хранилища тестовых данных). Ошибка отдельного запроса
+    не останавливает пакет, а возвращается в FanoutResult.error.
+
+        async for result in fan_out(client.get_operation, operation_ids, ordered=False):
+            if not result.ok:
+                ...
+
+    :param call: Асинхронная функция одного запроса.
+    :param keys: Аргументы запросов.
+    :param concurrency: Максимальное количество одновременных запросов.
+    :param ordered: Возвращать результаты в порядке аргументов (True) или по мере завершения (False).
+    :return: Асинхронный итератор результатов.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be positive")
+
+    arguments = enumerate(keys)
+    window = _Window(ordered, concurrency)
+    pending: dict[asyncio.Task, int] = {}
+
+    def schedule() -> None:
+        while len(pending) < concurrency and window.has_room():
+            item = next(arguments, None)
+            if item is None:
+                return
+            index, key = item
+            pending[asyncio.ensure_future(_call_async(call, key))] = index
+
+    try:
+        schedule()
+        while pending:
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                for result in window.add(pending.pop(task), task.result()):
+                    yield result
+            schedule()
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+def _call_sync(call: Callable[[Any], T], key: Any) -> FanoutResult[T]:
+    try:
+        return FanoutResult(key, value=call(key))
+    except Exception as error:
+        return FanoutResult(key, error=error)
+
+
+def fan_out_threads(
+        call: Callable[[Any], T],
+        keys: Iterable[Any],
+        concurrency: int = DEFAULT_FANOUT_CONCURRENCY,
+        ordered: bool = True
+) -> Iterator[FanoutResult[T]]:
+    """
+    Синхронный вариант fan_out: запросы выполняются в пуле из concurrency потоков.
+
+    :param call: Функция одного запроса.
+    :param keys: Аргументы запросов.
+    :param concurrency: Количество потоков.
+    :param ordered: Возвращать результаты в порядке аргументов (True) или по мере завершения (False).
+    :return: Итератор результатов.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be positive")
+
+    arguments = enumerate(keys)
+    window = _Window(ordered, concurrency)
+    pending: dict[Future, int] = {}
+
+    with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="fanout") as executor:
+        def schedule() -> None:
+            while len(pending) < concurrency and window.has_room():
+                item = next(arguments, None)
+                if item is None:
+                    return
+                index, key = item
+                pending[executor.submit(_call_sync, call, key)] = index
+
+        try:
+            schedule()
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield from window.add(pending.pop(future), future.result())
+                schedule()
+        finally:
+            for future in pending:
+                future.cancel()
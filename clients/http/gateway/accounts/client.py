@@ -1,10 +1,21 @@
-from typing import TypedDict
+from typing import AsyncIterator, Iterable, Iterator
+
+from typing_extensions import TypedDict
 
 from httpx import Response, QueryParams
 
-from clients.http.client import HTTPClient
+from clients.http.client import HTTPClient, AsyncHTTPClient
+from clients.http.decoding import ResponseDecoder
+from clients.http.encoding import BodyTemplate, VARIABLE
+from clients.http.fanout import FanoutResult, fan_out, fan_out_threads, DEFAULT_FANOUT_CONCURRENCY
 from clients.http.gateway.cards.client import CardDict
-from clients.http.gateway.client import build_gateway_http_client
+from clients.http.gateway.client import (
+    build_gateway_http_client,
+    build_gateway_async_http_client,
+    GatewayHTTPPoolConfig,
+    DEFAULT_GATEWAY_HTTP_POOL_CONFIG
+)
+from metrics.recorder import MetricsRecorder
 
 
 class AccountDict(TypedDict):
@@ -88,6 +99,9 @@ class OpenCreditCardAccountResponseDict(TypedDict):
     account: AccountDict
 
 
+OPEN_ACCOUNT_BODY = BodyTemplate({"userId": VARIABLE})
+
+
 class AccountsGatewayHTTPClient(HTTPClient):
     """
     Клиент для взаимодействия с /api/v1/accounts сервиса http-gateway.
@@ -102,38 +116,38 @@ class AccountsGatewayHTTPClient(HTTPClient):
         """
         return self.get("/api/v1/accounts", params=QueryParams(**query))
 
-    def open_deposit_account_api(self, request: OpenDepositAccountRequestDict) -> Response:
+    def open_deposit_account_api(self, request: OpenDepositAccountRequestDict | bytes) -> Response:
         """
         Выполняет POST-запрос для открытия депозитного счёта.
 
-        :param request: Словарь с userId.
+        :param request: Словарь с userId или готовое JSON-тело.
         :return: Объект httpx.Response с результатом операции.
         """
         return self.post("/api/v1/accounts/open-deposit-account", json=request)
 
-    def open_savings_account_api(self, request: OpenSavingsAccountRequestDict) -> Response:
+    def open_savings_account_api(self, request: OpenSavingsAccountRequestDict | bytes) -> Response:
         """
         Выполняет POST-запрос для открытия сберегательного счёта.
 
-        :param request: Словарь с userId.
+        :param request: Словарь с userId или готовое JSON-тело.
         :return: Объект httpx.Response.
         """
         return self.post("/api/v1/accounts/open-savings-account", json=request)
 
-    def open_debit_card_account_api(self, request: OpenDebitCardAccountRequestDict) -> Response:
+    def open_debit_card_account_api(self, request: OpenDebitCardAccountRequestDict | bytes) -> Response:
         """
         Выполняет POST-запрос для открытия дебетовой карты.
 
-        :param request: Словарь с userId.
+        :param request: Словарь с userId или готовое JSON-тело.
         :return: Объект httpx.Response.
         """
         return self.post("/api/v1/accounts/open-debit-card-account", json=request)
 
-    def open_credit_card_account_api(self, request: OpenCreditCardAccountRequestDict) -> Response:
+    def open_credit_card_account_api(self, request: OpenCreditCardAccountRequestDict | bytes) -> Response:
         """
         Выполняет POST-запрос для открытия кредитной карты.
 
-        :param request: Словарь с userId.
+        :param request: Словарь с userId или готовое JSON-тело.
         :return: Объект httpx.Response.
         """
         return self.post("/api/v1/accounts/open-credit-card-account", json=request)
@@ -141,33 +155,176 @@ class AccountsGatewayHTTPClient(HTTPClient):
     def get_accounts(self, user_id: str) -> GetAccountsResponseDict:
         query = GetAccountsQueryDict(userId=user_id)
         response = self.get_accounts_api(query)
-        return response.json()
+        return self.decoder.decode(response, GetAccountsResponseDict)
+
+    def get_accounts_many(
+            self,
+            user_ids: Iterable[str],
+            concurrency: int = DEFAULT_FANOUT_CONCURRENCY,
+            ordered: bool = True
+    ) -> Iterator[FanoutResult[GetAccountsResponseDict]]:
+        """
+        Получает счета пользователя для каждого из user_ids, выполняя запросы в concurrency потоках.
+        Ответ с кодом ошибки возвращается как FanoutResult.error и не останавливает пакет.
+
+        :param user_ids: Идентификаторы, например из хранилища тестовых данных.
+        :param concurrency: Максимальное количество одновременных запросов.
+        :param ordered: Возвращать результаты в порядке идентификаторов или по мере завершения.
+        :return: Итератор FanoutResult с ключом-идентификатором.
+        """
+        def call(user_id: str) -> GetAccountsResponseDict:
+            response = self.get_accounts_api(GetAccountsQueryDict(userId=user_id))
+            response.raise_for_status()
+            return self.decoder.decode(response, GetAccountsResponseDict)
+
+        return fan_out_threads(call, user_ids, concurrency, ordered)
 
     def open_deposit_account(self, user_id: str) -> OpenDepositAccountResponseDict:
-        request = OpenDepositAccountRequestDict(userId=user_id)
-        response = self.open_deposit_account_api(request)
-        return response.json()
+        response = self.open_deposit_account_api(OPEN_ACCOUNT_BODY.render(user_id))
+        return self.decoder.decode(response, OpenDepositAccountResponseDict)
 
     def open_savings_account(self, user_id: str) -> OpenSavingsAccountResponseDict:
-        request = OpenSavingsAccountRequestDict(userId=user_id)
-        response = self.open_savings_account_api(request)
-        return response.json()
+        response = self.open_savings_account_api(OPEN_ACCOUNT_BODY.render(user_id))
+        return self.decoder.decode(response, OpenSavingsAccountResponseDict)
 
     def open_debit_card_account(self, user_id: str) -> OpenDebitCardAccountResponseDict:
-        request = OpenDebitCardAccountRequestDict(userId=user_id)
-        response = self.open_debit_card_account_api(request)
-        return response.json()
+        response = self.open_debit_card_account_api(OPEN_ACCOUNT_BODY.render(user_id))
+        return self.decoder.decode(response, OpenDebitCardAccountResponseDict)
 
     def open_credit_card_account(self, user_id: str) -> OpenCreditCardAccountResponseDict:
-        request = OpenCreditCardAccountRequestDict(userId=user_id)
-        response = self.open_credit_card_account_api(request)
-        return response.json()
+        response = self.open_credit_card_account_api(OPEN_ACCOUNT_BODY.render(user_id))
+        return self.decoder.decode(response, OpenCreditCardAccountResponseDict)
 
 
-def build_accounts_gateway_http_client() -> AccountsGatewayHTTPClient:
+class AccountsGatewayAsyncHTTPClient(AsyncHTTPClient):
+    """
+    Асинхронный клиент для взаимодействия с /api/v1/accounts сервиса http-gateway.
+    """
+
+    async def get_accounts_api(self, query: GetAccountsQueryDict):
+        """
+        Выполняет GET-запрос на получение списка счетов пользователя.
+
+        :param query: Словарь с параметрами запроса, например: {'userId': '123'}.
+        :return: Объект httpx.Response с данными о счетах.
+        """
+        return await self.get("/api/v1/accounts", params=QueryParams(**query))
+
+    async def open_deposit_account_api(self, request: OpenDepositAccountRequestDict | bytes) -> Response:
+        """
+        Выполняет POST-запрос для открытия депозитного счёта.
+
+        :param request: Словарь с userId или готовое JSON-тело.
+        :return: Объект httpx.Response с результатом операции.
+        """
+        return await self.post("/api/v1/accounts/open-deposit-account", json=request)
+
+    async def open_savings_account_api(self, request: OpenSavingsAccountRequestDict | bytes) -> Response:
+        """
+        Выполняет POST-запрос для открытия сберегательного счёта.
+
+        :param request: Словарь с userId или готовое JSON-тело.
+        :return: Объект httpx.Response.
+        """
+        return await self.post("/api/v1/accounts/open-savings-account", json=request)
+
+    async def open_debit_card_account_api(self, request: OpenDebitCardAccountRequestDict | bytes) -> Response:
+        """
+        Выполняет POST-запрос для открытия дебетовой карты.
+
+        :param request: Словарь с userId или готовое JSON-тело.
+        :return: Объект httpx.Response.
+        """
+        return await self.post("/api/v1/accounts/open-debit-card-account", json=request)
+
+    async def open_credit_card_account_api(self, request: OpenCreditCardAccountRequestDict | bytes) -> Response:
+        """
+        Выполняет POST-запрос для открытия кредитной карты.
+
+        :param request: Словарь с userId или готовое JSON-тело.
+        :return: Объект httpx.Response.
+        """
+        return await self.post("/api/v1/accounts/open-credit-card-account", json=request)
+
+    async def get_accounts(self, user_id: str) -> GetAccountsResponseDict:
+        query = GetAccountsQueryDict(userId=user_id)
+        response = await self.get_accounts_api(query)
+        return self.decoder.decode(response, GetAccountsResponseDict)
+
+    def get_accounts_many(
+            self,
+            user_ids: Iterable[str],
+            concurrency: int = DEFAULT_FANOUT_CONCURRENCY,
+            ordered: bool = True
+    ) -> AsyncIterator[FanoutResult[GetAccountsResponseDict]]:
+        """
+        Получает счета пользователя для каждого из user_ids, выполняя до concurrency запросов одновременно.
+        Ответ с кодом ошибки возвращается как FanoutResult.error и не останавливает пакет.
+
+        :param user_ids: Идентификаторы, например из хранилища тестовых данных.
+        :param concurrency: Максимальное количество одновременных запросов.
+        :param ordered: Возвращать результаты в порядке идентификаторов или по мере завершения.
+        :return: Асинхронный итератор FanoutResult с ключом-идентификатором.
+        """
+        async def call(user_id: str) -> GetAccountsResponseDict:
+            response = await self.get_accounts_api(GetAccountsQueryDict(userId=user_id))
+            response.raise_for_status()
+            return self.decoder.decode(response, GetAccountsResponseDict)
+
+        return fan_out(call, user_ids, concurrency, ordered)
+
+    async def open_deposit_account(self, user_id: str) -> OpenDepositAccountResponseDict:
+        response = await self.open_deposit_account_api(OPEN_ACCOUNT_BODY.render(user_id))
+        return self.decoder.decode(response, OpenDepositAccountResponseDict)
+
+    async def open_savings_account(self, user_id: str) -> OpenSavingsAccountResponseDict:
+        response = await self.open_savings_account_api(OPEN_ACCOUNT_BODY.render(user_id))
+        return self.decoder.decode(response, OpenSavingsAccountResponseDict)
+
+    async def open_debit_card_account(self, user_id: str) -> OpenDebitCardAccountResponseDict:
+        response = await self.open_debit_card_account_api(OPEN_ACCOUNT_BODY.render(user_id))
+        return self.decoder.decode(response, OpenDebitCardAccountResponseDict)
+
+    async def open_credit_card_account(self, user_id: str) -> OpenCreditCardAccountResponseDict:
+        response = await self.open_credit_card_account_api(OPEN_ACCOUNT_BODY.render(user_id))
+        return self.decoder.decode(response, OpenCreditCardAccountResponseDict)
+
+
+def build_accounts_gateway_http_client(
+        config: GatewayHTTPPoolConfig = DEFAULT_GATEWAY_HTTP_POOL_CONFIG,
+        recorder: MetricsRecorder | None = None,
+        decoder: ResponseDecoder | None = None
+) -> AccountsGatewayHTTPClient:
     """
     Функция создаёт экземпляр AccountsGatewayHTTPClient с уже настроенным HTTP-клиентом.
 
+    :param config: Настройки общего пула соединений.
+    :param recorder: Хранилище метрик запросов (по умолчанию метрики не собираются).
+    :param decoder: Разбор и проверка тел ответов (по умолчанию без проверки по схеме).
     :return: Готовый к использованию AccountsGatewayHTTPClient.
     """
-    return AccountsGatewayHTTPClient(client=build_gateway_http_client())
+    return AccountsGatewayHTTPClient(
+        client=build_gateway_http_client(config),
+        recorder=recorder,
+        decoder=decoder
+    )
+
+
+def build_accounts_gateway_async_http_client(
+        config: GatewayHTTPPoolConfig = DEFAULT_GATEWAY_HTTP_POOL_CONFIG,
+        recorder: MetricsRecorder | None = None,
+        decoder: ResponseDecoder | None = None
+) -> AccountsGatewayAsyncHTTPClient:
+    """
+    Функция создаёт экземпляр AccountsGatewayAsyncHTTPClient с уже настроенным асинхронным HTTP-клиентом.
+
+    :param config: Настройки общего пула соединений.
+    :param recorder: Хранилище метрик запросов (по умолчанию метрики не собираются).
+    :param decoder: Разбор и проверка тел ответов (по умолчанию без проверки по схеме).
+    :return: Готовый к использованию AccountsGatewayAsyncHTTPClient.
+    """
+    return AccountsGatewayAsyncHTTPClient(
+        client=build_gateway_async_http_client(config),
+        recorder=recorder,
+        decoder=decoder
+    )
@@ -1,9 +1,17 @@
-from typing import TypedDict
+from typing_extensions import TypedDict
 
 from httpx import Response
 
-from clients.http.client import HTTPClient
-from clients.http.gateway.client import build_gateway_http_client
+from clients.http.client import HTTPClient, AsyncHTTPClient
+from clients.http.decoding import ResponseDecoder
+from clients.http.encoding import BodyTemplate, VARIABLE
+from clients.http.gateway.client import (
+    build_gateway_http_client,
+    build_gateway_async_http_client,
+    GatewayHTTPPoolConfig,
+    DEFAULT_GATEWAY_HTTP_POOL_CONFIG
+)
+from metrics.recorder import MetricsRecorder
 
 
 class CardDict(TypedDict):
@@ -52,44 +60,108 @@ class IssuePhysicalCardResponseDict(TypedDict):
     card: CardDict
 
 
+ISSUE_CARD_BODY = BodyTemplate({"userId": VARIABLE, "accountId": VARIABLE})
+
+
 class CardsGatewayHTTPClient(HTTPClient):
     """
     Клиент для взаимодействия с /api/v1/cards сервиса http-gateway.
     """
 
-    def issue_virtual_card_api(self, request: IssueVirtualCardRequestDict) -> Response:
+    def issue_virtual_card_api(self, request: IssueVirtualCardRequestDict | bytes) -> Response:
         """
         Выпуск виртуальной карты.
 
-        :param request: Словарь с данными для выпуска виртуальной карты.
+        :param request: Словарь с данными для выпуска виртуальной карты или готовое JSON-тело.
         :return: Ответ от сервера (объект httpx.Response).
         """
         return self.post("/api/v1/cards/issue-virtual-card", json=request)
 
-    def issue_physical_card_api(self, request: IssuePhysicalCardRequestDict) -> Response:
+    def issue_physical_card_api(self, request: IssuePhysicalCardRequestDict | bytes) -> Response:
         """
         Выпуск физической карты.
 
-        :param request: Словарь с данными для выпуска физической карты.
+        :param request: Словарь с данными для выпуска физической карты или готовое JSON-тело.
         :return: Ответ от сервера (объект httpx.Response).
         """
         return self.post("/api/v1/cards/issue-physical-card", json=request)
 
     def issue_virtual_card(self, user_id: str, account_id: str) -> IssueVirtualCardResponseDict:
-        request = IssueVirtualCardRequestDict(userId=user_id, accountId=account_id)
-        response = self.issue_virtual_card_api(request)
-        return response.json()
+        response = self.issue_virtual_card_api(ISSUE_CARD_BODY.render(user_id, account_id))
+        return self.decoder.decode(response, IssueVirtualCardResponseDict)
 
     def issue_physical_card(self, user_id: str, account_id: str) -> IssuePhysicalCardResponseDict:
-        request = IssuePhysicalCardRequestDict(userId=user_id, accountId=account_id)
-        response = self.issue_physical_card_api(request)
-        return response.json()
+        response = self.issue_physical_card_api(ISSUE_CARD_BODY.render(user_id, account_id))
+        return self.decoder.decode(response, IssuePhysicalCardResponseDict)
 
 
-def build_cards_gateway_http_client() -> CardsGatewayHTTPClient:
+class CardsGatewayAsyncHTTPClient(AsyncHTTPClient):
+    """
+    Асинхронный клиент для взаимодействия с /api/v1/cards сервиса http-gateway.
+    """
+
+    async def issue_virtual_card_api(self, request: IssueVirtualCardRequestDict | bytes) -> Response:
+        """
+        Выпуск виртуальной карты.
+
+        :param request: Словарь с данными для выпуска виртуальной карты или готовое JSON-тело.
+        :return: Ответ от сервера (объект httpx.Response).
+        """
+        return await self.post("/api/v1/cards/issue-virtual-card", json=request)
+
+    async def issue_physical_card_api(self, request: IssuePhysicalCardRequestDict | bytes) -> Response:
+        """
+        Выпуск физической карты.
+
+        :param request: Словарь с данными для выпуска физической карты или готовое JSON-тело.
+        :return: Ответ от сервера (объект httpx.Response).
+        """
+        return await self.post("/api/v1/cards/issue-physical-card", json=request)
+
+    async def issue_virtual_card(self, user_id: str, account_id: str) -> IssueVirtualCardResponseDict:
+        response = await self.issue_virtual_card_api(ISSUE_CARD_BODY.render(user_id, account_id))
+        return self.decoder.decode(response, IssueVirtualCardResponseDict)
+
+    async def issue_physical_card(self, user_id: str, account_id: str) -> IssuePhysicalCardResponseDict:
+        response = await self.issue_physical_card_api(ISSUE_CARD_BODY.render(user_id, account_id))
+        return self.decoder.decode(response, IssuePhysicalCardResponseDict)
+
+
+def build_cards_gateway_http_client(
+        config: GatewayHTTPPoolConfig = DEFAULT_GATEWAY_HTTP_POOL_CONFIG,
+        recorder: MetricsRecorder | None = None,
+        decoder: ResponseDecoder | None = None
+) -> CardsGatewayHTTPClient:
     """
     Функция создаёт экземпляр CardsGatewayHTTPClient с уже настроенным HTTP-клиентом.
 
+    :param config: Настройки общего пула соединений.
+    :param recorder: Хранилище метрик запросов (по умолчанию метрики не собираются).
+    :param decoder: Разбор и проверка тел ответов (по умолчанию без проверки по схеме).
     :return: Готовый к использованию CardsGatewayHTTPClient.
     """
-    return CardsGatewayHTTPClient(client=build_gateway_http_client())
+    return CardsGatewayHTTPClient(
+        client=build_gateway_http_client(config),
+        recorder=recorder,
+        decoder=decoder
+    )
+
+
+def build_cards_gateway_async_http_client(
+        config: GatewayHTTPPoolConfig = DEFAULT_GATEWAY_HTTP_POOL_CONFIG,
+        recorder: MetricsRecorder | None = None,
+        decoder: ResponseDecoder | None = None
+) -> CardsGatewayAsyncHTTPClient:
+    """
+    Функция создаёт экземпляр CardsGatewayAsyncHTTPClient с уже настроенным асинхронным HTTP-клиентом.
+
+    :param config: Настройки общего пула соединений.
+    :param recorder: Хранилище метрик запросов (по умолчанию метрики не собираются).
+    :param decoder: Разбор и проверка тел ответов (по умолчанию без проверки по схеме).
+    :return: Готовый к использованию CardsGatewayAsyncHTTPClient.
+    """
+    return CardsGatewayAsyncHTTPClient(
+        client=build_gateway_async_http_client(config),
+        recorder=recorder,
+        decoder=decoder
+    )
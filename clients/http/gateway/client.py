@@ -1,10 +1,297 @@
-from httpx import Client
+import asyncio
+from dataclasses import dataclass
+from weakref import WeakKeyDictionary
 
+from httpx import (
+    Client,
+    AsyncClient,
+    HTTPTransport,
+    AsyncHTTPTransport,
+    AsyncBaseTransport,
+    Limits,
+    Timeout,
+    Request,
+    Response
+)
 
-def build_gateway_http_client() -> Client:
+
+@dataclass(frozen=True)
+class GatewayHTTPPoolConfig:
+    """
+    Настройки общего пула соединений с сервисом http-gateway.
+
+    :param base_url: Базовый адрес сервиса.
+    :param max_connections: Максимальное количество соединений в пуле.
+    :param max_keepalive_connections: Сколько простаивающих соединений держать открытыми.
+    :param keepalive_expiry: Через сколько секунд простоя соединение закрывается.
+    :param http2: Использовать HTTP/2 (требует установленного пакета h2).
+    :param connect_timeout: Таймаут установки соединения.
+    :param read_timeout: Таймаут чтения ответа.
+    :param write_timeout: Таймаут отправки запроса.
+    :param pool_timeout: Таймаут ожидания свободного соединения из пула.
+    :param warm_connections: Сколько соединений открыть заранее: синхронный пул прогревается при создании,
+        асинхронный — при первом запросе в каждом event loop.
+    :param warm_up_path: Эндпоинт, на который отправляются прогревочные запросы.
+    """
+    base_url: str = "http://localhost:8003"
+    max_connections: int = 100
+    max_keepalive_connections: int = 100
+    keepalive_expiry: float = 30
+    http2: bool = False
+    connect_timeout: float = 100
+    read_timeout: float = 100
+    write_timeout: float = 100
+    pool_timeout: float = 100
+    warm_connections: int = 0
+    warm_up_path: str = "/"
+
+    @property
+    def limits(self) -> Limits:
+        return Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry
+        )
+
+    @property
+    def timeout(self) -> Timeout:
+        return Timeout(
+            connect=self.connect_timeout,
+            read=self.read_timeout,
+            write=self.write_timeout,
+            pool=self.pool_timeout
+        )
+
+
+DEFAULT_GATEWAY_HTTP_POOL_CONFIG = GatewayHTTPPoolConfig()
+
+
+class SharedHTTPTransport(HTTPTransport):
+    """
+    Транспорт с пулом соединений, общий для всех синхронных клиентов http-gateway.
+
+    Закрытие отдельного httpx.Client не закрывает общий пул,
+    для этого используется close_gateway_http_transports().
+    """
+
+    def __exit__(self, *args) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+    def close_pool(self) -> None:
+        super().close()
+
+
+class SharedAsyncHTTPTransport(AsyncBaseTransport):
+    """
+    Транспорт с пулом соединений, общий для всех асинхронных клиентов http-gateway.
+
+    Соединения asyncio привязаны к event loop, поэтому для каждого запущенного loop
+    создаётся свой пул: клиенты, созданные заранее, продолжают работать и после нового asyncio.run().
+    Если задан warm_up с warm_connections, пул каждого loop прогревается при первом запросе:
+    остальные запросы этого loop ждут окончания прогрева, а неудачный прогрев не сохраняет пул.
+
+    :param limits: Ограничения пула соединений.
+    :param http2: Использовать HTTP/2.
+    :param warm_up: Настройки прогрева (warm_connections, warm_up_path, base_url и таймауты).
+    """
+
+    def __init__(self, limits: Limits, http2: bool = False, warm_up: GatewayHTTPPoolConfig | None = None) -> None:
+        self.limits = limits
+        self.http2 = http2
+        self.warm_up = warm_up
+        self._pools: WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncHTTPTransport] = WeakKeyDictionary()
+        self._warming: WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Event] = WeakKeyDictionary()
+
+    async def handle_async_request(self, request: Request) -> Response:
+        loop = asyncio.get_running_loop()
+        while (warming := self._warming.get(loop)) is not None:
+            await warming.wait()
+        pool = self._pools.get(loop)
+        if pool is None:
+            pool = self._pools[loop] = AsyncHTTPTransport(limits=self.limits, http2=self.http2)
+            if self.warm_up is not None and self.warm_up.warm_connections > 0:
+                await self._warm_up_pool(loop, pool)
+        return await pool.handle_async_request(request)
+
+    async def _warm_up_pool(self, loop: asyncio.AbstractEventLoop, pool: AsyncHTTPTransport) -> None:
+        config = self.warm_up
+        warming = self._warming[loop] = asyncio.Event()
+        try:
+            # Клиент не закрывается: его закрытие закрыло бы и сам пул
+            client = AsyncClient(transport=pool, timeout=config.timeout, base_url=config.base_url)
+            await warm_up_gateway_async_http_client(
+                client,
+                connections=min(config.warm_connections, config.max_connections),
+                path=config.warm_up_path
+            )
+        except BaseException:
+            del self._pools[loop]
+            await pool.aclose()
+            raise
+        finally:
+            del self._warming[loop]
+            warming.set()
+
+    async def aclose(self) -> None:
+        pass
+
+    async def aclose_pool(self) -> bool:
+        """
+        Закрывает пул текущего event loop.
+
+        Пулы других запущенных loop закрыть отсюда нельзя: их соединения привязаны к своему loop.
+        Пулы уже закрытых loop просто забываются, их сокеты закрыты вместе с loop.
+
+        :return: Закрыты ли все пулы транспорта.
+        """
+        pool = self._pools.pop(asyncio.get_running_loop(), None)
+        if pool is not None:
+            await pool.aclose()
+        for loop in [loop for loop in self._pools if loop.is_closed()]:
+            del self._pools[loop]
+        return not self._pools
+
+
+def warm_up_gateway_http_client(client: Client, connections: int, path: str = "/") -> None:
+    """
+    Заранее открывает connections соединений в пуле клиента.
+
+    Каждый прогревочный запрос удерживает своё соединение до тех пор, пока не будут отправлены все остальные,
+    поэтому пул открывает новые соединения, а не переиспользует одно и то же.
+
+    :param client: Клиент, пул которого нужно прогреть.
+    :param connections: Количество соединений.
+    :param path: Эндпоинт для прогревочных запросов.
+    """
+    responses = []
+    try:
+        for _ in range(connections):
+            responses.append(client.send(client.build_request("GET", path), stream=True))
+    finally:
+        for response in responses:
+            response.read()
+            response.close()
+
+
+async def warm_up_gateway_async_http_client(client: AsyncClient, connections: int, path: str = "/") -> None:
+    """
+    Асинхронный вариант warm_up_gateway_http_client.
+
+    :param client: Клиент, пул которого нужно прогреть.
+    :param connections: Количество соединений.
+    :param path: Эндпоинт для прогревочных запросов.
+    """
+    responses = []
+    try:
+        for _ in range(connections):
+            responses.append(await client.send(client.build_request("GET", path), stream=True))
+    finally:
+        for response in responses:
+            await response.aread()
+            await response.aclose()
+
+
+_transports: dict[GatewayHTTPPoolConfig, SharedHTTPTransport] = {}
+_async_transports: dict[GatewayHTTPPoolConfig, SharedAsyncHTTPTransport] = {}
+
+
+def get_gateway_http_transport(config: GatewayHTTPPoolConfig = DEFAULT_GATEWAY_HTTP_POOL_CONFIG) -> SharedHTTPTransport:
+    """
+    Возвращает общий транспорт для указанных настроек, при первом вызове создаёт и прогревает его.
+
+    :param config: Настройки пула соединений.
+    :return: Общий для всех клиентов SharedHTTPTransport.
+    """
+    transport = _transports.get(config)
+    if transport is None:
+        transport = SharedHTTPTransport(limits=config.limits, http2=config.http2)
+        if config.warm_connections > 0:
+            # Пул сохраняется только после успешного прогрева, иначе следующий вызов получил бы непрогретый пул
+            try:
+                with Client(transport=transport, timeout=config.timeout, base_url=config.base_url) as client:
+                    warm_up_gateway_http_client(
+                        client,
+                        connections=min(config.warm_connections, config.max_connections),
+                        path=config.warm_up_path
+                    )
+            except Exception:
+                transport.close_pool()
+                raise
+        _transports[config] = transport
+    return transport
+
+
+def get_gateway_async_http_transport(
+        config: GatewayHTTPPoolConfig = DEFAULT_GATEWAY_HTTP_POOL_CONFIG
+) -> SharedAsyncHTTPTransport:
+    """
+    Возвращает общий асинхронный транспорт для указанных настроек.
+
+    Прогрев требует запущенного event loop, поэтому пул каждого loop прогревается
+    на config.warm_connections соединений при первом запросе (см. SharedAsyncHTTPTransport).
+
+    :param config: Настройки пула соединений.
+    :return: Общий для всех асинхронных клиентов SharedAsyncHTTPTransport.
+    """
+    transport = _async_transports.get(config)
+    if transport is None:
+        transport = _async_transports[config] = SharedAsyncHTTPTransport(
+            limits=config.limits, http2=config.http2, warm_up=config
+        )
+    return transport
+
+
+def close_gateway_http_transports() -> None:
+    """
+    Закрывает все общие синхронные пулы соединений.
+    """
+    while _transports:
+        _, transport = _transports.popitem()
+        transport.close_pool()
+
+
+async def aclose_gateway_http_transports() -> None:
+    """
+    Закрывает все общие асинхронные пулы соединений текущего event loop.
+
+    Транспорты, у которых остались пулы других запущенных loop, сохраняются:
+    их нужно закрыть этой же функцией из соответствующего loop.
+    """
+    for config, transport in list(_async_transports.items()):
+        if await transport.aclose_pool():
+            del _async_transports[config]
+
+
+def build_gateway_http_client(config: GatewayHTTPPoolConfig = DEFAULT_GATEWAY_HTTP_POOL_CONFIG) -> Client:
     """
     Функция создаёт экземпляр httpx.Client с базовыми настройками для сервиса http-gateway.
 
+    Все клиенты с одинаковыми настройками используют общий пул соединений.
+
+    :param config: Настройки пула соединений.
     :return: Готовый к использованию объект httpx.Client.
     """
-    return Client(timeout=100, base_url="http://localhost:8003")
+    return Client(
+        timeout=config.timeout,
+        base_url=config.base_url,
+        transport=get_gateway_http_transport(config)
+    )
+
+
+def build_gateway_async_http_client(config: GatewayHTTPPoolConfig = DEFAULT_GATEWAY_HTTP_POOL_CONFIG) -> AsyncClient:
+    """
+    Функция создаёт экземпляр httpx.AsyncClient с базовыми настройками для сервиса http-gateway.
+
+    Все клиенты с одинаковыми настройками используют общий пул соединений.
+
+    :param config: Настройки пула соединений.
+    :return: Готовый к использованию объект httpx.AsyncClient.
+    """
+    return AsyncClient(
+        timeout=config.timeout,
+        base_url=config.base_url,
+        transport=get_gateway_async_http_transport(config)
+    )
@@ -1,7 +1,14 @@
 from httpx import Response
-from clients.http.client import HTTPClient
-from clients.http.gateway.client import build_gateway_http_client
-from typing import TypedDict
+from clients.http.client import HTTPClient, AsyncHTTPClient
+from clients.http.decoding import ResponseDecoder
+from clients.http.gateway.client import (
+    build_gateway_http_client,
+    build_gateway_async_http_client,
+    GatewayHTTPPoolConfig,
+    DEFAULT_GATEWAY_HTTP_POOL_CONFIG
+)
+from metrics.recorder import MetricsRecorder
+from typing_extensions import TypedDict
 
 
 class DocumentDict(TypedDict):
@@ -23,7 +30,7 @@ class GetContractDocumentResponseDict(TypedDict):
     """
     Описание структуры ответа получения контракта по счету.
     """
-    tariff: DocumentDict
+    contract: DocumentDict
 
 
 class DocumentsGatewayHTTPClient(HTTPClient):
@@ -38,7 +45,10 @@ class DocumentsGatewayHTTPClient(HTTPClient):
         :param account_id: Идентификатор счета.
         :return: Ответ от сервера (объект httpx.Response).
         """
-        return self.get(f"/api/v1/documents/tariff-document/{account_id}")
+        return self.get(
+            f"/api/v1/documents/tariff-document/{account_id}",
+            route="/api/v1/documents/tariff-document/{account_id}"
+        )
 
     def get_contract_document_api(self, account_id: str) -> Response:
         """
@@ -47,21 +57,93 @@ class DocumentsGatewayHTTPClient(HTTPClient):
         :param account_id: Идентификатор счета.
         :return: Ответ от сервера (объект httpx.Response).
         """
-        return self.get(f"/api/v1/documents/contract-document/{account_id}")
+        return self.get(
+            f"/api/v1/documents/contract-document/{account_id}",
+            route="/api/v1/documents/contract-document/{account_id}"
+        )
 
     def get_tariff_document(self, account_id: str) -> GetTariffDocumentResponseDict:
         response = self.get_tariff_document_api(account_id=account_id)
-        return response.json()
+        return self.decoder.decode(response, GetTariffDocumentResponseDict)
 
     def get_contract_document(self, account_id: str) -> GetContractDocumentResponseDict:
         response = self.get_contract_document_api(account_id)
-        return response.json()
+        return self.decoder.decode(response, GetContractDocumentResponseDict)
+
+
+class DocumentsGatewayAsyncHTTPClient(AsyncHTTPClient):
+    """
+    Асинхронный клиент для взаимодействия с /api/v1/documents сервиса http-gateway.
+    """
+
+    async def get_tariff_document_api(self, account_id: str) -> Response:
+        """
+        Получить тарифа по счету.
+
+        :param account_id: Идентификатор счета.
+        :return: Ответ от сервера (объект httpx.Response).
+        """
+        return await self.get(
+            f"/api/v1/documents/tariff-document/{account_id}",
+            route="/api/v1/documents/tariff-document/{account_id}"
+        )
 
+    async def get_contract_document_api(self, account_id: str) -> Response:
+        """
+        Получить контракта по счету.
+
+        :param account_id: Идентификатор счета.
+        :return: Ответ от сервера (объект httpx.Response).
+        """
+        return await self.get(
+            f"/api/v1/documents/contract-document/{account_id}",
+            route="/api/v1/documents/contract-document/{account_id}"
+        )
 
-def build_documents_gateway_http_client() -> DocumentsGatewayHTTPClient:
+    async def get_tariff_document(self, account_id: str) -> GetTariffDocumentResponseDict:
+        response = await self.get_tariff_document_api(account_id=account_id)
+        return self.decoder.decode(response, GetTariffDocumentResponseDict)
+
+    async def get_contract_document(self, account_id: str) -> GetContractDocumentResponseDict:
+        response = await self.get_contract_document_api(account_id)
+        return self.decoder.decode(response, GetContractDocumentResponseDict)
+
+
+def build_documents_gateway_http_client(
+        config: GatewayHTTPPoolConfig = DEFAULT_GATEWAY_HTTP_POOL_CONFIG,
+        recorder: MetricsRecorder | None = None,
+        decoder: ResponseDecoder | None = None
+) -> DocumentsGatewayHTTPClient:
     """
     Функция создаёт экземпляр DocumentsGatewayHTTPClient с уже настроенным HTTP-клиентом.
 
+    :param config: Настройки общего пула соединений.
+    :param recorder: Хранилище метрик запросов (по умолчанию метрики не собираются).
+    :param decoder: Разбор и проверка тел ответов (по умолчанию без проверки по схеме).
     :return: Готовый к использованию DocumentsGatewayHTTPClient.
     """
-    return DocumentsGatewayHTTPClient(client=build_gateway_http_client())
+    return DocumentsGatewayHTTPClient(
+        client=build_gateway_http_client(config),
+        recorder=recorder,
+        decoder=decoder
+    )
+
+
+def build_documents_gateway_async_http_client(
+        config: GatewayHTTPPoolConfig = DEFAULT_GATEWAY_HTTP_POOL_CONFIG,
+        recorder: MetricsRecorder | None = None,
+        decoder: ResponseDecoder | None = None
+) -> DocumentsGatewayAsyncHTTPClient:
+    """
+    Функция создаёт экземпляр DocumentsGatewayAsyncHTTPClient с уже настроенным асинхронным HTTP-клиентом.
+
+    :param config: Настройки общего пула соединений.
+    :param recorder: Хранилище метрик запросов (по умолчанию метрики не собираются).
+    :param decoder: Разбор и проверка тел ответов (по умолчанию без проверки по схеме).
+    :return: Готовый к использованию DocumentsGatewayAsyncHTTPClient.
+    """
+    return DocumentsGatewayAsyncHTTPClient(
+        client=build_gateway_async_http_client(config),
+        recorder=recorder,
+        decoder=decoder
+    )
@@ -1,7 +1,19 @@
-from typing import TypedDict
+from typing import AsyncIterator, Iterable, Iterator
+
+from typing_extensions import TypedDict
 from httpx import Response, QueryParams
-from clients.http.client import HTTPClient
-from clients.http.gateway.client import build_gateway_http_client
+from clients.http.client import HTTPClient, AsyncHTTPClient
+from clients.http.decoding import ResponseDecoder
+from clients.http.encoding import BodyTemplate, VARIABLE
+from clients.http.fanout import FanoutResult, fan_out, fan_out_threads, DEFAULT_FANOUT_CONCURRENCY
+from clients.http.streaming import iter_json_array, aiter_json_array
+from clients.http.gateway.client import (
+    build_gateway_http_client,
+    build_gateway_async_http_client,
+    GatewayHTTPPoolConfig,
+    DEFAULT_GATEWAY_HTTP_POOL_CONFIG
+)
+from metrics.recorder import MetricsRecorder
 
 
 class OperationDict(TypedDict):
@@ -22,9 +34,9 @@ class OperationsSummaryDict(TypedDict):
     """
     Описание структуры статистики по операциям.
     """
-    spentAmount: int
-    receivedAmount: int
-    cashbackAmount: int
+    spentAmount: float
+    receivedAmount: float
+    cashbackAmount: float
 
 
 class OperationsReceiptDict(TypedDict):
@@ -178,6 +190,12 @@ class MakeCashWithdrawalOperationResponseDict(MakeOperationResponseDict):
     """
 
 
+MAKE_OPERATION_BODY = BodyTemplate({"status": "COMPLETED", "amount": 55.77, "cardId": VARIABLE, "accountId": VARIABLE})
+MAKE_PURCHASE_OPERATION_BODY = BodyTemplate(
+    {"status": "COMPLETED", "amount": 55.77, "cardId": VARIABLE, "accountId": VARIABLE, "category": "string"}
+)
+
+
 class OperationsGatewayHTTPClient(HTTPClient):
     """
     Клиент для взаимодействия с /api/v1/operations сервиса http-operations.
@@ -190,7 +208,10 @@ class OperationsGatewayHTTPClient(HTTPClient):
         :param operation_id: ID операции
         :return: Объект httpx.Response с информацией об операции.
         """
-        return self.get(f"/api/v1/operations/{operation_id}")
+        return self.get(
+            f"/api/v1/operations/{operation_id}",
+            route="/api/v1/operations/{operation_id}"
+        )
 
     def get_operations_receipt_api(self, operation_id: str) -> Response:
         """
@@ -199,7 +220,10 @@ class OperationsGatewayHTTPClient(HTTPClient):
         :param operation_id: ID операции
         :return: Объект httpx.Response с информацией о чеке по операции.
         """
-        return self.get(f"/api/v1/operations/operation-receipt/{operation_id}")
+        return self.get(
+            f"/api/v1/operations/operation-receipt/{operation_id}",
+            route="/api/v1/operations/operation-receipt/{operation_id}"
+        )
 
     def get_operations_api(self, query: GetOperationsQueryDict) -> Response:
         """
@@ -219,163 +243,506 @@ class OperationsGatewayHTTPClient(HTTPClient):
         """
         return self.get("/api/v1/operations/operations-summary", params=QueryParams(**query))
 
-    def make_fee_operation_api(self, request: MakeFeeOperationRequestDict) -> Response:
+    def make_fee_operation_api(self, request: MakeFeeOperationRequestDict | bytes) -> Response:
         """
         Выполняет POST-запрос для создания операции комиссии.
 
-        :param request: Словарь со status, amount, cardId и accountId
+        :param request: Словарь со status, amount, cardId и accountId или готовое JSON-тело.
         :return: Объект httpx.Response с результатом по созданию операции комиссии.
         """
         return self.post("/api/v1/operations/make-fee-operation", json=request)
 
-    def make_top_up_operation_api(self, request: MakeTopUpOperationRequestDict) -> Response:
+    def make_top_up_operation_api(self, request: MakeTopUpOperationRequestDict | bytes) -> Response:
         """
         Выполняет POST-запрос для создания операции пополнения.
 
-        :param request: Словарь со status, amount, cardId и accountId
+        :param request: Словарь со status, amount, cardId и accountId или готовое JSON-тело.
         :return: Объект httpx.Response с результатом по созданию операции пополнения.
         """
         return self.post("/api/v1/operations/make-top-up-operation", json=request)
 
-    def make_cashback_operation_api(self, request: MakeCashbackOperationRequestDict) -> Response:
+    def make_cashback_operation_api(self, request: MakeCashbackOperationRequestDict | bytes) -> Response:
         """
         Выполняет POST-запрос для создания операции кэшбэка.
 
-        :param request: Словарь со status, amount, cardId и accountId
+        :param request: Словарь со status, amount, cardId и accountId или готовое JSON-тело.
         :return: Объект httpx.Response с результатом по созданию операции кэшбэка.
         """
         return self.post("/api/v1/operations/make-cashback-operation", json=request)
 
-    def make_transfer_operation_api(self, request: MakeTransferOperationRequestDict) -> Response:
+    def make_transfer_operation_api(self, request: MakeTransferOperationRequestDict | bytes) -> Response:
         """
         Выполняет POST-запрос для создания операции перевода.
 
-        :param request: Словарь со status, amount, cardId и accountId
+        :param request: Словарь со status, amount, cardId и accountId или готовое JSON-тело.
         :return: Объект httpx.Response с результатом по созданию операции перевода.
         """
         return self.post("/api/v1/operations/make-transfer-operation", json=request)
 
-    def make_purchase_operation_api(self, request: MakePurchaseOperationRequestDict) -> Response:
+    def make_purchase_operation_api(self, request: MakePurchaseOperationRequestDict | bytes) -> Response:
         """
         Выполняет POST-запрос для создания операции покупки.
 
-        :param request: Словарь со status, amount, cardId, accountId и category
+        :param request: Словарь со status, amount, cardId, accountId и category или готовое JSON-тело.
         :return: Объект httpx.Response с результатом по созданию операции покупки.
         """
         return self.post("/api/v1/operations/make-purchase-operation", json=request)
 
-    def make_bill_payment_operation_api(self, request: MakeBillPaymentOperationRequestDict) -> Response:
+    def make_bill_payment_operation_api(self, request: MakeBillPaymentOperationRequestDict | bytes) -> Response:
         """
         Выполняет POST-запрос для создания операции оплаты по счету.
 
-        :param request: Словарь со status, amount, cardId и accountId
+        :param request: Словарь со status, amount, cardId и accountId или готовое JSON-тело.
         :return: Объект httpx.Response с результатом по созданию операции оплаты по счету.
         """
         return self.post("/api/v1/operations/make-bill-payment-operation", json=request)
 
-    def make_cash_withdrawal_operation_api(self, request: MakeCashWithdrawalOperationRequestDict) -> Response:
+    def make_cash_withdrawal_operation_api(self, request: MakeCashWithdrawalOperationRequestDict | bytes) -> Response:
         """
         Выполняет POST-запрос для создания операции снятия наличных денег.
 
-        :param request: Словарь со status, amount, cardId и accountId
+        :param request: Словарь со status, amount, cardId и accountId или готовое JSON-тело.
         :return: Объект httpx.Response с результатом по созданию операции снятия наличных денег.
         """
         return self.post("/api/v1/operations/make-cash-withdrawal-operation", json=request)
 
     def get_operation(self, operation_id: str) -> GetOperationResponseDict:
         response = self.get_operation_api(operation_id=operation_id)
-        return response.json()
+        return self.decoder.decode(response, GetOperationResponseDict)
+
+    def get_operation_many(
+            self,
+            operation_ids: Iterable[str],
+            concurrency: int = DEFAULT_FANOUT_CONCURRENCY,
+            ordered: bool = True
+    ) -> Iterator[FanoutResult[GetOperationResponseDict]]:
+        """
+        Получает операцию для каждого из operation_ids, выполняя запросы в concurrency потоках.
+        Ответ с кодом ошибки возвращается как FanoutResult.error и не останавливает пакет.
+
+        :param operation_ids: Идентификаторы, например из хранилища тестовых данных.
+        :param concurrency: Максимальное количество одновременных запросов.
+        :param ordered: Возвращать результаты в порядке идентификаторов или по мере завершения.
+        :return: Итератор FanoutResult с ключом-идентификатором.
+        """
+        def call(operation_id: str) -> GetOperationResponseDict:
+            response = self.get_operation_api(operation_id=operation_id)
+            response.raise_for_status()
+            return self.decoder.decode(response, GetOperationResponseDict)
+
+        return fan_out_threads(call, operation_ids, concurrency, ordered)
 
     def get_operation_receipt(self, operation_id: str) -> GetOperationsReceiptResponseDict:
         response = self.get_operations_receipt_api(operation_id=operation_id)
-        return response.json()
+        return self.decoder.decode(response, GetOperationsReceiptResponseDict)
 
     def get_operations(self, account_id: str) -> GetOperationsResponseDict:
         query = GetOperationsQueryDict(accountId=account_id)
         response = self.get_operations_api(query)
-        return response.json()
+        return self.decoder.decode(response, GetOperationsResponseDict)
+
+    def get_operations_many(
+            self,
+            account_ids: Iterable[str],
+            concurrency: int = DEFAULT_FANOUT_CONCURRENCY,
+            ordered: bool = True
+    ) -> Iterator[FanoutResult[GetOperationsResponseDict]]:
+        """
+        Получает список операций счёта для каждого из account_ids, выполняя запросы в concurrency потоках.
+        Ответ с кодом ошибки возвращается как FanoutResult.error и не останавливает пакет.
+
+        :param account_ids: Идентификаторы, например из хранилища тестовых данных.
+        :param concurrency: Максимальное количество одновременных запросов.
+        :param ordered: Возвращать результаты в порядке идентификаторов или по мере завершения.
+        :return: Итератор FanoutResult с ключом-идентификатором.
+        """
+        def call(account_id: str) -> GetOperationsResponseDict:
+            response = self.get_operations_api(GetOperationsQueryDict(accountId=account_id))
+            response.raise_for_status()
+            return self.decoder.decode(response, GetOperationsResponseDict)
+
+        return fan_out_threads(call, account_ids, concurrency, ordered)
+
+    def iter_operations(self, account_id: str, chunk_size: int = 65_536) -> Iterator[OperationDict]:
+        """
+        Возвращает операции счёта по одной по мере чтения ответа get_operations_api,
+        не загружая весь список в память.
+
+        :param account_id: Идентификатор счёта.
+        :param chunk_size: Размер куска тела, читаемого из сети за раз.
+        :raises httpx.HTTPStatusError: Если http-gateway вернул ошибку.
+        """
+        query = GetOperationsQueryDict(accountId=account_id)
+        with self.stream("GET", "/api/v1/operations", params=QueryParams(**query)) as response:
+            if response.is_error:
+                response.read()
+                response.raise_for_status()
+            yield from iter_json_array(response.iter_bytes(chunk_size), "operations")
 
     def get_operations_summary(self, account_id: str) -> GetOperationsSummaryResponseDict:
         query = GetOperationsSummaryQueryDict(accountId=account_id)
         response = self.get_operations_api_summary(query)
-        return response.json()
+        return self.decoder.decode(response, GetOperationsSummaryResponseDict)
+
+    def get_operations_summary_many(
+            self,
+            account_ids: Iterable[str],
+            concurrency: int = DEFAULT_FANOUT_CONCURRENCY,
+            ordered: bool = True
+    ) -> Iterator[FanoutResult[GetOperationsSummaryResponseDict]]:
+        """
+        Получает статистику по операциям счёта для каждого из account_ids,
+        выполняя запросы в concurrency потоках.
+        Ответ с кодом ошибки возвращается как FanoutResult.error и не останавливает пакет.
+
+        :param account_ids: Идентификаторы, например из хранилища тестовых данных.
+        :param concurrency: Максимальное количество одновременных запросов.
+        :param ordered: Возвращать результаты в порядке идентификаторов или по мере завершения.
+        :return: Итератор FanoutResult с ключом-идентификатором.
+        """
+        def call(account_id: str) -> GetOperationsSummaryResponseDict:
+            response = self.get_operations_api_summary(GetOperationsSummaryQueryDict(accountId=account_id))
+            response.raise_for_status()
+            return self.decoder.decode(response, GetOperationsSummaryResponseDict)
+
+        return fan_out_threads(call, account_ids, concurrency, ordered)
 
     def make_fee_operation(self, card_id: str, account_id: str) -> MakeFeeOperationResponseDict:
-        request = MakeFeeOperationRequestDict(
-            status="COMPLETED",
-            amount=55.77,
-            cardId=card_id,
-            accountId=account_id
+        response = self.make_fee_operation_api(
+            MAKE_OPERATION_BODY.render(card_id, account_id)
         )
-        response = self.make_fee_operation_api(request)
-        return response.json()
+        return self.decoder.decode(response, MakeFeeOperationResponseDict)
 
     def make_top_up_operation(self, card_id: str, account_id: str) -> MakeTopUpOperationResponseDict:
-        request = MakeTopUpOperationRequestDict(
-            status="COMPLETED",
-            amount=55.77,
-            cardId=card_id,
-            accountId=account_id
+        response = self.make_top_up_operation_api(
+            MAKE_OPERATION_BODY.render(card_id, account_id)
         )
-        response = self.make_top_up_operation_api(request)
-        return response.json()
+        return self.decoder.decode(response, MakeTopUpOperationResponseDict)
 
     def make_cashback_operation(self, card_id: str, account_id: str) -> MakeCashbackOperationResponseDict:
-        request = MakeCashbackOperationRequestDict(
-            status="COMPLETED",
-            amount=55.77,
-            cardId=card_id,
-            accountId=account_id
+        response = self.make_cashback_operation_api(
+            MAKE_OPERATION_BODY.render(card_id, account_id)
         )
-        response = self.make_cashback_operation_api(request)
-        return response.json()
+        return self.decoder.decode(response, MakeCashbackOperationResponseDict)
 
     def make_transfer_operation(self, card_id: str, account_id: str) -> MakeTransferOperationResponseDict:
-        request = MakeTransferOperationRequestDict(
-            status="COMPLETED",
-            amount=55.77,
-            cardId=card_id,
-            accountId=account_id
+        response = self.make_transfer_operation_api(
+            MAKE_OPERATION_BODY.render(card_id, account_id)
         )
-        response = self.make_transfer_operation_api(request)
-        return response.json()
+        return self.decoder.decode(response, MakeTransferOperationResponseDict)
 
     def make_purchase_operation(self, card_id: str, account_id: str) -> MakePurchaseOperationResponseDict:
-        request = MakePurchaseOperationRequestDict(
-            status="COMPLETED",
-            amount=55.77,
-            cardId=card_id,
-            accountId=account_id,
-            category="string"
+        response = self.make_purchase_operation_api(
+            MAKE_PURCHASE_OPERATION_BODY.render(card_id, account_id)
         )
-        response = self.make_purchase_operation_api(request)
-        return response.json()
+        return self.decoder.decode(response, MakePurchaseOperationResponseDict)
 
     def make_bill_payment_operation(self, card_id: str, account_id: str) -> MakeBillPaymentOperationResponseDict:
-        request = MakeBillPaymentOperationRequestDict(
-            status="COMPLETED",
-            amount=55.77,
-            cardId=card_id,
-            accountId=account_id
+        response = self.make_bill_payment_operation_api(
+            MAKE_OPERATION_BODY.render(card_id, account_id)
         )
-        response = self.make_bill_payment_operation_api(request)
-        return response.json()
+        return self.decoder.decode(response, MakeBillPaymentOperationResponseDict)
 
     def make_cash_withdrawal_operation(self, card_id: str, account_id: str) -> MakeCashWithdrawalOperationResponseDict:
-        request = MakeCashWithdrawalOperationRequestDict(
-            status="COMPLETED",
-            amount=55.77,
-            cardId=card_id,
-            accountId=account_id
+        response = self.make_cash_withdrawal_operation_api(
+            MAKE_OPERATION_BODY.render(card_id, account_id)
+        )
+        return self.decoder.decode(response, MakeCashWithdrawalOperationResponseDict)
+
+
+class OperationsGatewayAsyncHTTPClient(AsyncHTTPClient):
+    """
+    Асинхронный клиент для взаимодействия с /api/v1/operations сервиса http-operations.
+    """
+
+    async def get_operation_api(self, operation_id: str) -> Response:
+        """
+        Выполняет GET-запрос на получение информации об операции.
+
+        :param operation_id: ID операции
+        :return: Объект httpx.Response с информацией об операции.
+        """
+        return await self.get(
+            f"/api/v1/operations/{operation_id}",
+            route="/api/v1/operations/{operation_id}"
+        )
+
+    async def get_operations_receipt_api(self, operation_id: str) -> Response:
+        """
+        Выполняет GET-запрос на получение чека по операции.
+
+        :param operation_id: ID операции
+        :return: Объект httpx.Response с информацией о чеке по операции.
+        """
+        return await self.get(
+            f"/api/v1/operations/operation-receipt/{operation_id}",
+            route="/api/v1/operations/operation-receipt/{operation_id}"
+        )
+
+    async def get_operations_api(self, query: GetOperationsQueryDict) -> Response:
+        """
+        Выполняет GET-запрос на получение списка операций для определенного счета.
+
+        :param query: Словарь с параметрами запроса, например: {'accountId': '123'}.
+        :return: Объект httpx.Response со списком операций для определенного счета.
+        """
+        return await self.get(f"/api/v1/operations", params=QueryParams(**query))
+
+    async def get_operations_api_summary(self, query: GetOperationsSummaryQueryDict) -> Response:
+        """
+        Выполняет GET-запрос на получение статистики по операциям для определенного счета.
+
+        :param query: Словарь с параметрами запроса, например: {'accountId': '123'}.
+        :return: Объект httpx.Response со статистикой по операциям для определенного счета.
+        """
+        return await self.get("/api/v1/operations/operations-summary", params=QueryParams(**query))
+
+    async def make_fee_operation_api(self, request: MakeFeeOperationRequestDict | bytes) -> Response:
+        """
+        Выполняет POST-запрос для создания операции комиссии.
+
+        :param request: Словарь со status, amount, cardId и accountId или готовое JSON-тело.
+        :return: Объект httpx.Response с результатом по созданию операции комиссии.
+        """
+        return await self.post("/api/v1/operations/make-fee-operation", json=request)
+
+    async def make_top_up_operation_api(self, request: MakeTopUpOperationRequestDict | bytes) -> Response:
+        """
+        Выполняет POST-запрос для создания операции пополнения.
+
+        :param request: Словарь со status, amount, cardId и accountId или готовое JSON-тело.
+        :return: Объект httpx.Response с результатом по созданию операции пополнения.
+        """
+        return await self.post("/api/v1/operations/make-top-up-operation", json=request)
+
+    async def make_cashback_operation_api(self, request: MakeCashbackOperationRequestDict | bytes) -> Response:
+        """
+        Выполняет POST-запрос для создания операции кэшбэка.
+
+        :param request: Словарь со status, amount, cardId и accountId или готовое JSON-тело.
+        :return: Объект httpx.Response с результатом по созданию операции кэшбэка.
+        """
+        return await self.post("/api/v1/operations/make-cashback-operation", json=request)
+
+    async def make_transfer_operation_api(self, request: MakeTransferOperationRequestDict | bytes) -> Response:
+        """
+        Выполняет POST-запрос для создания операции перевода.
+
+        :param request: Словарь со status, amount, cardId и accountId или готовое JSON-тело.
+        :return: Объект httpx.Response с результатом по созданию операции перевода.
+        """
+        return await self.post("/api/v1/operations/make-transfer-operation", json=request)
+
+    async def make_purchase_operation_api(self, request: MakePurchaseOperationRequestDict | bytes) -> Response:
+        """
+        Выполняет POST-запрос для создания операции покупки.
+
+        :param request: Словарь со status, amount, cardId, accountId и category или готовое JSON-тело.
+        :return: Объект httpx.Response с результатом по созданию операции покупки.
+        """
+        return await self.post("/api/v1/operations/make-purchase-operation", json=request)
+
+    async def make_bill_payment_operation_api(self, request: MakeBillPaymentOperationRequestDict | bytes) -> Response:
+        """
+        Выполняет POST-запрос для создания операции оплаты по счету.
+
+        :param request: Словарь со status, amount, cardId и accountId или готовое JSON-тело.
+        :return: Объект httpx.Response с результатом по созданию операции оплаты по счету.
+        """
+        return await self.post("/api/v1/operations/make-bill-payment-operation", json=request)
+
+    async def make_cash_withdrawal_operation_api(
+            self,
+            request: MakeCashWithdrawalOperationRequestDict | bytes
+    ) -> Response:
+        """
+        Выполняет POST-запрос для создания операции снятия наличных денег.
+
+        :param request: Словарь со status, amount, cardId и accountId или готовое JSON-тело.
+        :return: Объект httpx.Response с результатом по созданию операции снятия наличных денег.
+        """
+        return await self.post("/api/v1/operations/make-cash-withdrawal-operation", json=request)
+
+    async def get_operation(self, operation_id: str) -> GetOperationResponseDict:
+        response = await self.get_operation_api(operation_id=operation_id)
+        return self.decoder.decode(response, GetOperationResponseDict)
+
+    def get_operation_many(
+            self,
+            operation_ids: Iterable[str],
+            concurrency: int = DEFAULT_FANOUT_CONCURRENCY,
+            ordered: bool = True
+    ) -> AsyncIterator[FanoutResult[GetOperationResponseDict]]:
+        """
+        Получает операцию для каждого из operation_ids, выполняя до concurrency запросов одновременно.
+        Ответ с кодом ошибки возвращается как FanoutResult.error и не останавливает пакет.
+
+        :param operation_ids: Идентификаторы, например из хранилища тестовых данных.
+        :param concurrency: Максимальное количество одновременных запросов.
+        :param ordered: Возвращать результаты в порядке идентификаторов или по мере завершения.
+        :return: Асинхронный итератор FanoutResult с ключом-идентификатором.
+        """
+        async def call(operation_id: str) -> GetOperationResponseDict:
+            response = await self.get_operation_api(operation_id=operation_id)
+            response.raise_for_status()
+            return self.decoder.decode(response, GetOperationResponseDict)
+
+        return fan_out(call, operation_ids, concurrency, ordered)
+
+    async def get_operation_receipt(self, operation_id: str) -> GetOperationsReceiptResponseDict:
+        response = await self.get_operations_receipt_api(operation_id=operation_id)
+        return self.decoder.decode(response, GetOperationsReceiptResponseDict)
+
+    async def get_operations(self, account_id: str) -> GetOperationsResponseDict:
+        query = GetOperationsQueryDict(accountId=account_id)
+        response = await self.get_operations_api(query)
+        return self.decoder.decode(response, GetOperationsResponseDict)
+
+    def get_operations_many(
+            self,
+            account_ids: Iterable[str],
+            concurrency: int = DEFAULT_FANOUT_CONCURRENCY,
+            ordered: bool = True
+    ) -> AsyncIterator[FanoutResult[GetOperationsResponseDict]]:
+        """
+        Получает список операций счёта для каждого из account_ids, выполняя до concurrency запросов одновременно.
+        Ответ с кодом ошибки возвращается как FanoutResult.error и не останавливает пакет.
+
+        :param account_ids: Идентификаторы, например из хранилища тестовых данных.
+        :param concurrency: Максимальное количество одновременных запросов.
+        :param ordered: Возвращать результаты в порядке идентификаторов или по мере завершения.
+        :return: Асинхронный итератор FanoutResult с ключом-идентификатором.
+        """
+        async def call(account_id: str) -> GetOperationsResponseDict:
+            response = await self.get_operations_api(GetOperationsQueryDict(accountId=account_id))
+            response.raise_for_status()
+            return self.decoder.decode(response, GetOperationsResponseDict)
+
+        return fan_out(call, account_ids, concurrency, ordered)
+
+    async def iter_operations(self, account_id: str, chunk_size: int = 65_536) -> AsyncIterator[OperationDict]:
+        """
+        Асинхронно возвращает операции счёта по одной по мере чтения ответа get_operations_api,
+        не загружая весь список в память.
+
+        :param account_id: Идентификатор счёта.
+        :param chunk_size: Размер куска тела, читаемого из сети за раз.
+        :raises httpx.HTTPStatusError: Если http-gateway вернул ошибку.
+        """
+        query = GetOperationsQueryDict(accountId=account_id)
+        async with self.stream("GET", "/api/v1/operations", params=QueryParams(**query)) as response:
+            if response.is_error:
+                await response.aread()
+                response.raise_for_status()
+            async for operation in aiter_json_array(response.aiter_bytes(chunk_size), "operations"):
+                yield operation
+
+    async def get_operations_summary(self, account_id: str) -> GetOperationsSummaryResponseDict:
+        query = GetOperationsSummaryQueryDict(accountId=account_id)
+        response = await self.get_operations_api_summary(query)
+        return self.decoder.decode(response, GetOperationsSummaryResponseDict)
+
+    def get_operations_summary_many(
+            self,
+            account_ids: Iterable[str],
+            concurrency: int = DEFAULT_FANOUT_CONCURRENCY,
+            ordered: bool = True
+    ) -> AsyncIterator[FanoutResult[GetOperationsSummaryResponseDict]]:
+        """
+        Получает статистику по операциям счёта для каждого из account_ids,
+        выполняя до concurrency запросов одновременно.
+        Ответ с кодом ошибки возвращается как FanoutResult.error и не останавливает пакет.
+
+        :param account_ids: Идентификаторы, например из хранилища тестовых данных.
+        :param concurrency: Максимальное количество одновременных запросов.
+        :param ordered: Возвращать результаты в порядке идентификаторов или по мере завершения.
+        :return: Асинхронный итератор FanoutResult с ключом-идентификатором.
+        """
+        async def call(account_id: str) -> GetOperationsSummaryResponseDict:
+            response = await self.get_operations_api_summary(GetOperationsSummaryQueryDict(accountId=account_id))
+            response.raise_for_status()
+            return self.decoder.decode(response, GetOperationsSummaryResponseDict)
+
+        return fan_out(call, account_ids, concurrency, ordered)
+
+    async def make_fee_operation(self, card_id: str, account_id: str) -> MakeFeeOperationResponseDict:
+        response = await self.make_fee_operation_api(
+            MAKE_OPERATION_BODY.render(card_id, account_id)
         )
-        response = self.make_cash_withdrawal_operation_api(request)
-        return response.json()
+        return self.decoder.decode(response, MakeFeeOperationResponseDict)
 
+    async def make_top_up_operation(self, card_id: str, account_id: str) -> MakeTopUpOperationResponseDict:
+        response = await self.make_top_up_operation_api(
+            MAKE_OPERATION_BODY.render(card_id, account_id)
+        )
+        return self.decoder.decode(response, MakeTopUpOperationResponseDict)
+
+    async def make_cashback_operation(self, card_id: str, account_id: str) -> MakeCashbackOperationResponseDict:
+        response = await self.make_cashback_operation_api(
+            MAKE_OPERATION_BODY.render(card_id, account_id)
+        )
+        return self.decoder.decode(response, MakeCashbackOperationResponseDict)
+
+    async def make_transfer_operation(self, card_id: str, account_id: str) -> MakeTransferOperationResponseDict:
+        response = await self.make_transfer_operation_api(
+            MAKE_OPERATION_BODY.render(card_id, account_id)
+        )
+        return self.decoder.decode(response, MakeTransferOperationResponseDict)
+
+    async def make_purchase_operation(self, card_id: str, account_id: str) -> MakePurchaseOperationResponseDict:
+        response = await self.make_purchase_operation_api(
+            MAKE_PURCHASE_OPERATION_BODY.render(card_id, account_id)
+        )
+        return self.decoder.decode(response, MakePurchaseOperationResponseDict)
+
+    async def make_bill_payment_operation(self, card_id: str, account_id: str) -> MakeBillPaymentOperationResponseDict:
+        response = await self.make_bill_payment_operation_api(
+            MAKE_OPERATION_BODY.render(card_id, account_id)
+        )
+        return self.decoder.decode(response, MakeBillPaymentOperationResponseDict)
 
-def build_operations_gateway_http_client() -> OperationsGatewayHTTPClient:
+    async def make_cash_withdrawal_operation(self, card_id: str, account_id: str) -> MakeCashWithdrawalOperationResponseDict:
+        response = await self.make_cash_withdrawal_operation_api(
+            MAKE_OPERATION_BODY.render(card_id, account_id)
+        )
+        return self.decoder.decode(response, MakeCashWithdrawalOperationResponseDict)
+
+
+def build_operations_gateway_http_client(
+        config: GatewayHTTPPoolConfig = DEFAULT_GATEWAY_HTTP_POOL_CONFIG,
+        recorder: MetricsRecorder | None = None,
+        decoder: ResponseDecoder | None = None
+) -> OperationsGatewayHTTPClient:
     """
     Функция создаёт экземпляр OperationsGatewayHTTPClient с уже настроенным HTTP-клиентом.
 
+    :param config: Настройки общего пула соединений.
+    :param recorder: Хранилище метрик запросов (по умолчанию метрики не собираются).
+    :param decoder: Разбор и проверка тел ответов (по умолчанию без проверки по схеме).
     :return: Готовый к использованию OperationsGatewayHTTPClient.
     """
-    return OperationsGatewayHTTPClient(client=build_gateway_http_client())
+    return OperationsGatewayHTTPClient(
+        client=build_gateway_http_client(config),
+        recorder=recorder,
+        decoder=decoder
+    )
+
+
+def build_operations_gateway_async_http_client(
+        config: GatewayHTTPPoolConfig = DEFAULT_GATEWAY_HTTP_POOL_CONFIG,
+        recorder: MetricsRecorder | None = None,
+        decoder: ResponseDecoder | None = None
+) -> OperationsGatewayAsyncHTTPClient:
+    """
+    Функция создаёт экземпляр OperationsGatewayAsyncHTTPClient с уже настроенным асинхронным HTTP-клиентом.
+
+    :param config: Настройки общего пула соединений.
+    :param recorder: Хранилище метрик запросов (по умолчанию метрики не собираются).
+    :param decoder: Разбор и проверка тел ответов (по умолчанию без проверки по схеме).
+    :return: Готовый к использованию OperationsGatewayAsyncHTTPClient.
+    """
+    return OperationsGatewayAsyncHTTPClient(
+        client=build_gateway_async_http_client(config),
+        recorder=recorder,
+        decoder=decoder
+    )
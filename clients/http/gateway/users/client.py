@@ -1,8 +1,17 @@
-import time
-from typing import TypedDict
-from httpx import Response
-from clients.http.client import HTTPClient
-from clients.http.gateway.client import build_gateway_http_client
+import uuid
+from typing import Callable
+
+from typing_extensions import TypedDict
+from httpx import AsyncClient, Client, Response
+from clients.http.client import HTTPClient, AsyncHTTPClient
+from clients.http.decoding import ResponseDecoder
+from clients.http.gateway.client import (
+    build_gateway_http_client,
+    build_gateway_async_http_client,
+    GatewayHTTPPoolConfig,
+    DEFAULT_GATEWAY_HTTP_POOL_CONFIG
+)
+from metrics.recorder import MetricsRecorder
 
 
 class UserDict(TypedDict):
@@ -42,11 +51,40 @@ class CreateUserResponseDict(TypedDict):
     user: UserDict
 
 
+CreateUserRequestFactory = Callable[[], CreateUserRequestDict]
+
+
+def build_create_user_request() -> CreateUserRequestDict:
+    """
+    Тело запроса создания пользователя с уникальным email (генератор по умолчанию для create_user;
+    нагрузка передаёт в клиентов fixtures.payloads.PayloadFactory.create_user_request).
+    """
+    return CreateUserRequestDict(
+        email=f"user.{uuid.uuid4().hex}@example.com",
+        lastName="string",
+        firstName="string",
+        middleName="string",
+        phoneNumber="string"
+    )
+
+
 class UsersGatewayHTTPClient(HTTPClient):
     """
     Клиент для взаимодействия с /api/v1/users сервиса http-gateway.
+
+    :param create_user_request: Генератор тел запросов для create_user.
     """
 
+    def __init__(
+            self,
+            client: Client,
+            recorder: MetricsRecorder | None = None,
+            decoder: ResponseDecoder | None = None,
+            create_user_request: CreateUserRequestFactory = build_create_user_request
+    ) -> None:
+        super().__init__(client, recorder, decoder)
+        self.create_user_request = create_user_request
+
     def get_user_api(self, user_id: str) -> Response:
         """
         Получить данные пользователя по его user_id.
@@ -54,7 +92,10 @@ class UsersGatewayHTTPClient(HTTPClient):
         :param user_id: Идентификатор пользователя.
         :return: Ответ от сервера (объект httpx.Response).
         """
-        return self.get(f"/api/v1/users/{user_id}")
+        return self.get(
+            f"/api/v1/users/{user_id}",
+            route="/api/v1/users/{user_id}"
+        )
 
     def create_user_api(self, request: CreateUserRequestDict) -> Response:
         """
@@ -67,24 +108,103 @@ class UsersGatewayHTTPClient(HTTPClient):
 
     def get_user(self, user_id: str) -> GetUserResponseDict:
         response = self.get_user_api(user_id)
-        return response.json()
+        return self.decoder.decode(response, GetUserResponseDict)
 
     def create_user(self) -> CreateUserResponseDict:
-        request = CreateUserRequestDict(
-            email=f"user.{time.time()}@example.com",
-            lastName="string",
-            firstName="string",
-            middleName="string",
-            phoneNumber="string"
-        )
+        request = self.create_user_request()
         response = self.create_user_api(request)
-        return response.json()
+        return self.decoder.decode(response, CreateUserResponseDict)
+
 
+class UsersGatewayAsyncHTTPClient(AsyncHTTPClient):
+    """
+    Асинхронный клиент для взаимодействия с /api/v1/users сервиса http-gateway.
 
-def build_users_gateway_http_client() -> UsersGatewayHTTPClient:
+    :param create_user_request: Генератор тел запросов для create_user.
+    """
+
+    def __init__(
+            self,
+            client: AsyncClient,
+            recorder: MetricsRecorder | None = None,
+            decoder: ResponseDecoder | None = None,
+            create_user_request: CreateUserRequestFactory = build_create_user_request
+    ) -> None:
+        super().__init__(client, recorder, decoder)
+        self.create_user_request = create_user_request
+
+    async def get_user_api(self, user_id: str) -> Response:
+        """
+        Получить данные пользователя по его user_id.
+
+        :param user_id: Идентификатор пользователя.
+        :return: Ответ от сервера (объект httpx.Response).
+        """
+        return await self.get(
+            f"/api/v1/users/{user_id}",
+            route="/api/v1/users/{user_id}"
+        )
+
+    async def create_user_api(self, request: CreateUserRequestDict) -> Response:
+        """
+        Создание нового пользователя.
+
+        :param request: Словарь с данными нового пользователя.
+        :return: Ответ от сервера (объект httpx.Response).
+        """
+        return await self.post("/api/v1/users", json=request)
+
+    async def get_user(self, user_id: str) -> GetUserResponseDict:
+        response = await self.get_user_api(user_id)
+        return self.decoder.decode(response, GetUserResponseDict)
+
+    async def create_user(self) -> CreateUserResponseDict:
+        request = self.create_user_request()
+        response = await self.create_user_api(request)
+        return self.decoder.decode(response, CreateUserResponseDict)
+
+
+def build_users_gateway_http_client(
+        config: GatewayHTTPPoolConfig = DEFAULT_GATEWAY_HTTP_POOL_CONFIG,
+        recorder: MetricsRecorder | None = None,
+        decoder: ResponseDecoder | None = None,
+        create_user_request: CreateUserRequestFactory = build_create_user_request
+) -> UsersGatewayHTTPClient:
     """
     Функция создаёт экземпляр UsersGatewayHTTPClient с уже настроенным HTTP-клиентом.
 
+    :param config: Настройки общего пула соединений.
+    :param recorder: Хранилище метрик запросов (по умолчанию метрики не собираются).
+    :param decoder: Разбор и проверка тел ответов (по умолчанию без проверки по схеме).
+    :param create_user_request: Генератор тел запросов для create_user.
     :return: Готовый к использованию UsersGatewayHTTPClient.
     """
-    return UsersGatewayHTTPClient(client=build_gateway_http_client())
+    return UsersGatewayHTTPClient(
+        client=build_gateway_http_client(config),
+        recorder=recorder,
+        decoder=decoder,
+        create_user_request=create_user_request
+    )
+
+
+def build_users_gateway_async_http_client(
+        config: GatewayHTTPPoolConfig = DEFAULT_GATEWAY_HTTP_POOL_CONFIG,
+        recorder: MetricsRecorder | None = None,
+        decoder: ResponseDecoder | None = None,
+        create_user_request: CreateUserRequestFactory = build_create_user_request
+) -> UsersGatewayAsyncHTTPClient:
+    """
+    Функция создаёт экземпляр UsersGatewayAsyncHTTPClient с уже настроенным асинхронным HTTP-клиентом.
+
+    :param config: Настройки общего пула соединений.
+    :param recorder: Хранилище метрик запросов (по умолчанию метрики не собираются).
+    :param decoder: Разбор и проверка тел ответов (по умолчанию без проверки по схеме).
+    :param create_user_request: Генератор тел запросов для create_user.
+    :return: Готовый к использованию UsersGatewayAsyncHTTPClient.
+    """
+    return UsersGatewayAsyncHTTPClient(
+        client=build_gateway_async_http_client(config),
+        recorder=recorder,
+        decoder=decoder,
+        create_user_request=create_user_request
+    )
@@ -0,0 +1,116 @@
+import codecs
+import json
+import re
+from typing import Any, AsyncIterable, AsyncIterator, Iterable, Iterator
+
+_WHITESPACE_CHARS = " \t\n\r"
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+class JSONArrayStreamParser:
+    """
+    Инкрементальный разбор массива, лежащего в поле JSON-объекта, например {"operations": [...]}.
+
+    Тело подаётся кусками по мере чтения из сети через feed(), а готовые элементы массива
+    возвращаются сразу, как только кусок с их окончанием получен. В памяти одновременно хранится
+    только непрочитанный хвост тела (обычно один незавершённый элемент), поэтому расход памяти
+    не зависит от длины массива. Каждый элемент разбирается C-сканером модуля json.
+
+    :param key: Имя поля объекта с массивом.
+    """
+
+    def __init__(self, key: str) -> None:
+        self.key = key
+        self._start = re.compile(rf"{re.escape(json.dumps(key))}\s*:\s*\[")
+        self._decoder = json.JSONDecoder()
+        self._text = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._position = 0
+        self._started = False
+        self.finished = False
+
+    def feed(self, chunk: bytes) -> list[Any]:
+        """
+        :param chunk: Очередной кусок тела ответа.
+        :return: Элементы массива, полностью полученные с этим куском.
+        """
+        if self.finished:
+            return []
+        self._buffer = self._buffer[self._position:] + self._text.decode(chunk)
+        self._position = 0
+        if not self._started:
+            match = self._start.search(self._buffer)
+            if match is None:
+                return []
+            self._started = True
+            self._position = match.end()
+        return self._parse_items()
+
+    def close(self) -> None:
+        """
+        Проверяет, что массив был получен полностью.
+        """
+        if not self.finished:
+            raise ValueError(f"Response body ended before the end of the {self.key!r} array")
+
+    def _skip_whitespace(self, buffer: str, position: int) -> int:
+        if position < len(buffer) and buffer[position] in _WHITESPACE_CHARS:
+            return _WHITESPACE.match(buffer, position).end()
+        return position
+
+    def _parse_items(self) -> list[Any]:
+        items = []
+        buffer, position, end = self._buffer, self._position, len(self._buffer)
+        scan_once, skip_whitespace = self._decoder.scan_once, self._skip_whitespace
+        while True:
+            position = skip_whitespace(buffer, position)
+            if position == end:
+                break
+            if buffer[position] == "]":
+                self.finished = True
+                break
+            if buffer[position] == ",":
+                position = skip_whitespace(buffer, position + 1)
+                if position == end:
+                    # Запятую пропускаем только вместе со следующим элементом
+                    position = buffer.rindex(",", 0, position)
+                    break
+            try:
+                item, position_after = scan_once(buffer, position)
+            except (StopIteration, json.JSONDecodeError):
+                # Элемент ещё не получен целиком
+                break
+            # Число в конце куска может продолжиться в следующем, поэтому элемент
+            # считается полученным, только когда после него уже пришли "," или "]"
+            position_after = skip_whitespace(buffer, position_after)
+            if position_after == end or buffer[position_after] not in ",]":
+                break
+            items.append(item)
+            position = position_after
+        self._position = position
+        return items
+
+
+def iter_json_array(chunks: Iterable[bytes], key: str) -> Iterator[Any]:
+    """
+    Возвращает элементы массива из поля key по мере получения кусков тела.
+    """
+    parser = JSONArrayStreamParser(key)
+    for chunk in chunks:
+        yield from parser.feed(chunk)
+        if parser.finished:
+            return
+    parser.close()
+
+
+async def aiter_json_array(chunks: AsyncIterable[bytes], key: str) -> AsyncIterator[Any]:
+    """
+    Асинхронный вариант iter_json_array.
+    """
+    parser = JSONArrayStreamParser(key)
+    async for chunk in chunks:
+        for item in parser.feed(chunk):
+            yield item
+        if parser.finished:
+            return
+    parser.close()
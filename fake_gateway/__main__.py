@@ -0,0 +1,62 @@
+import argparse
+import asyncio
+import sys
+
+from fake_gateway.server import FakeGatewayApp, FakeGatewayConfig, LatencyDistribution, RouteBehaviour, serve
+
+
+def parse_route(value: str) -> tuple[str, RouteBehaviour]:
+    """
+    Разбирает переопределение эндпоинта вида "POST /api/v1/users=lognormal:20,0.5@0.01"
+    (распределение задержки и, после @, доля ошибок).
+    """
+    route, _, behaviour = value.rpartition("=")
+    latency, _, error_rate = behaviour.partition("@")
+    return route, RouteBehaviour(LatencyDistribution.parse(latency), float(error_rate or 0))
+
+
+async def main(args: argparse.Namespace) -> None:
+    config = FakeGatewayConfig(
+        default=RouteBehaviour(LatencyDistribution.parse(args.latency), args.error_rate),
+        routes=dict(args.route)
+    )
+    server = await serve(args.host, args.port, FakeGatewayApp(config=config))
+    print(f"Fake http-gateway is listening on {args.host}:{server.sockets[0].getsockname()[1]}")
+    async with server:
+        await server.serve_forever()
+
+
+def build_parser(prog: str = "fake_gateway") -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog=prog, description="Фейковый http-gateway с состоянием в памяти")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8003)
+    parser.add_argument("--latency", default="0", help='Задержка ответа в мс, например "5" или "lognormal:5,0.5"')
+    parser.add_argument("--error-rate", type=float, default=0, help="Доля ответов 500 от 0 до 1")
+    parser.add_argument(
+        "--route",
+        type=parse_route,
+        action="append",
+        default=[],
+        help='Переопределение для эндпоинта: "POST /api/v1/users=lognormal:20,0.5@0.01"'
+    )
+    return parser
+
+
+def cli(argv: list[str] | None = None, prog: str = "fake_gateway") -> int:
+    args = build_parser(prog).parse_args(argv)
+    try:
+        import uvloop
+    except ImportError:
+        uvloop = None
+
+    if uvloop is not None:
+        uvloop.install()
+    try:
+        asyncio.run(main(args))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(cli())
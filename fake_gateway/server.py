@@ -0,0 +1,318 @@
+import asyncio
+import json
+import random
+import socket
+from dataclasses import dataclass, field
+from typing import Any, Callable
+from urllib.parse import parse_qs
+
+from fake_gateway.state import GatewayState, NotFoundError, ConflictError
+
+REASONS = {
+    200: b"OK",
+    400: b"Bad Request",
+    404: b"Not Found",
+    409: b"Conflict",
+    422: b"Unprocessable Entity",
+    500: b"Internal Server Error"
+}
+MAX_HEADERS_SIZE = 64 * 1024
+
+
+@dataclass(frozen=True)
+class LatencyDistribution:
+    """
+    Распределение искусственной задержки ответа в миллисекундах.
+
+    :param kind: constant, uniform, normal, lognormal или exponential.
+    :param mean: Среднее значение (для uniform — нижняя граница, для lognormal — медиана).
+    :param spread: Разброс: верхняя граница для uniform, стандартное отклонение для normal,
+        сигма логарифма для lognormal.
+    """
+    kind: str = "constant"
+    mean: float = 0
+    spread: float = 0
+
+    def sample(self) -> float:
+        """
+        :return: Задержка в секундах.
+        """
+        if self.kind == "constant":
+            value = self.mean
+        elif self.kind == "uniform":
+            value = random.uniform(self.mean, self.spread)
+        elif self.kind == "normal":
+            value = random.gauss(self.mean, self.spread)
+        elif self.kind == "lognormal":
+            value = self.mean * random.lognormvariate(0, self.spread)
+        elif self.kind == "exponential":
+            value = random.expovariate(1 / self.mean) if self.mean else 0
+        else:
+            raise ValueError(f"Unknown latency distribution: {self.kind}")
+        return max(value, 0) / 1000
+
+    @classmethod
+    def parse(cls, value: str) -> "LatencyDistribution":
+        """
+        Разбирает строку вида "lognormal:5,0.5", "uniform:1,10" или "3".
+        """
+        kind, _, params = value.rpartition(":")
+        numbers = [float(number) for number in params.split(",") if number]
+        return cls(kind or "constant", *numbers)
+
+
+@dataclass(frozen=True)
+class RouteBehaviour:
+    """
+    Поведение эндпоинта: задержка ответа и доля ответов с ошибкой 500.
+    """
+    latency: LatencyDistribution = LatencyDistribution()
+    error_rate: float = 0
+
+
+@dataclass(frozen=True)
+class FakeGatewayConfig:
+    """
+    Настройки фейкового http-gateway.
+
+    :param default: Поведение всех эндпоинтов по умолчанию.
+    :param routes: Переопределения по шаблону эндпоинта, например {"POST /api/v1/users": RouteBehaviour(...)}.
+    """
+    default: RouteBehaviour = RouteBehaviour()
+    routes: dict[str, RouteBehaviour] = field(default_factory=dict)
+
+    def behaviour(self, route: str) -> RouteBehaviour:
+        return self.routes.get(route, self.default)
+
+
+Handler = Callable[[GatewayState, str, dict[str, list[str]], Any], dict[str, Any]]
+
+
+def _operation(operation_type: str) -> Handler:
+    return lambda state, _, query, body: state.make_operation(operation_type, body)
+
+
+def _account(account_type: str) -> Handler:
+    return lambda state, _, query, body: state.open_account(body["userId"], account_type)
+
+
+STATIC_ROUTES: dict[tuple[str, str], Handler] = {
+    ("POST", "/api/v1/users"): lambda state, _, query, body: state.create_user(body),
+    ("GET", "/api/v1/accounts"): lambda state, _, query, body: state.get_accounts(query["userId"][0]),
+    ("POST", "/api/v1/accounts/open-deposit-account"): _account("DEPOSIT"),
+    ("POST", "/api/v1/accounts/open-savings-account"): _account("SAVINGS"),
+    ("POST", "/api/v1/accounts/open-debit-card-account"): _account("DEBIT_CARD"),
+    ("POST", "/api/v1/accounts/open-credit-card-account"): _account("CREDIT_CARD"),
+    ("POST", "/api/v1/cards/issue-virtual-card"): (
+        lambda state, _, query, body: state.issue_card(body["userId"], body["accountId"], "VIRTUAL")
+    ),
+    ("POST", "/api/v1/cards/issue-physical-card"): (
+        lambda state, _, query, body: state.issue_card(body["userId"], body["accountId"], "PHYSICAL")
+    ),
+    ("GET", "/api/v1/operations"): lambda state, _, query, body: state.get_operations(query["accountId"][0]),
+    ("GET", "/api/v1/operations/operations-summary"): (
+        lambda state, _, query, body: state.get_operations_summary(query["accountId"][0])
+    ),
+    ("POST", "/api/v1/operations/make-fee-operation"): _operation("FEE"),
+    ("POST", "/api/v1/operations/make-top-up-operation"): _operation("TOP_UP"),
+    ("POST", "/api/v1/operations/make-cashback-operation"): _operation("CASHBACK"),
+    ("POST", "/api/v1/operations/make-transfer-operation"): _operation("TRANSFER"),
+    ("POST", "/api/v1/operations/make-purchase-operation"): _operation("PURCHASE"),
+    ("POST", "/api/v1/operations/make-bill-payment-operation"): _operation("BILL_PAYMENT"),
+    ("POST", "/api/v1/operations/make-cash-withdrawal-operation"): _operation("CASH_WITHDRAWAL"),
+}
+
+# Порядок важен: более длинные префиксы проверяются раньше /api/v1/operations/{operation_id}
+PREFIX_ROUTES: list[tuple[str, str, str, Handler]] = [
+    ("GET", "/api/v1/users/", "/api/v1/users/{user_id}", lambda state, tail, query, body: state.get_user(tail)),
+    (
+        "GET", "/api/v1/documents/tariff-document/", "/api/v1/documents/tariff-document/{account_id}",
+        lambda state, tail, query, body: state.get_document("tariff", tail)
+    ),
+    (
+        "GET", "/api/v1/documents/contract-document/", "/api/v1/documents/contract-document/{account_id}",
+        lambda state, tail, query, body: state.get_document("contract", tail)
+    ),
+    (
+        "GET", "/api/v1/operations/operation-receipt/", "/api/v1/operations/operation-receipt/{operation_id}",
+        lambda state, tail, query, body: state.get_operation_receipt(tail)
+    ),
+    (
+        "GET", "/api/v1/operations/", "/api/v1/operations/{operation_id}",
+        lambda state, tail, query, body: state.get_operation(tail)
+    ),
+]
+
+
+class FakeGatewayApp:
+    """
+    Маршрутизация запросов фейкового http-gateway по тем же эндпоинтам, что вызывают клиенты.
+
+    :param state: Хранилище состояния.
+    :param config: Задержки и доля ошибок по эндпоинтам.
+    """
+
+    def __init__(self, state: GatewayState | None = None, config: FakeGatewayConfig | None = None) -> None:
+        self.state = state or GatewayState()
+        self.config = config or FakeGatewayConfig()
+
+    def handle(self, method: str, target: str, body: bytes) -> tuple[int, bytes, float]:
+        """
+        Обрабатывает один запрос.
+
+        :return: Код ответа, JSON-тело и задержка перед отправкой в секундах.
+        """
+        path, _, query_string = target.partition("?")
+        handler, route, tail = self._resolve(method, path)
+        if handler is None:
+            return 404, _error(f"Route {method} {path} not found"), 0
+
+        behaviour = self.config.behaviour(route)
+        delay = behaviour.latency.sample()
+        if behaviour.error_rate and random.random() < behaviour.error_rate:
+            return 500, _error("Injected error"), delay
+
+        try:
+            payload = json.loads(body) if body else None
+            result = handler(self.state, tail, parse_qs(query_string), payload)
+        except NotFoundError as error:
+            return 404, _error(str(error)), delay
+        except ConflictError as error:
+            return 409, _error(str(error)), delay
+        except (KeyError, TypeError, ValueError) as error:
+            return 422, _error(f"Invalid request: {error!r}"), delay
+        return 200, json.dumps(result, separators=(",", ":")).encode(), delay
+
+    @staticmethod
+    def _resolve(method: str, path: str) -> tuple[Handler | None, str, str]:
+        handler = STATIC_ROUTES.get((method, path))
+        if handler is not None:
+            return handler, f"{method} {path}", ""
+        for route_method, prefix, template, handler in PREFIX_ROUTES:
+            if method == route_method and path.startswith(prefix) and "/" not in path[len(prefix):]:
+                return handler, f"{method} {template}", path[len(prefix):]
+        return None, "", ""
+
+
+def _error(detail: str) -> bytes:
+    return json.dumps({"detail": detail}).encode()
+
+
+def _parse_head(head: list[str]) -> tuple[str, str, int, bool]:
+    """
+    Разбирает строку запроса и заголовки.
+
+    :return: Метод, путь, длина тела и нужно ли закрыть соединение после ответа.
+    :raises ValueError: Если строка запроса или Content-Length некорректны.
+    """
+    parts = head[0].split(" ")
+    if len(parts) != 3 or not parts[2].startswith("HTTP/"):
+        raise ValueError(f"Malformed request line {head[0]!r}")
+    method, target, _ = parts
+
+    content_length, close = 0, False
+    for line in head[1:]:
+        name, _, value = line.partition(":")
+        name = name.lower()
+        if name == "content-length":
+            if not value.strip().isdigit():
+                raise ValueError(f"Invalid Content-Length {value.strip()!r}")
+            content_length = int(value)
+        elif name == "connection" and value.strip().lower() == "close":
+            close = True
+    return method, target, content_length, close
+
+
+def _response(status: int, payload: bytes, close: bool = False) -> bytes:
+    return b"HTTP/1.1 %d %s\r\nContent-Type: application/json\r\nContent-Length: %d\r\n%s\r\n%s" % (
+        status, REASONS.get(status, b""), len(payload), b"Connection: close\r\n" if close else b"", payload
+    )
+
+
+class FakeGatewayProtocol(asyncio.Protocol):
+    """
+    Минимальный HTTP/1.1 сервер поверх asyncio.Protocol с поддержкой keep-alive.
+
+    Запросы одного соединения обрабатываются строго по очереди, поэтому при задержке ответа
+    следующие запросы этого соединения ждут в буфере, как и на настоящем сервере.
+    """
+
+    def __init__(self, app: FakeGatewayApp) -> None:
+        self.app = app
+        self.loop = asyncio.get_running_loop()
+        self.transport: asyncio.Transport | None = None
+        self.buffer = bytearray()
+        self.busy = False
+        self.close_after_response = False
+
+    def connection_made(self, transport: asyncio.Transport) -> None:
+        self.transport = transport
+        sock = transport.get_extra_info("socket")
+        if sock is not None:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def connection_lost(self, exc: Exception | None) -> None:
+        self.transport = None
+
+    def data_received(self, data: bytes) -> None:
+        self.buffer += data
+        if not self.busy:
+            self._process()
+
+    def _process(self) -> None:
+        while self.transport is not None and not self.busy:
+            header_end = self.buffer.find(b"\r\n\r\n")
+            if header_end < 0:
+                if len(self.buffer) > MAX_HEADERS_SIZE:
+                    self.transport.close()
+                return
+
+            head = bytes(self.buffer[:header_end]).decode("latin-1").split("\r\n")
+            try:
+                method, target, content_length, close = _parse_head(head)
+            except ValueError as error:
+                # Границу следующего запроса уже не найти, поэтому соединение закрывается
+                self.close_after_response = True
+                self._send(_response(400, _error(str(error)), close=True))
+                return
+            self.close_after_response = self.close_after_response or close
+
+            body_end = header_end + 4 + content_length
+            if len(self.buffer) < body_end:
+                return
+            body = bytes(self.buffer[header_end + 4:body_end])
+            del self.buffer[:body_end]
+
+            status, payload, delay = self.app.handle(method, target, body)
+            response = _response(status, payload, self.close_after_response)
+            if delay > 0:
+                self.busy = True
+                self.loop.call_later(delay, self._send_delayed, response)
+                return
+            self._send(response)
+
+    def _send(self, response: bytes) -> None:
+        if self.transport is None:
+            return
+        self.transport.write(response)
+        if self.close_after_response:
+            self.transport.close()
+            self.transport = None
+
+    def _send_delayed(self, response: bytes) -> None:
+        self.busy = False
+        self._send(response)
+        self._process()
+
+
+async def serve(host: str = "127.0.0.1", port: int = 8003, app: FakeGatewayApp | None = None) -> asyncio.Server:
+    """
+    Запускает фейковый http-gateway в текущем event loop.
+
+    :param host: Адрес.
+    :param port: Порт (0 — выбрать свободный, фактический порт в server.sockets).
+    :param app: Приложение с состоянием и настройками.
+    :return: Запущенный asyncio.Server.
+    """
+    app = app or FakeGatewayApp()
+    return await asyncio.get_running_loop().create_server(lambda: FakeGatewayProtocol(app), host, port, backlog=4096)
@@ -0,0 +1,180 @@
+import itertools
+import uuid
+from datetime import date, datetime, timezone
+from typing import Any
+
+ACCOUNT_TYPES = ("DEPOSIT", "SAVINGS", "DEBIT_CARD", "CREDIT_CARD")
+CARD_ACCOUNT_TYPES = ("DEBIT_CARD", "CREDIT_CARD")
+OPERATION_TYPES = ("FEE", "TOP_UP", "CASHBACK", "TRANSFER", "PURCHASE", "BILL_PAYMENT", "CASH_WITHDRAWAL")
+SPENT_OPERATION_TYPES = ("FEE", "TRANSFER", "PURCHASE", "BILL_PAYMENT", "CASH_WITHDRAWAL")
+
+
+def expiry_date(issued: date, years: int = 3) -> date:
+    """
+    Срок действия карты: та же дата через years лет, для 29 февраля — 28 февраля.
+    """
+    try:
+        return issued.replace(year=issued.year + years)
+    except ValueError:
+        return issued.replace(year=issued.year + years, day=28)
+
+
+class NotFoundError(Exception):
+    """
+    Сущность с указанным идентификатором не найдена (HTTP 404).
+    """
+
+
+class ConflictError(Exception):
+    """
+    Нарушение уникальности, например повторный email (HTTP 409).
+    """
+
+
+class GatewayState:
+    """
+    Хранилище состояния фейкового http-gateway в памяти процесса:
+    пользователи, счета, карты, операции и документы.
+
+    Формат сущностей совпадает с UserDict, AccountDict, CardDict и OperationDict клиентов.
+    """
+
+    def __init__(self) -> None:
+        self.users: dict[str, dict[str, Any]] = {}
+        self.emails: set[str] = set()
+        self.accounts: dict[str, dict[str, Any]] = {}
+        self.user_accounts: dict[str, list[str]] = {}
+        self.cards: dict[str, dict[str, Any]] = {}
+        self.operations: dict[str, dict[str, Any]] = {}
+        self.account_operations: dict[str, list[str]] = {}
+        self._card_numbers = itertools.count(4000_0000_0000_0000)
+
+    def create_user(self, request: dict[str, Any]) -> dict[str, Any]:
+        email = request["email"]
+        if email in self.emails:
+            raise ConflictError(f"User with email {email} already exists")
+
+        user = {
+            "id": str(uuid.uuid4()),
+            "email": email,
+            "lastName": request["lastName"],
+            "firstName": request["firstName"],
+            "middleName": request["middleName"],
+            "phoneNumber": request["phoneNumber"],
+        }
+        self.emails.add(email)
+        self.users[user["id"]] = user
+        self.user_accounts[user["id"]] = []
+        return {"user": user}
+
+    def get_user(self, user_id: str) -> dict[str, Any]:
+        return {"user": self._get(self.users, user_id, "User")}
+
+    def open_account(self, user_id: str, account_type: str) -> dict[str, Any]:
+        user = self._get(self.users, user_id, "User")
+        account = {
+            "id": str(uuid.uuid4()),
+            "type": account_type,
+            "cards": [],
+            "status": "ACTIVE",
+            "balance": 0.0,
+        }
+        self.accounts[account["id"]] = account
+        self.user_accounts[user["id"]].append(account["id"])
+        self.account_operations[account["id"]] = []
+
+        if account_type in CARD_ACCOUNT_TYPES:
+            self._issue_card(user, account, "VIRTUAL")
+            self._issue_card(user, account, "PHYSICAL")
+        return {"account": account}
+
+    def get_accounts(self, user_id: str) -> dict[str, Any]:
+        return {"accounts": [self.accounts[account_id] for account_id in self.user_accounts.get(user_id, ())]}
+
+    def issue_card(self, user_id: str, account_id: str, card_type: str) -> dict[str, Any]:
+        user = self._get(self.users, user_id, "User")
+        account = self._get(self.accounts, account_id, "Account")
+        return {"card": self._issue_card(user, account, card_type)}
+
+    def _issue_card(self, user: dict[str, Any], account: dict[str, Any], card_type: str) -> dict[str, Any]:
+        card = {
+            "id": str(uuid.uuid4()),
+            "pin": "1234",
+            "cvv": "123",
+            "type": card_type,
+            "status": "ACTIVE",
+            "accountId": account["id"],
+            "cardNumber": str(next(self._card_numbers)),
+            "cardHolder": f"{user['firstName']} {user['lastName']}",
+            "expiryDate": expiry_date(date.today()).isoformat(),
+            "paymentSystem": "VISA" if len(self.cards) % 2 else "MASTERCARD",
+        }
+        self.cards[card["id"]] = card
+        account["cards"].append(card)
+        return card
+
+    def make_operation(self, operation_type: str, request: dict[str, Any]) -> dict[str, Any]:
+        account = self._get(self.accounts, request["accountId"], "Account")
+        self._get(self.cards, request["cardId"], "Card")
+        amount = float(request["amount"])
+        operation = {
+            "id": str(uuid.uuid4()),
+            "type": operation_type,
+            "status": request["status"],
+            "amount": amount,
+            "cardId": request["cardId"],
+            "category": request.get("category", ""),
+            "createdAt": datetime.now(timezone.utc).isoformat(),
+            "accountId": account["id"],
+        }
+        self.operations[operation["id"]] = operation
+        self.account_operations[account["id"]].append(operation["id"])
+        account["balance"] += -amount if operation_type in SPENT_OPERATION_TYPES else amount
+        return {"operation": operation}
+
+    def get_operation(self, operation_id: str) -> dict[str, Any]:
+        return {"operation": self._get(self.operations, operation_id, "Operation")}
+
+    def get_operations(self, account_id: str) -> dict[str, Any]:
+        return {
+            "operations": [
+                self.operations[operation_id] for operation_id in self.account_operations.get(account_id, ())
+            ]
+        }
+
+    def get_operations_summary(self, account_id: str) -> dict[str, Any]:
+        spent = received = cashback = 0.0
+        for operation_id in self.account_operations.get(account_id, ()):
+            operation = self.operations[operation_id]
+            if operation["type"] == "CASHBACK":
+                cashback += operation["amount"]
+            elif operation["type"] in SPENT_OPERATION_TYPES:
+                spent += operation["amount"]
+            else:
+                received += operation["amount"]
+        return {"summary": {"spentAmount": spent, "receivedAmount": received, "cashbackAmount": cashback}}
+
+    def get_operation_receipt(self, operation_id: str) -> dict[str, Any]:
+        operation = self._get(self.operations, operation_id, "Operation")
+        return {
+            "receipt": {
+                "url": f"http://localhost:8003/documents/receipts/{operation['id']}.pdf",
+                "document": f"Receipt {operation['type']} {operation['amount']:.2f}",
+            }
+        }
+
+    def get_document(self, kind: str, account_id: str) -> dict[str, Any]:
+        account = self._get(self.accounts, account_id, "Account")
+        return {
+            kind: {
+                "url": f"http://localhost:8003/documents/{kind}/{account['id']}.pdf",
+                "document": f"{kind.capitalize()} for {account['type']} account",
+            }
+        }
+
+    @staticmethod
+    def _get(storage: dict[str, dict[str, Any]], entity_id: str, name: str) -> dict[str, Any]:
+        entity = storage.get(entity_id)
+        if entity is None:
+            raise NotFoundError(f"{name} {entity_id} not found")
+        return entity
@@ -0,0 +1,67 @@
+import argparse
+import asyncio
+import sys
+import time
+
+from clients.http.gateway.client import GatewayHTTPPoolConfig
+from fixtures.redis_pool import DEFAULT_PREFIX, RedisEntityPool, fill_entity_pool
+from fixtures.seeding import SeedConfig, seed_fixtures, ACCOUNT_TYPES, CARD_TYPES
+from fixtures.store import FixtureStore
+from load.scenario import build_gateway_clients
+
+
+async def main(args: argparse.Namespace) -> None:
+    config = SeedConfig(
+        users=args.users,
+        account_types=tuple(args.account_types.split(",")),
+        card_types=tuple(filter(None, args.cards.split(","))),
+        concurrency=args.concurrency,
+        retries=args.retries
+    )
+    pool = GatewayHTTPPoolConfig(base_url=args.base_url, max_connections=args.concurrency)
+    started = time.perf_counter()
+
+    def progress(done: int, failed: int) -> None:
+        if (done + failed) % 100 == 0 or done + failed == args.users:
+            print(f"\r{done}/{args.users} users seeded, {failed} failed", end="", file=sys.stderr)
+
+    fixtures = await seed_fixtures(build_gateway_clients(pool), config, args.output, progress)
+    elapsed = time.perf_counter() - started
+    print(f"\n{len(fixtures.users)} users saved to {args.output} in {elapsed:.1f}s", file=sys.stderr)
+
+    if args.store:
+        store = FixtureStore(args.store)
+        store.add_fixtures(fixtures)
+        store.close()
+        print(f"Fixtures added to {args.store}", file=sys.stderr)
+
+    if args.redis_url:
+        entity_pool = RedisEntityPool.from_url(args.redis_url, args.redis_prefix)
+        await entity_pool.check_server()
+        counts = await fill_entity_pool(entity_pool, fixtures)
+        await entity_pool.close()
+        print(f"{sum(counts.values())} entities added to the pool at {args.redis_url}", file=sys.stderr)
+
+
+def build_parser(prog: str = "fixtures") -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog=prog, description="Подготовка тестовых данных в http-gateway")
+    parser.add_argument("--users", type=int, required=True, help="Сколько пользователей создать")
+    parser.add_argument("--output", default="fixtures.json", help="Файл для сохранения данных")
+    parser.add_argument("--store", help="Дополнительно добавить данные в SQLite-хранилище (fixtures.store)")
+    parser.add_argument("--redis-url", help="Дополнительно добавить данные в общий пул сущностей в Redis 6.2+")
+    parser.add_argument("--redis-prefix", default=DEFAULT_PREFIX, help="Префикс ключей пула в Redis")
+    parser.add_argument("--base-url", default="http://localhost:8003")
+    parser.add_argument("--account-types", default=",".join(ACCOUNT_TYPES), help="Счета каждого пользователя")
+    parser.add_argument("--cards", default="", help=f"Дополнительные карты на карточные счета: {','.join(CARD_TYPES)}")
+    parser.add_argument("--concurrency", type=int, default=20, help="Одновременных запросов")
+    parser.add_argument("--retries", type=int, default=3)
+    return parser
+
+
+def cli(argv: list[str] | None = None, prog: str = "fixtures") -> int:
+    asyncio.run(main(build_parser(prog).parse_args(argv)))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(cli())
@@ -0,0 +1,170 @@
+import itertools
+import os
+import random
+import uuid
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Iterator
+
+if TYPE_CHECKING:
+    from clients.http.gateway.operations.client import MakeOperationRequestDict, MakePurchaseOperationRequestDict
+    from clients.http.gateway.users.client import CreateUserRequestDict
+
+POOL_SIZE = 4096
+
+LAST_NAMES = (
+    "Ivanov", "Smirnov", "Kuznetsov", "Popov", "Vasiliev", "Petrov", "Sokolov", "Mikhailov",
+    "Novikov", "Fedorov", "Morozov", "Volkov", "Alekseev", "Lebedev", "Semenov", "Egorov",
+)
+FIRST_NAMES = (
+    "Alexander", "Maxim", "Ivan", "Artem", "Dmitry", "Nikita", "Mikhail", "Daniil",
+    "Anna", "Maria", "Elena", "Olga", "Natalia", "Sofia", "Daria", "Polina",
+)
+MIDDLE_NAMES = (
+    "Alexandrovich", "Sergeevich", "Dmitrievich", "Andreevich", "Ivanovich", "Petrovich",
+    "Alexandrovna", "Sergeevna", "Dmitrievna", "Andreevna", "Ivanovna", "Petrovna",
+)
+DEFAULT_CATEGORIES = {
+    "supermarkets": 30, "restaurants": 15, "taxi": 12, "pharmacy": 8, "fuel": 8,
+    "clothes": 7, "electronics": 5, "entertainment": 5, "travel": 4, "education": 3, "other": 3,
+}
+DEFAULT_STATUSES = {"COMPLETED": 90, "IN_PROGRESS": 7, "FAILED": 3}
+
+
+@dataclass(frozen=True)
+class AmountDistribution:
+    """
+    Распределение сумм операций.
+
+    :param kind: constant, uniform или lognormal.
+    :param mean: Сумма для constant, нижняя граница для uniform, медиана для lognormal.
+    :param spread: Верхняя граница для uniform, сигма логарифма для lognormal.
+    :param minimum: Минимальная сумма.
+    :param maximum: Максимальная сумма.
+    """
+    kind: str = "lognormal"
+    mean: float = 1000
+    spread: float = 1
+    minimum: float = 0.01
+    maximum: float = 1_000_000
+
+    def sample(self, generator: random.Random) -> float:
+        if self.kind == "constant":
+            value = self.mean
+        elif self.kind == "uniform":
+            value = generator.uniform(self.mean, self.spread)
+        elif self.kind == "lognormal":
+            value = self.mean * generator.lognormvariate(0, self.spread)
+        else:
+            raise ValueError(f"Unknown amount distribution: {self.kind}")
+        return round(min(max(value, self.minimum), self.maximum), 2)
+
+
+def _cycle_pool(generator: random.Random, values: list) -> Iterator:
+    generator.shuffle(values)
+    return itertools.cycle(values)
+
+
+def _weighted_pool(generator: random.Random, weights: dict[str, float], size: int = POOL_SIZE) -> Iterator[str]:
+    return _cycle_pool(generator, generator.choices(list(weights), weights=list(weights.values()), k=size))
+
+
+@dataclass
+class PayloadFactory:
+    """
+    Генератор уникальных и правдоподобных тел запросов к http-gateway.
+
+    Уникальность email обеспечивается префиксом генератора и счётчиком, а не временем,
+    поэтому генераторы разных процессов и машин не создают одинаковых пользователей.
+    Имена, суммы, категории и статусы выбираются по кругу из заранее перемешанных пулов значений,
+    поэтому генерация одного тела стоит сотни наносекунд и не становится узким местом нагрузки.
+
+    :param prefix: Уникальный префикс генератора (по умолчанию случайный).
+    :param seed: Начальное значение генератора случайных чисел для воспроизводимых данных.
+    :param amounts: Распределение сумм операций.
+    :param categories: Веса категорий покупок.
+    :param statuses: Веса статусов операций.
+    """
+    prefix: str = field(default_factory=lambda: uuid.uuid4().hex[:10])
+    seed: int | None = None
+    amounts: AmountDistribution = AmountDistribution()
+    categories: dict[str, float] = field(default_factory=lambda: dict(DEFAULT_CATEGORIES))
+    statuses: dict[str, float] = field(default_factory=lambda: dict(DEFAULT_STATUSES))
+
+    def __post_init__(self) -> None:
+        generator = random.Random(self.seed)
+        self._counter = itertools.count()
+        # Начало email вычисляется заранее для каждой комбинации имён
+        self._names = _cycle_pool(
+            generator,
+            [
+                (first, middle, last, f"{first.lower()}.{last.lower()}.{self.prefix}.")
+                for first in FIRST_NAMES for middle in MIDDLE_NAMES for last in LAST_NAMES
+            ]
+        )
+        self._amounts = _cycle_pool(generator, [self.amounts.sample(generator) for _ in range(POOL_SIZE)])
+        self._categories = _weighted_pool(generator, self.categories)
+        self._statuses = _weighted_pool(generator, self.statuses)
+
+    def unique_id(self) -> str:
+        """
+        :return: Уникальный в пределах всех генераторов идентификатор вида "<prefix>-<номер>".
+        """
+        return f"{self.prefix}-{next(self._counter)}"
+
+    def create_user_request(self) -> "CreateUserRequestDict":
+        number = next(self._counter)
+        first, middle, last, email = next(self._names)
+        return {
+            "email": f"{email}{number}@example.com",
+            "lastName": last,
+            "firstName": first,
+            "middleName": middle,
+            "phoneNumber": f"+79{number % 1_000_000_000:09d}"
+        }
+
+    def amount(self) -> float:
+        return next(self._amounts)
+
+    def category(self) -> str:
+        return next(self._categories)
+
+    def status(self) -> str:
+        return next(self._statuses)
+
+    def make_operation_request(self, card_id: str, account_id: str) -> "MakeOperationRequestDict":
+        """
+        Тело запроса для make_fee_operation, make_top_up_operation, make_cashback_operation,
+        make_transfer_operation, make_bill_payment_operation и make_cash_withdrawal_operation.
+        """
+        return {
+            "status": next(self._statuses),
+            "amount": next(self._amounts),
+            "cardId": card_id,
+            "accountId": account_id
+        }
+
+    def make_purchase_operation_request(self, card_id: str, account_id: str) -> "MakePurchaseOperationRequestDict":
+        return {
+            "status": next(self._statuses),
+            "amount": next(self._amounts),
+            "cardId": card_id,
+            "accountId": account_id,
+            "category": next(self._categories)
+        }
+
+
+_factories: dict[int, PayloadFactory] = {}
+
+
+def get_payload_factory() -> PayloadFactory:
+    """
+    Генератор тел запросов текущего процесса.
+
+    Генератор создаётся заново в каждом процессе (в том числе после fork),
+    поэтому у каждого воркера свой префикс и счётчик.
+    """
+    pid = os.getpid()
+    factory = _factories.get(pid)
+    if factory is None:
+        factory = _factories[pid] = PayloadFactory()
+    return factory
@@ -0,0 +1,308 @@
+import json
+from collections import deque
+from dataclasses import dataclass, replace
+from typing import TYPE_CHECKING, Any, Protocol
+
+from fixtures.seeding import Fixtures
+from load.scenario import GatewayClients
+
+if TYPE_CHECKING:
+    from redis.asyncio import Redis
+
+DEFAULT_PREFIX = "perf:pool"
+POOL_KEY = "entity_pool"
+# LPOP с количеством элементов появился в Redis 6.2
+MIN_REDIS_VERSION = (6, 2)
+
+
+class EntityPoolEmpty(LookupError):
+    """
+    В пуле не осталось сущностей нужного вида.
+    """
+
+
+def account_kind(account_type: str) -> str:
+    """
+    Вид сущности для счетов указанного типа, например "account:DEBIT_CARD".
+    """
+    return f"account:{account_type}"
+
+
+def card_kind(account_type: str, card_type: str) -> str:
+    """
+    Вид сущности для карт указанного типа на счетах указанного типа, например "card:CREDIT_CARD:PHYSICAL".
+    """
+    return f"card:{account_type}:{card_type}"
+
+
+def fixtures_entities(fixtures: Fixtures) -> dict[str, list[dict[str, Any]]]:
+    """
+    Раскладывает подготовленные данные по видам сущностей пула.
+
+    :return: Словарь {вид: сущности}; счета содержат id, userId и status,
+        карты — id, accountId, userId, status и paymentSystem.
+    """
+    entities: dict[str, list[dict[str, Any]]] = {}
+    for user in fixtures.users:
+        for account in user["accounts"]:
+            entities.setdefault(account_kind(account["type"]), []).append(
+                {"id": account["id"], "userId": user["id"], "status": account["status"]}
+            )
+            for card in account["cards"]:
+                entities.setdefault(card_kind(account["type"], card["type"]), []).append(
+                    {
+                        "id": card["id"],
+                        "accountId": account["id"],
+                        "userId": user["id"],
+                        "status": card["status"],
+                        "paymentSystem": card["paymentSystem"]
+                    }
+                )
+    return entities
+
+
+class EntityPool(Protocol):
+    """
+    Общий пул подготовленных сущностей: каждая выданная сущность принадлежит одному потребителю,
+    пока её не вернут через release().
+    """
+
+    async def fill(self, kind: str, entities: list[dict[str, Any]]) -> None:
+        ...
+
+    async def checkout(self, kind: str) -> dict[str, Any]:
+        ...
+
+    async def release(self, kind: str, entity: dict[str, Any]) -> None:
+        ...
+
+    async def size(self, kind: str) -> int:
+        ...
+
+    async def close(self) -> None:
+        ...
+
+
+class LocalEntityPool:
+    """
+    Пул сущностей в памяти процесса: для запуска в одном процессе и для работы без Redis.
+    """
+
+    def __init__(self) -> None:
+        self._queues: dict[str, deque[dict[str, Any]]] = {}
+
+    async def fill(self, kind: str, entities: list[dict[str, Any]]) -> None:
+        self._queues.setdefault(kind, deque()).extend(entities)
+
+    async def checkout(self, kind: str) -> dict[str, Any]:
+        queue = self._queues.get(kind)
+        if not queue:
+            raise EntityPoolEmpty(f"No {kind} entities left in the pool")
+        return queue.popleft()
+
+    async def release(self, kind: str, entity: dict[str, Any]) -> None:
+        self._queues.setdefault(kind, deque()).append(entity)
+
+    async def size(self, kind: str) -> int:
+        return len(self._queues.get(kind, ()))
+
+    async def close(self) -> None:
+        pass
+
+
+class RedisEntityPool:
+    """
+    Пул сущностей в Redis, общий для всех процессов и машин генераторов нагрузки.
+
+    Каждый вид сущностей хранится в отдельном списке "<prefix>:<вид>". Выдача забирает из списка
+    сразу batch сущностей одной атомарной командой LPOP с count, поэтому разные генераторы
+    никогда не получают одну и ту же сущность, а большинство checkout() обслуживается
+    из локального буфера без обращения к Redis. Возвращённые сущности сначала снова попадают
+    в локальный буфер, а его излишек одной пачкой отправляется обратно в Redis.
+
+    LPOP с count требует Redis 6.2 или новее (см. check_server).
+
+    :param redis: Асинхронный клиент redis.asyncio.Redis.
+    :param prefix: Префикс ключей пула.
+    :param batch: Сколько сущностей забирать из Redis за одну команду.
+    """
+
+    def __init__(self, redis: "Redis", prefix: str = DEFAULT_PREFIX, batch: int = 100) -> None:
+        self.redis = redis
+        self.prefix = prefix
+        self.batch = batch
+        self._buffers: dict[str, deque[dict[str, Any]]] = {}
+
+    @classmethod
+    def from_url(cls, url: str, prefix: str = DEFAULT_PREFIX, batch: int = 100) -> "RedisEntityPool":
+        """
+        Создаёт пул по адресу Redis, например redis://redis:6379/0.
+        """
+        from redis.asyncio import Redis
+
+        return cls(Redis.from_url(url), prefix, batch)
+
+    def _key(self, kind: str) -> str:
+        return f"{self.prefix}:{kind}"
+
+    async def check_server(self) -> None:
+        """
+        Проверяет, что сервер поддерживает LPOP с count: на Redis старше 6.2 команда
+        с лишним аргументом завершилась бы ошибкой уже во время теста.
+
+        :raises RuntimeError: Если версия Redis ниже MIN_REDIS_VERSION.
+        """
+        version = str((await self.redis.info("server"))["redis_version"])
+        if tuple(int(part) for part in version.split(".")[:2]) < MIN_REDIS_VERSION:
+            required = ".".join(map(str, MIN_REDIS_VERSION))
+            raise RuntimeError(f"Redis {version} does not support LPOP with count, {required} or newer is required")
+
+    async def fill(self, kind: str, entities: list[dict[str, Any]]) -> None:
+        """
+        Добавляет сущности в общий пул одним конвейером команд.
+        """
+        async with self.redis.pipeline(transaction=False) as pipeline:
+            for start in range(0, len(entities), 10_000):
+                chunk = entities[start:start + 10_000]
+                pipeline.rpush(self._key(kind), *(json.dumps(entity, separators=(",", ":")) for entity in chunk))
+            await pipeline.execute()
+
+    async def prefetch(self, *kinds: str) -> None:
+        """
+        Забирает по batch сущностей каждого вида в локальный буфер одним конвейером команд,
+        например перед стартом нагрузки.
+        """
+        async with self.redis.pipeline(transaction=False) as pipeline:
+            for kind in kinds:
+                pipeline.lpop(self._key(kind), self.batch)
+            results = await pipeline.execute()
+        for kind, values in zip(kinds, results):
+            self._buffers.setdefault(kind, deque()).extend(json.loads(value) for value in values or ())
+
+    async def checkout(self, kind: str) -> dict[str, Any]:
+        buffer = self._buffers.get(kind)
+        if not buffer:
+            await self.prefetch(kind)
+            buffer = self._buffers[kind]
+            if not buffer:
+                raise EntityPoolEmpty(f"No {kind} entities left in the pool")
+        return buffer.popleft()
+
+    async def release(self, kind: str, entity: dict[str, Any]) -> None:
+        buffer = self._buffers.setdefault(kind, deque())
+        buffer.append(entity)
+        if len(buffer) >= 2 * self.batch:
+            surplus = [buffer.pop() for _ in range(self.batch)]
+            await self.redis.rpush(self._key(kind), *(json.dumps(item, separators=(",", ":")) for item in surplus))
+
+    async def size(self, kind: str) -> int:
+        """
+        :return: Количество сущностей в общем пуле и в локальном буфере.
+        """
+        return await self.redis.llen(self._key(kind)) + len(self._buffers.get(kind, ()))
+
+    async def close(self) -> None:
+        """
+        Возвращает в общий пул всё, что осталось в локальном буфере, и закрывает соединение.
+        """
+        buffers = {kind: buffer for kind, buffer in self._buffers.items() if buffer}
+        if buffers:
+            async with self.redis.pipeline(transaction=False) as pipeline:
+                for kind, buffer in buffers.items():
+                    pipeline.lpush(self._key(kind), *(json.dumps(item, separators=(",", ":")) for item in buffer))
+                await pipeline.execute()
+        self._buffers.clear()
+        await self.redis.aclose()
+
+
+def build_entity_pool(url: str | None = None, prefix: str = DEFAULT_PREFIX, batch: int = 100) -> EntityPool:
+    """
+    Создаёт пул сущностей: общий в Redis, если указан адрес, иначе в памяти процесса.
+
+    :param url: Адрес Redis, например redis://redis:6379/0.
+    :param prefix: Префикс ключей пула в Redis.
+    :param batch: Сколько сущностей забирать из Redis за одну команду.
+    """
+    if url is None:
+        return LocalEntityPool()
+    return RedisEntityPool.from_url(url, prefix, batch)
+
+
+async def fill_entity_pool(pool: EntityPool, fixtures: Fixtures) -> dict[str, int]:
+    """
+    Заполняет пул подготовленными данными.
+
+    :return: Количество добавленных сущностей по видам.
+    """
+    entities = fixtures_entities(fixtures)
+    for kind, items in entities.items():
+        await pool.fill(kind, items)
+    return {kind: len(items) for kind, items in entities.items()}
+
+
+@dataclass(frozen=True)
+class EntityPoolSetup:
+    """
+    Подготовка общего состояния сценариев: создаёт пул сущностей и кладёт его в состояние под ключом POOL_KEY,
+    откуда сценарии берут сущности через await ctx.state[POOL_KEY].checkout(card_kind("DEBIT_CARD", "VIRTUAL")).
+
+    Передаётся в LoadPlan.setup и сериализуется через pickle, а соединение с Redis открывается уже в процессе
+    генератора. Пул в Redis заполняется заранее (python -m fixtures --redis-url ...) и общий для всех генераторов.
+    Без url пул создаётся в памяти процесса и заполняется из файла fixtures: LoadPlan.share передаёт подготовке
+    долю воркера (см. share), поэтому процессы и машины генераторов получают непересекающиеся сущности.
+
+    :param url: Адрес Redis, например redis://redis:6379/0 (None — пул в памяти процесса).
+    :param fixtures: Файл, сохранённый через Fixtures.save(), для пула в памяти процесса.
+    :param prefix: Префикс ключей пула в Redis.
+    :param batch: Сколько сущностей забирать из Redis за одну команду.
+    :param worker: Номер первой доли, от 0 до workers - 1.
+    :param workers: Количество долей.
+    :param count: Сколько подряд идущих долей принадлежит генератору.
+    """
+    url: str | None = None
+    fixtures: str | None = None
+    prefix: str = DEFAULT_PREFIX
+    batch: int = 100
+    worker: int = 0
+    workers: int = 1
+    count: int = 1
+
+    def __post_init__(self) -> None:
+        if (self.url is None) == (self.fixtures is None):
+            raise ValueError("Exactly one of url or fixtures must be set")
+
+    def share(self, worker: int, workers: int, count: int = 1) -> "EntityPoolSetup":
+        """
+        Часть своих сущностей для count подряд идущих воркеров, начиная с worker, из workers
+        (аргументы как у LoadPlan.share).
+        """
+        return replace(
+            self,
+            worker=self.worker * workers + worker * self.count,
+            workers=self.workers * workers,
+            count=self.count * count
+        )
+
+    async def __call__(self, clients: GatewayClients) -> dict[str, EntityPool]:
+        if self.url is not None:
+            pool = RedisEntityPool.from_url(self.url, self.prefix, self.batch)
+            try:
+                await pool.check_server()
+            except BaseException:
+                await pool.close()
+                raise
+            return {POOL_KEY: pool}
+
+        pool = LocalEntityPool()
+        start, stop = self.worker, self.worker + self.count
+        for kind, items in fixtures_entities(Fixtures.load(self.fixtures)).items():
+            await pool.fill(kind, items[len(items) * start // self.workers:len(items) * stop // self.workers])
+        return {POOL_KEY: pool}
+
+    async def close(self, state: dict[str, Any]) -> None:
+        """
+        Возвращает в Redis сущности из локальных буферов и закрывает соединение (см. load.plan.close_setup).
+        """
+        pool = state.get(POOL_KEY)
+        if pool is not None:
+            await pool.close()
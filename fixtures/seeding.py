@@ -0,0 +1,321 @@
+import asyncio
+import json
+import random
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Awaitable, Callable, TypedDict
+
+from httpx import Response, TransportError
+
+from clients.http.gateway.cards.client import CardDict
+from fixtures.payloads import get_payload_factory
+from load.scenario import GatewayClients
+
+FIXTURES_VERSION = 1
+
+ACCOUNT_TYPES = ("DEPOSIT", "SAVINGS", "DEBIT_CARD", "CREDIT_CARD")
+CARD_ACCOUNT_TYPES = ("DEBIT_CARD", "CREDIT_CARD")
+CARD_TYPES = ("VIRTUAL", "PHYSICAL")
+
+# 409 повторяется только для create_user: повторный запрос уходит с новым email из PayloadFactory
+RETRY_STATUSES = frozenset({409, 429, 500, 502, 503, 504})
+
+
+class SeededCardDict(TypedDict):
+    """
+    Описание структуры подготовленной карты.
+    """
+    id: str
+    type: str
+    status: str
+    paymentSystem: str
+
+
+class SeededAccountDict(TypedDict):
+    """
+    Описание структуры подготовленного счёта.
+    """
+    id: str
+    userId: str
+    type: str
+    status: str
+    cards: list[SeededCardDict]
+
+
+class SeededUserDict(TypedDict):
+    """
+    Описание структуры подготовленного пользователя со всеми его счетами.
+    """
+    id: str
+    email: str
+    accounts: list[SeededAccountDict]
+
+
+@dataclass(frozen=True)
+class SeedConfig:
+    """
+    Настройки подготовки тестовых данных.
+
+    :param users: Сколько пользователей создать.
+    :param account_types: Какие счета открыть каждому пользователю (по умолчанию все четыре типа).
+    :param card_types: Какие карты дополнительно выпустить на каждый карточный счёт
+        (счета DEBIT_CARD и CREDIT_CARD уже открываются с виртуальной и физической картой).
+    :param concurrency: Максимальное количество одновременных запросов к http-gateway.
+    :param retries: Сколько раз повторять запрос при сетевой ошибке или ответе из RETRY_STATUSES.
+    :param backoff: Базовая пауза перед повтором в секундах, удваивается с каждой попыткой.
+    """
+    users: int
+    account_types: tuple[str, ...] = ACCOUNT_TYPES
+    card_types: tuple[str, ...] = ()
+    concurrency: int = 20
+    retries: int = 3
+    backoff: float = 0.2
+
+
+class SeedError(Exception):
+    """
+    Запрос подготовки данных не удался после всех повторов.
+    """
+
+
+def _card(card: CardDict) -> SeededCardDict:
+    return SeededCardDict(id=card["id"], type=card["type"], status=card["status"], paymentSystem=card["paymentSystem"])
+
+
+class FixtureSeeder:
+    """
+    Параллельно создаёт пользователей со счетами и картами через клиентов http-gateway.
+
+    Пользователи создаются concurrency воркерами, счета одного пользователя открываются одновременно,
+    а общее количество запросов в полёте ограничено семафором. Пользователь, для которого
+    какой-то запрос не удался после всех повторов, не попадает в результат и учитывается в failed.
+
+    :param clients: Набор асинхронных клиентов http-gateway.
+    :param config: Настройки подготовки данных.
+    :param on_progress: Вызывается после каждого пользователя с количеством готовых и неудачных.
+    """
+
+    def __init__(
+            self,
+            clients: GatewayClients,
+            config: SeedConfig,
+            on_progress: Callable[[int, int], None] | None = None
+    ) -> None:
+        self.clients = clients
+        self.config = config
+        self.on_progress = on_progress
+        self.users: list[SeededUserDict] = []
+        self.failed = 0
+        self._remaining = config.users
+        self._semaphore = asyncio.Semaphore(config.concurrency)
+
+    async def _call(self, send: Callable[[], Awaitable[Response]]) -> dict[str, Any]:
+        """
+        Выполняет запрос с повторами.
+
+        :param send: Функция, отправляющая запрос; вызывается заново на каждую попытку.
+        :return: Разобранное тело успешного ответа.
+        """
+        for attempt in range(self.config.retries + 1):
+            async with self._semaphore:
+                try:
+                    response = await send()
+                except TransportError as error:
+                    reason = repr(error)
+                else:
+                    if not response.is_error:
+                        return response.json()
+                    if response.status_code not in RETRY_STATUSES:
+                        raise SeedError(f"{response.request.url} returned {response.status_code}: {response.text}")
+                    reason = f"{response.status_code}: {response.text}"
+            if attempt < self.config.retries:
+                await asyncio.sleep(self.config.backoff * 2 ** attempt * (0.5 + random.random()))
+        raise SeedError(f"Request failed after {self.config.retries} retries: {reason}")
+
+    async def _create_user(self) -> dict[str, Any]:
+        factory = get_payload_factory()
+        return (await self._call(lambda: self.clients.users.create_user_api(factory.create_user_request())))["user"]
+
+    async def _open_account(self, user_id: str, account_type: str) -> SeededAccountDict:
+        accounts = self.clients.accounts
+        open_account_api = {
+            "DEPOSIT": accounts.open_deposit_account_api,
+            "SAVINGS": accounts.open_savings_account_api,
+            "DEBIT_CARD": accounts.open_debit_card_account_api,
+            "CREDIT_CARD": accounts.open_credit_card_account_api,
+        }[account_type]
+        account = (await self._call(lambda: open_account_api({"userId": user_id})))["account"]
+        seeded = SeededAccountDict(
+            id=account["id"],
+            userId=user_id,
+            type=account["type"],
+            status=account["status"],
+            cards=[_card(card) for card in account["cards"]]
+        )
+
+        if account_type in CARD_ACCOUNT_TYPES:
+            issue_card_apis = {
+                "VIRTUAL": self.clients.cards.issue_virtual_card_api,
+                "PHYSICAL": self.clients.cards.issue_physical_card_api,
+            }
+            for card_type in self.config.card_types:
+                issue_card_api = issue_card_apis[card_type]
+                request = {"userId": user_id, "accountId": account["id"]}
+                card = (await self._call(lambda: issue_card_api(request)))["card"]
+                seeded["cards"].append(_card(card))
+        return seeded
+
+    async def _seed_user(self) -> SeededUserDict:
+        user = await self._create_user()
+        accounts = await asyncio.gather(
+            *(self._open_account(user["id"], account_type) for account_type in self.config.account_types),
+            return_exceptions=True
+        )
+        for account in accounts:
+            if isinstance(account, BaseException):
+                raise account
+        return SeededUserDict(id=user["id"], email=user["email"], accounts=list(accounts))
+
+    async def _worker(self) -> None:
+        while self._remaining > 0:
+            self._remaining -= 1
+            try:
+                self.users.append(await self._seed_user())
+            except SeedError:
+                self.failed += 1
+            if self.on_progress is not None:
+                self.on_progress(len(self.users), self.failed)
+
+    async def run(self) -> list[SeededUserDict]:
+        """
+        Создаёт config.users пользователей.
+
+        :return: Успешно подготовленные пользователи.
+        """
+        await asyncio.gather(*(self._worker() for _ in range(min(self.config.concurrency, self.config.users))))
+        return self.users
+
+
+class Fixtures:
+    """
+    Подготовленные тестовые данные с индексами по типу счёта для быстрого выбора сущностей в сценариях.
+
+    :param users: Пользователи со счетами и картами.
+    """
+
+    def __init__(self, users: list[SeededUserDict]) -> None:
+        self.users = users
+        self.accounts: dict[str, list[SeededAccountDict]] = {}
+        for user in users:
+            for account in user["accounts"]:
+                self.accounts.setdefault(account["type"], []).append(account)
+
+    def random_user(self) -> SeededUserDict:
+        return random.choice(self.users)
+
+    def random_account(self, account_type: str) -> SeededAccountDict:
+        """
+        :param account_type: DEPOSIT, SAVINGS, DEBIT_CARD или CREDIT_CARD.
+        """
+        accounts = self.accounts.get(account_type)
+        if not accounts:
+            raise LookupError(f"No seeded {account_type} accounts")
+        return random.choice(accounts)
+
+    def save(self, path: str | Path) -> None:
+        """
+        Сохраняет данные в компактном виде: сущности записываются списками значений без имён полей.
+        """
+        users = [
+            [
+                user["id"],
+                user["email"],
+                [
+                    [
+                        account["id"],
+                        account["type"],
+                        account["status"],
+                        [[card["id"], card["type"], card["status"], card["paymentSystem"]] for card in account["cards"]]
+                    ]
+                    for account in user["accounts"]
+                ]
+            ]
+            for user in self.users
+        ]
+        Path(path).write_text(json.dumps({"version": FIXTURES_VERSION, "users": users}, separators=(",", ":")))
+
+    @classmethod
+    def load(cls, path: str | Path) -> "Fixtures":
+        """
+        Загружает данные, сохранённые через save().
+        """
+        data = json.loads(Path(path).read_text())
+        if data.get("version") != FIXTURES_VERSION:
+            raise ValueError(f"Unsupported fixtures version: {data.get('version')}")
+
+        users = []
+        for user_id, email, accounts in data["users"]:
+            users.append(
+                SeededUserDict(
+                    id=user_id,
+                    email=email,
+                    accounts=[
+                        SeededAccountDict(
+                            id=account_id,
+                            userId=user_id,
+                            type=account_type,
+                            status=status,
+                            cards=[
+                                SeededCardDict(id=card_id, type=card_type, status=card_status, paymentSystem=system)
+                                for card_id, card_type, card_status, system in cards
+                            ]
+                        )
+                        for account_id, account_type, status, cards in accounts
+                    ]
+                )
+            )
+        return cls(users)
+
+
+async def seed_fixtures(
+        clients: GatewayClients,
+        config: SeedConfig,
+        path: str | Path | None = None,
+        on_progress: Callable[[int, int], None] | None = None
+) -> Fixtures:
+    """
+    Подготавливает тестовые данные и, если указан путь, сохраняет их в файл.
+
+    :param clients: Набор асинхронных клиентов http-gateway.
+    :param config: Настройки подготовки данных.
+    :param path: Файл для сохранения.
+    :param on_progress: Вызывается после каждого пользователя с количеством готовых и неудачных.
+    :return: Подготовленные данные.
+    """
+    fixtures = Fixtures(await FixtureSeeder(clients, config, on_progress).run())
+    if path is not None:
+        fixtures.save(path)
+    return fixtures
+
+
+@dataclass(frozen=True)
+class FixturesSetup:
+    """
+    Подготовка общего состояния open-model сценариев из файла с данными вместо создания
+    пользователя и счёта при каждом запуске (замена load.flows.setup_debit_card_account).
+
+    Передаётся в LoadPlan.setup и, в отличие от замыкания, сериализуется через pickle
+    для запуска в нескольких процессах и на нескольких машинах.
+
+    :param path: Файл, сохранённый через Fixtures.save().
+    :param account_type: Тип счёта, который выбирается случайно из подготовленных.
+    """
+    path: str
+    account_type: str = "DEBIT_CARD"
+
+    async def __call__(self, clients: GatewayClients) -> dict[str, str]:
+        account = Fixtures.load(self.path).random_account(self.account_type)
+        state = {"user_id": account["userId"], "account_id": account["id"]}
+        if account["cards"]:
+            state["card_id"] = account["cards"][0]["id"]
+        return state
@@ -0,0 +1,329 @@
+import random
+import sqlite3
+from array import array
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterable, TypedDict
+
+from fixtures.seeding import Fixtures, SeededUserDict
+from load.scenario import GatewayClients
+
+STORE_KEY = "fixture_store"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS users (
+    rowid INTEGER PRIMARY KEY,
+    id TEXT NOT NULL UNIQUE,
+    email TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS accounts (
+    rowid INTEGER PRIMARY KEY,
+    id TEXT NOT NULL UNIQUE,
+    user_id TEXT NOT NULL,
+    type TEXT NOT NULL,
+    status TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS cards (
+    rowid INTEGER PRIMARY KEY,
+    id TEXT NOT NULL UNIQUE,
+    account_id TEXT NOT NULL,
+    user_id TEXT NOT NULL,
+    account_type TEXT NOT NULL,
+    account_status TEXT NOT NULL,
+    type TEXT NOT NULL,
+    status TEXT NOT NULL,
+    payment_system TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS accounts_type_status ON accounts (type, status);
+CREATE INDEX IF NOT EXISTS cards_account_type_type_status ON cards (account_type, type, status, payment_system);
+CREATE INDEX IF NOT EXISTS cards_type_status ON cards (type, status, payment_system);
+"""
+
+
+class StoredAccountDict(TypedDict):
+    """
+    Описание структуры счёта из хранилища тестовых данных.
+    """
+    id: str
+    userId: str
+    type: str
+    status: str
+
+
+class StoredCardDict(TypedDict):
+    """
+    Описание структуры карты из хранилища тестовых данных вместе с типом и статусом её счёта.
+    """
+    id: str
+    accountId: str
+    userId: str
+    accountType: str
+    accountStatus: str
+    type: str
+    status: str
+    paymentSystem: str
+
+
+def _where(filters: dict[str, str | None]) -> tuple[str, tuple[str, ...]]:
+    conditions = [(column, value) for column, value in filters.items() if value is not None]
+    if not conditions:
+        return "", ()
+    return " WHERE " + " AND ".join(f"{column} = ?" for column, _ in conditions), tuple(v for _, v in conditions)
+
+
+class FixtureStore:
+    """
+    Индексированное хранилище подготовленных пользователей, счетов и карт в SQLite.
+
+    Для каждого набора фильтров (например, CREDIT_CARD + PHYSICAL + ACTIVE) при первом запросе
+    по индексу выбираются номера подходящих строк и сохраняются в памяти процесса.
+    Дальше случайный выбор и выдача по кругу стоят O(1) плюс чтение одной строки по первичному ключу,
+    поэтому выбор данных почти ничего не стоит и на миллионах записей.
+
+    Соединение с SQLite не передаётся между процессами: каждый процесс открывает хранилище сам
+    (см. FixtureStoreSetup).
+
+    :param path: Файл базы данных (":memory:" — база в памяти процесса).
+    :param worker: Номер первой доли процесса-генератора, от 0 до workers - 1.
+    :param workers: Количество долей: подходящие сущности делятся на workers подряд идущих частей,
+        и процесс видит только свои, поэтому выдача по кругу в разных процессах не пересекается.
+    :param count: Сколько подряд идущих долей, начиная с worker, принадлежит процессу.
+    """
+
+    def __init__(self, path: str | Path = ":memory:", worker: int = 0, workers: int = 1, count: int = 1) -> None:
+        if worker < 0 or count < 1 or worker + count > workers:
+            raise ValueError(f"Invalid share {worker}+{count} of {workers}")
+
+        self.path = str(path)
+        self.worker = worker
+        self.workers = workers
+        self.count = count
+        self.connection = sqlite3.connect(self.path)
+        self.connection.executescript(SCHEMA)
+        self._rowids: dict[tuple, array] = {}
+        self._cursors: dict[tuple, int] = {}
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def add_users(self, users: Iterable[SeededUserDict]) -> None:
+        """
+        Добавляет пользователей со всеми счетами и картами одной транзакцией.
+        Уже сохранённые сущности пропускаются.
+        """
+        user_rows, account_rows, card_rows = [], [], []
+        for user in users:
+            user_rows.append((user["id"], user["email"]))
+            for account in user["accounts"]:
+                account_rows.append((account["id"], user["id"], account["type"], account["status"]))
+                for card in account["cards"]:
+                    card_rows.append(
+                        (
+                            card["id"], account["id"], user["id"], account["type"], account["status"],
+                            card["type"], card["status"], card["paymentSystem"]
+                        )
+                    )
+
+        with self.connection:
+            self.connection.executemany("INSERT OR IGNORE INTO users (id, email) VALUES (?, ?)", user_rows)
+            self.connection.executemany(
+                "INSERT OR IGNORE INTO accounts (id, user_id, type, status) VALUES (?, ?, ?, ?)",
+                account_rows
+            )
+            self.connection.executemany(
+                "INSERT OR IGNORE INTO cards "
+                "(id, account_id, user_id, account_type, account_status, type, status, payment_system) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                card_rows
+            )
+        self._rowids.clear()
+        self._cursors.clear()
+
+    def add_fixtures(self, fixtures: Fixtures) -> None:
+        self.add_users(fixtures.users)
+
+    @classmethod
+    def from_fixtures_file(
+            cls,
+            fixtures_path: str | Path,
+            path: str | Path = ":memory:",
+            worker: int = 0,
+            workers: int = 1,
+            count: int = 1
+    ) -> "FixtureStore":
+        """
+        Создаёт хранилище из файла, сохранённого через Fixtures.save().
+        """
+        store = cls(path, worker, workers, count)
+        store.add_fixtures(Fixtures.load(fixtures_path))
+        return store
+
+    def _select_rowids(self, table: str, filters: dict[str, str | None]) -> array:
+        key = (table, *filters.items())
+        rowids = self._rowids.get(key)
+        if rowids is None:
+            where, params = _where(filters)
+            cursor = self.connection.execute(f"SELECT rowid FROM {table}{where} ORDER BY rowid", params)
+            rowids = array("q", (rowid for rowid, in cursor))
+            start, stop = self.worker, self.worker + self.count
+            rowids = rowids[len(rowids) * start // self.workers:len(rowids) * stop // self.workers]
+            self._rowids[key] = rowids
+        if not rowids:
+            conditions = ", ".join(f"{column}={value}" for column, value in filters.items() if value is not None)
+            raise LookupError(f"No {table} matching {conditions or 'any'}")
+        return rowids
+
+    def _next_rowid(self, table: str, filters: dict[str, str | None]) -> int:
+        rowids = self._select_rowids(table, filters)
+        key = (table, *filters.items())
+        position = self._cursors.get(key, 0)
+        self._cursors[key] = (position + 1) % len(rowids)
+        return rowids[position]
+
+    def _account(self, rowid: int) -> StoredAccountDict:
+        account_id, user_id, account_type, status = self.connection.execute(
+            "SELECT id, user_id, type, status FROM accounts WHERE rowid = ?", (rowid,)
+        ).fetchone()
+        return StoredAccountDict(id=account_id, userId=user_id, type=account_type, status=status)
+
+    def _card(self, rowid: int) -> StoredCardDict:
+        row = self.connection.execute(
+            "SELECT id, account_id, user_id, account_type, account_status, type, status, payment_system "
+            "FROM cards WHERE rowid = ?",
+            (rowid,)
+        ).fetchone()
+        card_id, account_id, user_id, account_type, account_status, card_type, status, payment_system = row
+        return StoredCardDict(
+            id=card_id,
+            accountId=account_id,
+            userId=user_id,
+            accountType=account_type,
+            accountStatus=account_status,
+            type=card_type,
+            status=status,
+            paymentSystem=payment_system
+        )
+
+    @staticmethod
+    def _account_filters(account_type: str | None, status: str | None) -> dict[str, str | None]:
+        return {"type": account_type, "status": status}
+
+    @staticmethod
+    def _card_filters(
+            account_type: str | None,
+            card_type: str | None,
+            status: str | None,
+            payment_system: str | None
+    ) -> dict[str, str | None]:
+        return {"account_type": account_type, "type": card_type, "status": status, "payment_system": payment_system}
+
+    def count_accounts(self, account_type: str | None = None, status: str | None = None) -> int:
+        return len(self._select_rowids("accounts", self._account_filters(account_type, status)))
+
+    def count_cards(
+            self,
+            account_type: str | None = None,
+            card_type: str | None = None,
+            status: str | None = None,
+            payment_system: str | None = None
+    ) -> int:
+        return len(self._select_rowids("cards", self._card_filters(account_type, card_type, status, payment_system)))
+
+    def sample_account(self, account_type: str | None = None, status: str | None = None) -> StoredAccountDict:
+        """
+        Случайный счёт с указанными типом и статусом.
+
+        :param account_type: DEPOSIT, SAVINGS, DEBIT_CARD или CREDIT_CARD.
+        :param status: Статус счёта, например ACTIVE.
+        """
+        rowids = self._select_rowids("accounts", self._account_filters(account_type, status))
+        return self._account(random.choice(rowids))
+
+    def checkout_account(self, account_type: str | None = None, status: str | None = None) -> StoredAccountDict:
+        """
+        Следующий по кругу счёт с указанными типом и статусом: подряд идущие вызовы,
+        например от разных виртуальных пользователей, получают разные счета.
+        """
+        return self._account(self._next_rowid("accounts", self._account_filters(account_type, status)))
+
+    def sample_card(
+            self,
+            account_type: str | None = None,
+            card_type: str | None = None,
+            status: str | None = None,
+            payment_system: str | None = None
+    ) -> StoredCardDict:
+        """
+        Случайная карта, например sample_card("CREDIT_CARD", "PHYSICAL", "ACTIVE").
+
+        :param account_type: Тип счёта карты.
+        :param card_type: VIRTUAL или PHYSICAL.
+        :param status: Статус карты.
+        :param payment_system: Платёжная система, например VISA.
+        """
+        filters = self._card_filters(account_type, card_type, status, payment_system)
+        return self._card(random.choice(self._select_rowids("cards", filters)))
+
+    def checkout_card(
+            self,
+            account_type: str | None = None,
+            card_type: str | None = None,
+            status: str | None = None,
+            payment_system: str | None = None
+    ) -> StoredCardDict:
+        """
+        Следующая по кругу карта с указанными параметрами (см. checkout_account).
+        """
+        filters = self._card_filters(account_type, card_type, status, payment_system)
+        return self._card(self._next_rowid("cards", filters))
+
+
+@dataclass(frozen=True)
+class FixtureStoreSetup:
+    """
+    Подготовка общего состояния сценариев: открывает FixtureStore и кладёт его в состояние
+    под ключом STORE_KEY, откуда сценарии берут сущности через ctx.state[STORE_KEY].checkout_card(...).
+
+    Передаётся в LoadPlan.setup и сериализуется через pickle, а хранилище открывается уже в процессе
+    генератора. LoadPlan.share передаёт подготовке долю воркера (см. share), поэтому при выдаче по кругу
+    процессы и машины генераторов получают непересекающиеся сущности.
+
+    :param path: Файл SQLite-хранилища или файл .json, сохранённый через Fixtures.save()
+        (тогда хранилище собирается в памяти процесса).
+    :param worker: Номер первой доли, от 0 до workers - 1.
+    :param workers: Количество долей.
+    :param count: Сколько подряд идущих долей принадлежит генератору.
+    """
+    path: str
+    worker: int = 0
+    workers: int = 1
+    count: int = 1
+
+    def share(self, worker: int, workers: int, count: int = 1) -> "FixtureStoreSetup":
+        """
+        Часть своих сущностей для count подряд идущих воркеров, начиная с worker, из workers
+        (аргументы как у LoadPlan.share).
+        """
+        return FixtureStoreSetup(
+            path=self.path,
+            worker=self.worker * workers + worker * self.count,
+            workers=self.workers * workers,
+            count=self.count * count
+        )
+
+    async def __call__(self, clients: GatewayClients) -> dict[str, FixtureStore]:
+        if self.path.endswith(".json"):
+            store = FixtureStore.from_fixtures_file(
+                self.path, worker=self.worker, workers=self.workers, count=self.count
+            )
+        else:
+            store = FixtureStore(self.path, self.worker, self.workers, self.count)
+        return {STORE_KEY: store}
+
+    async def close(self, state: dict[str, Any]) -> None:
+        """
+        Закрывает хранилище после нагрузки (см. load.plan.close_setup).
+        """
+        store = state.get(STORE_KEY)
+        if store is not None:
+            store.close()
@@ -1,13 +1,8 @@
-import time
 import httpx
 
-create_user_payload = {
-    "email": f"user{time.time()}@example.com",
-    "lastName": "string",
-    "firstName": "string",
-    "middleName": "string",
-    "phoneNumber": "string"
-}
+from fixtures.payloads import get_payload_factory
+
+create_user_payload = get_payload_factory().create_user_request()
 
 create_user_response = httpx.post(url="http://localhost:8003/api/v1/users", json=create_user_payload)
 user_id = create_user_response.json()['user']['id']
@@ -0,0 +1,230 @@
+import asyncio
+import itertools
+import random
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Iterator
+
+from load.scenario import Scenario, ScenarioContext, GatewayClients
+from metrics.recorder import MetricsRecorder
+
+SPIN_THRESHOLD_NS = 1_000_000
+
+
+@dataclass(frozen=True)
+class ConstantRate:
+    """
+    Постоянная интенсивность: запросы отправляются через равные промежутки времени.
+
+    :param rps: Количество запусков в секунду.
+    :param duration: Длительность в секундах.
+    :param phase: Сдвиг первого запуска в секундах.
+    """
+    rps: float
+    duration: float
+    phase: float = 0
+
+    def __post_init__(self) -> None:
+        if self.rps <= 0:
+            raise ValueError(f"rps must be positive, got {self.rps}")
+
+    def scaled(self, factor: float, worker: int = 0) -> "ConstantRate":
+        """
+        Доля интенсивности для одного из нескольких воркеров.
+
+        Запуски воркеров сдвинуты друг относительно друга,
+        чтобы суммарный поток оставался равномерным, а не приходил пачками.
+
+        :param factor: Доля от общей интенсивности.
+        :param worker: Номер воркера.
+        """
+        return ConstantRate(rps=self.rps * factor, duration=self.duration, phase=self.phase + worker / self.rps)
+
+    def arrivals(self) -> Iterator[float]:
+        """
+        :return: Запланированные моменты запусков в секундах от начала теста.
+        """
+        interval = 1 / self.rps
+        for index in itertools.count():
+            offset = self.phase + index * interval
+            if offset >= self.duration:
+                return
+            yield offset
+
+
+@dataclass(frozen=True)
+class StepRate:
+    """
+    Ступенчатая интенсивность: каждая ступень задаётся парой (длительность, rps).
+
+    :param steps: Ступени нагрузки, ступень с rps = 0 — пауза.
+    :param phase: Сдвиг запусков внутри каждой ступени в долях интервала между запусками.
+    """
+    steps: tuple[tuple[float, float], ...]
+    phase: float = 0
+
+    def __post_init__(self) -> None:
+        for duration, rps in self.steps:
+            if rps < 0:
+                raise ValueError(f"rps must not be negative, got {rps}")
+
+    @property
+    def duration(self) -> float:
+        return sum(duration for duration, _ in self.steps)
+
+    def scaled(self, factor: float, worker: int = 0) -> "StepRate":
+        """
+        Доля интенсивности для одного из нескольких воркеров.
+
+        Как и в ConstantRate, запуски воркеров сдвинуты друг относительно друга на каждой ступени.
+        Сдвиг хранится в долях интервала, поэтому он сохраняется при повторном делении
+        (например, между процессами распределённого генератора).
+
+        :param factor: Доля от общей интенсивности.
+        :param worker: Номер воркера.
+        """
+        return StepRate(
+            steps=tuple((duration, rps * factor) for duration, rps in self.steps),
+            phase=(self.phase + worker) * factor
+        )
+
+    def arrivals(self) -> Iterator[float]:
+        started = 0.0
+        for duration, rps in self.steps:
+            if rps > 0:
+                for offset in ConstantRate(rps=rps, duration=duration, phase=self.phase / rps).arrivals():
+                    yield started + offset
+            started += duration
+
+
+@dataclass(frozen=True)
+class PoissonRate:
+    """
+    Пуассоновский поток: интервалы между запусками распределены экспоненциально со средним 1 / rps.
+
+    :param rps: Средняя интенсивность в секунду.
+    :param duration: Длительность в секундах.
+    :param seed: Зерно генератора для воспроизводимости.
+    """
+    rps: float
+    duration: float
+    seed: int | None = None
+
+    def __post_init__(self) -> None:
+        if self.rps <= 0:
+            raise ValueError(f"rps must be positive, got {self.rps}")
+
+    def scaled(self, factor: float, worker: int = 0) -> "PoissonRate":
+        # У каждого воркера свой поток случайных чисел, иначе их запуски совпадут во времени
+        seed = None if self.seed is None else self.seed + worker
+        return PoissonRate(rps=self.rps * factor, duration=self.duration, seed=seed)
+
+    def arrivals(self) -> Iterator[float]:
+        generator = random.Random(self.seed)
+        offset = generator.expovariate(self.rps)
+        while offset < self.duration:
+            yield offset
+            offset += generator.expovariate(self.rps)
+
+
+ArrivalRate = ConstantRate | StepRate | PoissonRate
+Setup = Callable[[GatewayClients], Awaitable[dict[str, Any]]]
+
+
+class OpenModelScheduler:
+    """
+    Планировщик нагрузки по открытой модели: запускает итерации сценариев с заданной интенсивностью
+    независимо от того, как быстро отвечает сервис.
+
+    Латентность итерации считается от запланированного момента запуска, а не от фактического,
+    поэтому задержки самого генератора и насыщение сервиса не скрывают хвост распределения
+    (коррекция coordinated omission). Время обработки от фактического запуска сохраняется
+    отдельно в метрике "<сценарий>:service_time".
+
+    :param rate: Интенсивность запусков.
+    :param scenarios: Сценарии с весами.
+    :param clients: Набор клиентов http-gateway.
+    :param recorder: Хранилище замеров.
+    :param setup: Подготовка общего состояния сценариев (например, создание счёта и карты).
+    :param max_in_flight: Ограничение на количество одновременно выполняемых итераций,
+        запуски сверх него не выполняются и учитываются в метрике "dropped".
+    """
+
+    def __init__(
+            self,
+            rate: ArrivalRate,
+            scenarios: list[Scenario],
+            clients: GatewayClients,
+            recorder: MetricsRecorder | None = None,
+            setup: Setup | None = None,
+            max_in_flight: int = 10_000
+    ) -> None:
+        if not scenarios:
+            raise ValueError("At least one scenario is required")
+
+        self.rate = rate
+        self.scenarios = scenarios
+        self.clients = clients
+        self.recorder = recorder or MetricsRecorder()
+        self.setup = setup
+        self.max_in_flight = max_in_flight
+        self.state: dict[str, Any] = {}
+        self._cum_weights = list(itertools.accumulate(scenario.weight for scenario in scenarios))
+        self._in_flight: set[asyncio.Task] = set()
+        self._stopped = False
+
+    def stop(self) -> None:
+        """
+        Прекращает запуски новых итераций; run() дождётся уже запущенных и завершится.
+        """
+        self._stopped = True
+
+    async def _fire(self, scenario: Scenario, arrival: int, intended_ns: int) -> None:
+        ctx = ScenarioContext(self.clients, self.recorder, scenario.name, arrival, self.state)
+        started_ns = time.perf_counter_ns()
+        error = False
+        try:
+            await scenario.flow(ctx)
+        except Exception:
+            error = True
+        finished_ns = time.perf_counter_ns()
+        self.recorder.record(scenario.name, finished_ns - intended_ns, error)
+        self.recorder.record(f"{scenario.name}:service_time", finished_ns - started_ns, error)
+
+    async def run(self) -> MetricsRecorder:
+        """
+        Выполняет запуски по расписанию и дожидается завершения всех итераций.
+
+        :return: Хранилище с замерами.
+        """
+        if self.setup is not None:
+            self.state.update(await self.setup(self.clients))
+        self.recorder.start()
+
+        scenarios, cum_weights = self.scenarios, self._cum_weights
+        in_flight = self._in_flight
+        started_ns = time.perf_counter_ns()
+
+        for arrival, offset in enumerate(self.rate.arrivals()):
+            intended_ns = started_ns + int(offset * 1e9)
+
+            # Длинные паузы ждём через event loop, а последнюю миллисекунду добираем
+            # кооперативным опросом часов: asyncio.sleep не даёт точности лучше ~1 мс.
+            while (delay_ns := intended_ns - time.perf_counter_ns()) > 0:
+                await asyncio.sleep((delay_ns - SPIN_THRESHOLD_NS) / 1e9 if delay_ns > SPIN_THRESHOLD_NS else 0)
+
+            if self._stopped:
+                break
+            if len(in_flight) >= self.max_in_flight:
+                self.recorder.record("dropped", 0, error=True)
+                continue
+
+            scenario = random.choices(scenarios, cum_weights=cum_weights)[0]
+            task = asyncio.create_task(self._fire(scenario, arrival, intended_ns))
+            in_flight.add(task)
+            task.add_done_callback(in_flight.discard)
+
+        if in_flight:
+            await asyncio.gather(*in_flight)
+
+        return self.recorder
@@ -0,0 +1,332 @@
+import asyncio
+import math
+import time
+from collections import deque
+from dataclasses import dataclass
+from functools import partial
+from typing import Any, Awaitable, Callable, TypedDict
+
+from load.arrival import ConstantRate, OpenModelScheduler
+from load.engine import LoadEngine
+from load.plan import LoadPlan, close_setup
+from load.scenario import GatewayClients, build_gateway_clients
+from metrics.recorder import MetricStats, MetricsRecorder
+from metrics.steady import SteadyStateDetector
+
+CLOSED, OPEN = "closed", "open"
+# Ступени по умолчанию: виртуальные пользователи для закрытой модели, запуски в секунду для открытой
+DEFAULT_START = {CLOSED: 1, OPEN: 10}
+DEFAULT_MAX_LEVEL = {CLOSED: 4096, OPEN: 100_000}
+# Точность уточнения границы в открытой модели: относительная разница между последней успешной и первой неуспешной
+OPEN_RESOLUTION = 0.05
+
+
+@dataclass(frozen=True)
+class CapacitySLO:
+    """
+    Условия, при которых нагрузка считается допустимой.
+
+    :param p99: Максимальный p99 латентности целевой метрики в миллисекундах.
+    :param error_rate: Максимальная доля ошибок целевой метрики.
+    :param min_scaling: Минимальная отдача от роста нагрузки: если при увеличении ступени на x%
+        пропускная способность выросла меньше чем на min_scaling * x%, сервис насыщен (0 — не проверять).
+    """
+    p99: float
+    error_rate: float = 0.01
+    min_scaling: float = 0.5
+
+
+class CapacityPointDict(TypedDict):
+    """
+    Описание структуры одной точки кривой «латентность — пропускная способность» (латентности в миллисекундах).
+    """
+    level: float
+    rps: float
+    count: int
+    errors: int
+    error_rate: float
+    dropped: int
+    mean: float
+    p50: float
+    p90: float
+    p99: float
+    steady: bool
+    duration: float
+    passed: bool
+    reason: str
+
+
+class CapacityResultDict(TypedDict):
+    """
+    Описание структуры результата поиска предельной нагрузки.
+    """
+    metric: str
+    model: str
+    max_rps: float
+    level: float | None
+    limit: str
+    points: list[CapacityPointDict]
+
+
+class CapacitySearch:
+    """
+    Поиск максимальной нагрузки, которую http-gateway выдерживает в рамках SLO.
+
+    Нагрузка увеличивается ступенями в factor раз, пока целевая метрика не нарушит SLO
+    (p99, доля ошибок или насыщение пропускной способности), после чего граница уточняется
+    делением пополам между последней успешной и первой неуспешной ступенью.
+    Ступень измеряется окнами по window секунд: первые окна, пока пул соединений и сервис
+    прогреваются, отбрасываются, а в точку кривой попадают последние steady_windows окон
+    установившегося режима (см. SteadyStateDetector). Если режим не установился за max_step_duration,
+    точка сохраняется с steady=False и считается неуспешной (причина "unsteady"): её замеры не описывают
+    пропускную способность, которую сервис держит.
+
+    Модель нагрузки берётся из плана: для плана с stages ступенью служит количество виртуальных
+    пользователей, для плана с rate — интенсивность запусков в секунду; сами этапы и интенсивность
+    плана не используются. Пул соединений и состояние setup общие для всех ступеней.
+    Нагрузка создаётся в текущем процессе, поэтому предел генератора — одно ядро CPython.
+
+    :param plan: План со сценариями и настройками клиентов.
+    :param slo: Условия допустимой нагрузки.
+    :param scenario: Имя сценария плана, который нагружается (по умолчанию все сценарии плана).
+    :param metric: Метрика, по которой проверяется SLO (по умолчанию итерация первого нагружаемого сценария),
+        например "make_purchase_operation/make_purchase_operation" или "GET /api/v1/accounts".
+    :param start: Первая ступень.
+    :param factor: Во сколько раз увеличивается нагрузка на каждой ступени.
+    :param max_level: Максимальная ступень.
+    :param refine: Сколько ступеней потратить на уточнение границы.
+    :param window: Длительность окна измерения в секундах.
+    :param steady_windows: Сколько последних стабильных окон составляют точку кривой.
+    :param max_step_duration: Максимальная длительность ступени в секундах.
+    :param on_point: Вызывается после измерения каждой ступени (например, для вывода хода поиска).
+    """
+
+    def __init__(
+            self,
+            plan: LoadPlan,
+            slo: CapacitySLO,
+            scenario: str | None = None,
+            metric: str | None = None,
+            start: float | None = None,
+            factor: float = 2,
+            max_level: float | None = None,
+            refine: int = 3,
+            window: float = 2,
+            steady_windows: int = 5,
+            max_step_duration: float = 60,
+            on_point: Callable[[CapacityPointDict], None] | None = None
+    ) -> None:
+        if factor <= 1:
+            raise ValueError("factor must be greater than 1")
+
+        self.scenarios = [item for item in plan.scenarios if scenario is None or item.name == scenario]
+        if not self.scenarios:
+            raise ValueError(f"Plan has no scenario {scenario}")
+
+        self.plan = plan
+        self.slo = slo
+        self.model = OPEN if plan.rate is not None else CLOSED
+        self.metric = metric or self.scenarios[0].name
+        self.start = start or DEFAULT_START[self.model]
+        self.factor = factor
+        self.max_level = max_level or DEFAULT_MAX_LEVEL[self.model]
+        self.refine = refine
+        self.window = window
+        self.steady_windows = steady_windows
+        self.max_step_duration = max_step_duration
+        self.on_point = on_point
+        self.recorder = MetricsRecorder(trace_phases=plan.trace_phases)
+        self.points: list[CapacityPointDict] = []
+
+    async def run(self) -> CapacityResultDict:
+        """
+        Выполняет поиск.
+
+        :return: Максимальная пропускная способность в рамках SLO и измеренные точки кривой.
+        """
+        clients = build_gateway_clients(self.plan.pool, self.recorder, self.plan.decoder)
+        state = await self.plan.setup(clients) if self.plan.setup is not None else {}
+        engine = None
+        if self.model == OPEN:
+            measure = partial(self._measure_open, clients, state)
+        else:
+            engine = LoadEngine(scenarios=self.scenarios, stages=[], clients=clients, recorder=self.recorder)
+            engine.state.update(state)
+            measure = partial(self._measure_closed, engine)
+
+        try:
+            good, bad = await self._step_up(measure)
+            for _ in range(self.refine):
+                if bad is None or good is None or not self._refinable(good, bad):
+                    break
+                level = self._round((good + bad) / 2)
+                if (await measure(level))["passed"]:
+                    good = level
+                else:
+                    bad = level
+        finally:
+            if engine is not None:
+                await engine.shutdown()
+            await close_setup(self.plan.setup, state)
+
+        return self.result()
+
+    def result(self) -> CapacityResultDict:
+        points = sorted(self.points, key=lambda point: point["level"])
+        passed = [point for point in points if point["passed"]]
+        best = max(passed, key=lambda point: point["rps"], default=None)
+        failed = [point for point in points if not point["passed"]]
+        return CapacityResultDict(
+            metric=self.metric,
+            model=self.model,
+            max_rps=best["rps"] if best else 0,
+            level=best["level"] if best else None,
+            limit=failed[0]["reason"] if failed else "max_level",
+            points=points
+        )
+
+    async def _step_up(
+            self,
+            measure: Callable[[float], Awaitable[CapacityPointDict]]
+    ) -> tuple[float | None, float | None]:
+        good, level = None, self._round(self.start)
+        while level <= self.max_level:
+            if not (await measure(level))["passed"]:
+                return good, level
+            good = level
+            level = self._round(max(level * self.factor, level + 1))
+        return good, None
+
+    def _round(self, level: float) -> float:
+        return math.floor(level) if self.model == CLOSED else round(level, 2)
+
+    def _refinable(self, good: float, bad: float) -> bool:
+        if self.model == CLOSED:
+            return bad - good > 1
+        return (bad - good) / good > OPEN_RESOLUTION
+
+    async def _measure_closed(self, engine: LoadEngine, level: float) -> CapacityPointDict:
+        engine.scale_to(int(level))
+        return await self._measure(level)
+
+    async def _measure_open(self, clients: GatewayClients, state: dict[str, Any], level: float) -> CapacityPointDict:
+        scheduler = OpenModelScheduler(
+            rate=ConstantRate(rps=level, duration=self.max_step_duration + self.window),
+            scenarios=self.scenarios,
+            clients=clients,
+            recorder=self.recorder,
+            max_in_flight=self.plan.max_in_flight
+        )
+        scheduler.state.update(state)
+        task = asyncio.create_task(scheduler.run())
+        try:
+            return await self._measure(level)
+        finally:
+            scheduler.stop()
+            await task
+
+    async def _measure(self, level: float) -> CapacityPointDict:
+        detector = SteadyStateDetector(self.steady_windows)
+        windows: deque[tuple[dict[str, MetricStats], float]] = deque(maxlen=self.steady_windows)
+        # Замеры, завершившиеся между ступенями, относятся к предыдущей нагрузке
+        self.recorder.take()
+
+        started = time.perf_counter()
+        while time.perf_counter() - started < self.max_step_duration:
+            window_started = time.perf_counter()
+            await asyncio.sleep(self.window)
+            metrics, duration = self.recorder.take(), time.perf_counter() - window_started
+            windows.append((metrics, duration))
+            stats = metrics.get(self.metric)
+            throughput = stats.histogram.count / duration if stats else 0
+            if detector.add(throughput, stats.histogram.mean if stats else 0):
+                break
+
+        point = self._point(level, windows, detector.steady)
+        self.points.append(point)
+        if self.on_point is not None:
+            self.on_point(point)
+        return point
+
+    def _point(
+            self,
+            level: float,
+            windows: deque[tuple[dict[str, MetricStats], float]],
+            steady: bool
+    ) -> CapacityPointDict:
+        stats, dropped, duration = MetricStats(), 0, 0.0
+        for metrics, window_duration in windows:
+            if self.metric in metrics:
+                stats.merge(metrics[self.metric])
+            if "dropped" in metrics:
+                dropped += metrics["dropped"].histogram.count
+            duration += window_duration
+
+        snapshot = stats.snapshot(duration)
+        point = CapacityPointDict(
+            level=level,
+            rps=snapshot["rps"],
+            count=snapshot["count"],
+            errors=snapshot["errors"],
+            error_rate=snapshot["errors"] / snapshot["count"] if snapshot["count"] else 0,
+            dropped=dropped,
+            mean=snapshot["mean"],
+            p50=snapshot["p50"],
+            p90=snapshot["p90"],
+            p99=snapshot["p99"],
+            steady=steady,
+            duration=round(duration, 3),
+            passed=True,
+            reason=""
+        )
+        point["reason"] = self._violation(point)
+        point["passed"] = not point["reason"]
+        return point
+
+    def _violation(self, point: CapacityPointDict) -> str:
+        if not point["count"]:
+            return "no_samples"
+        if point["dropped"]:
+            return "dropped"
+        if point["error_rate"] > self.slo.error_rate:
+            return "error_rate"
+        if point["p99"] > self.slo.p99:
+            return "p99"
+        if not point["steady"]:
+            return "unsteady"
+
+        previous = max(
+            (item for item in self.points if item["passed"] and item["level"] < point["level"]),
+            key=lambda item: item["level"],
+            default=None
+        )
+        if self.slo.min_scaling and previous is not None and previous["rps"]:
+            load_growth = point["level"] / previous["level"] - 1
+            throughput_growth = point["rps"] / previous["rps"] - 1
+            if throughput_growth < self.slo.min_scaling * load_growth:
+                return "saturated"
+        return ""
+
+
+def format_curve(result: CapacityResultDict) -> str:
+    """
+    Форматирует кривую «латентность — пропускная способность» в текстовую таблицу (латентности в миллисекундах).
+
+    :param result: Результат CapacitySearch.run().
+    :return: Таблица и итоговая строка.
+    """
+    level = "users" if result["model"] == CLOSED else "offered"
+    lines = [
+        f"{level:>10} {'rps':>10} {'mean':>10} {'p50':>10} {'p90':>10} {'p99':>10} {'errors':>8} {'steady':>7}  result"
+    ]
+    for point in result["points"]:
+        lines.append(
+            f"{point['level']:>10g} {point['rps']:>10.1f} {point['mean']:>10.2f} {point['p50']:>10.2f} "
+            f"{point['p90']:>10.2f} {point['p99']:>10.2f} {point['error_rate']:>8.2%} {str(point['steady']):>7}  "
+            f"{'ok' if point['passed'] else point['reason']}"
+        )
+    lines.append(
+        f"\n{result['metric']}: max sustainable {result['max_rps']:.1f} rps at {level} {result['level'] or 0:g} "
+        f"(limited by {result['limit']})"
+    )
+    return "\n".join(lines)
@@ -0,0 +1,213 @@
+import asyncio
+import inspect
+from dataclasses import dataclass, field, fields
+from operator import attrgetter
+from typing import Any, Callable, Iterable, get_type_hints
+
+from httpx import Response
+
+from clients.http.client import AsyncHTTPClient
+from load.scenario import GatewayClients, ScenarioContext
+
+STATE = "$state"
+
+
+@dataclass(frozen=True)
+class Ref:
+    """
+    Ссылка на часть результата другого шага, например ref("open_account", "account", "id").
+
+    :param step: Имя шага, от результата которого зависит аргумент (STATE — общее состояние сценария).
+    :param path: Ключи и индексы внутри результата.
+    """
+    step: str
+    path: tuple[str | int, ...] = ()
+
+    def resolve(self, value: Any) -> Any:
+        for key in self.path:
+            value = value[key]
+        return value
+
+
+def ref(step: str, *path: str | int) -> Ref:
+    return Ref(step, path)
+
+
+def state_ref(key: str) -> Ref:
+    """
+    Ссылка на значение из общего состояния сценария, например подготовленного в LoadPlan.setup.
+    """
+    return Ref(STATE, (key,))
+
+
+@dataclass(frozen=True)
+class FlowStep:
+    """
+    Шаг пользовательского пути: вызов метода одного из клиентов GatewayClients.
+
+    Зависимости шага определяются по ссылкам в аргументах; after задаёт дополнительный порядок
+    для шагов, которые не используют результаты друг друга.
+
+    :param name: Имя шага, метрика сохраняется как "<сценарий>/<шаг>".
+    :param client: Клиент из GatewayClients: users, accounts, cards, documents или operations.
+    :param method: Высокоуровневый метод клиента, например open_debit_card_account.
+    :param arguments: Аргументы метода: значения или Ref на результаты других шагов.
+    :param after: Шаги, которые должны завершиться до начала этого шага.
+    """
+    name: str
+    client: str
+    method: str
+    arguments: dict[str, Any] = field(default_factory=dict)
+    after: tuple[str, ...] = ()
+
+    @property
+    def dependencies(self) -> tuple[str, ...]:
+        refs = [value.step for value in self.arguments.values() if isinstance(value, Ref) and value.step != STATE]
+        return tuple(dict.fromkeys([*self.after, *refs]))
+
+
+@dataclass(frozen=True)
+class _CompiledStep:
+    """
+    Шаг, подготовленный к выполнению: метод клиента уже найден, а зависимости и ссылки
+    заменены номерами шагов, поэтому при выполнении не остаётся поиска по именам.
+    """
+    name: str
+    client: Callable[[GatewayClients], Any]
+    function: Callable[..., Any]
+    dependencies: tuple[int, ...]
+    constants: dict[str, Any]
+    # (аргумент, номер шага или -1 для общего состояния, путь внутри результата)
+    refs: tuple[tuple[str, int, tuple[str | int, ...]], ...]
+
+
+class FlowGraph:
+    """
+    Пользовательский путь, скомпилированный в граф зависимостей шагов.
+
+    Каждая итерация запускает шаг, как только завершились все шаги, от которых он зависит,
+    поэтому независимые шаги (например, получение тарифа и договора по одному счёту)
+    выполняются одновременно, как их запрашивал бы фронтенд. Длительность итерации
+    определяется самой длинной цепочкой шагов, а не их суммой.
+
+    Граф проверяется и компилируется один раз при создании: методы клиентов, зависимости
+    и ссылки на результаты разрешаются заранее, а итерация только вызывает готовые функции.
+    Ошибка шага отменяет ещё не завершённые шаги и пробрасывается из итерации.
+    Граф передаётся в Scenario как flow и сериализуется через pickle.
+
+    :param steps: Шаги в любом порядке.
+    """
+
+    def __init__(self, steps: Iterable[FlowStep]) -> None:
+        self.steps = tuple(steps)
+        self.order = _topological_order(self.steps)
+        self._compiled = _compile(self.order)
+
+    def __getstate__(self) -> dict[str, Any]:
+        return {"steps": self.steps}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__init__(**state)
+
+    async def __call__(self, ctx: ScenarioContext) -> dict[str, Any]:
+        """
+        Выполняет одну итерацию пути.
+
+        :return: Результаты шагов по именам.
+        """
+        tasks: list[asyncio.Task] = []
+        clients, state = ctx.clients, ctx.state
+
+        async def run(step: _CompiledStep) -> Any:
+            if step.dependencies:
+                await asyncio.gather(*[tasks[index] for index in step.dependencies])
+            arguments = dict(step.constants)
+            for argument, source, path in step.refs:
+                value = state if source < 0 else tasks[source].result()
+                for key in path:
+                    value = value[key]
+                arguments[argument] = value
+            return await ctx.step(step.name, step.function(step.client(clients), **arguments))
+
+        for step in self._compiled:
+            tasks.append(asyncio.create_task(run(step)))
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+        return {step.name: task.result() for step, task in zip(self._compiled, tasks)}
+
+
+def _compile(order: list[FlowStep]) -> tuple[_CompiledStep, ...]:
+    clients = get_type_hints(GatewayClients)
+    indexes = {step.name: index for index, step in enumerate(order)}
+    return tuple(
+        _CompiledStep(
+            name=step.name,
+            client=attrgetter(step.client),
+            function=getattr(clients[step.client], step.method),
+            dependencies=tuple(indexes[name] for name in step.dependencies),
+            constants={name: value for name, value in step.arguments.items() if not isinstance(value, Ref)},
+            refs=tuple(
+                (name, -1 if value.step == STATE else indexes[value.step], value.path)
+                for name, value in step.arguments.items() if isinstance(value, Ref)
+            )
+        )
+        for step in order
+    )
+
+
+def _is_step_method(client: type, name: str) -> bool:
+    """
+    Шагом может быть только высокоуровневый метод клиента: публичная корутина, которая возвращает
+    разобранный ответ. Методы *_api (возвращают httpx.Response), *_many и iter_operations (итераторы)
+    и методы базового AsyncHTTPClient (get, post, request) отклоняются при компиляции.
+    """
+    method = getattr(client, name, None)
+    return (
+        not name.startswith("_")
+        and not name.endswith("_api")
+        and not hasattr(AsyncHTTPClient, name)
+        and inspect.iscoroutinefunction(method)
+        and get_type_hints(method).get("return") is not Response
+    )
+
+
+def _topological_order(steps: tuple[FlowStep, ...]) -> list[FlowStep]:
+    clients = get_type_hints(GatewayClients)
+    by_name: dict[str, FlowStep] = {}
+    for step in steps:
+        if step.name in by_name:
+            raise ValueError(f"Duplicate step: {step.name}")
+        if step.client not in clients:
+            raise ValueError(
+                f"Step {step.name}: unknown client {step.client}, "
+                f"expected one of {', '.join(item.name for item in fields(GatewayClients))}"
+            )
+        if not _is_step_method(clients[step.client], step.method):
+            raise ValueError(
+                f"Step {step.name}: {step.client}.{step.method} is not a high-level coroutine method "
+                f"of {clients[step.client].__name__}"
+            )
+        by_name[step.name] = step
+
+    for step in steps:
+        for dependency in step.dependencies:
+            if dependency not in by_name:
+                raise ValueError(f"Step {step.name} depends on unknown step {dependency}")
+
+    order: list[FlowStep] = []
+    remaining = {step.name: set(step.dependencies) for step in steps}
+    while remaining:
+        ready = [name for name, dependencies in remaining.items() if not dependencies]
+        if not ready:
+            raise ValueError(f"Steps have a dependency cycle: {', '.join(sorted(remaining))}")
+        for name in ready:
+            order.append(by_name[name])
+            del remaining[name]
+        for dependencies in remaining.values():
+            dependencies.difference_update(ready)
+    return order
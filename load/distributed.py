@@ -0,0 +1,202 @@
+import asyncio
+import pickle
+import struct
+import time
+from typing import Any, Callable
+
+from load.multiprocess import MultiprocessRunner
+from load.plan import LoadPlan, run_plan
+from metrics.recorder import MetricsRecorder
+
+HEADER = struct.Struct("!I")
+
+
+async def send_message(writer: asyncio.StreamWriter, message: dict[str, Any]) -> None:
+    """
+    Отправляет сообщение: 4 байта длины и pickle-представление.
+
+    Протокол рассчитан только на доверенную сеть генераторов нагрузки:
+    план содержит функции сценариев и передаётся через pickle.
+    """
+    payload = pickle.dumps(message)
+    writer.write(HEADER.pack(len(payload)) + payload)
+    await writer.drain()
+
+
+async def receive_message(reader: asyncio.StreamReader) -> dict[str, Any]:
+    """
+    Читает одно сообщение, отправленное через send_message.
+    """
+    (size,) = HEADER.unpack(await reader.readexactly(HEADER.size))
+    return pickle.loads(await reader.readexactly(size))
+
+
+class LoadController:
+    """
+    Контроллер распределённого теста: ждёт подключения workers генераторов нагрузки,
+    раздаёт им доли плана и общий момент старта, затем собирает и объединяет их метрики.
+
+    :param plan: План нагрузки.
+    :param workers: Сколько генераторов нужно дождаться перед стартом.
+    :param host: Адрес, на котором принимаются подключения.
+    :param port: Порт контроллера.
+    :param start_delay: Через сколько секунд после раздачи плана генераторы начинают нагрузку.
+    :param on_update: Вызывается после каждого объединения метрик.
+    """
+
+    def __init__(
+            self,
+            plan: LoadPlan,
+            workers: int,
+            host: str = "0.0.0.0",
+            port: int = 5557,
+            start_delay: float = 2,
+            on_update: Callable[[MetricsRecorder], None] | None = None
+    ) -> None:
+        self.plan = plan
+        self.workers = workers
+        self.host = host
+        self.port = port
+        self.start_delay = start_delay
+        self.on_update = on_update
+        self.recorder = MetricsRecorder(trace_phases=plan.trace_phases, warmup=plan.warmup)
+        self._connections: list[tuple[asyncio.StreamReader, asyncio.StreamWriter, int]] = []
+        self._all_connected = asyncio.Event()
+        self.server: asyncio.Server | None = None
+
+    async def _accept(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        hello = await receive_message(reader)
+        if len(self._connections) >= self.workers:
+            await send_message(writer, {"type": "rejected", "reason": "all workers already connected"})
+            writer.close()
+            return
+
+        self._connections.append((reader, writer, hello.get("processes", 1)))
+        if len(self._connections) == self.workers:
+            self._all_connected.set()
+
+    async def start(self) -> None:
+        """
+        Начинает принимать подключения генераторов (порт доступен в self.port).
+        """
+        self.server = await asyncio.start_server(self._accept, self.host, self.port)
+        self.port = self.server.sockets[0].getsockname()[1]
+
+    async def run(self) -> MetricsRecorder:
+        """
+        Дожидается генераторов, запускает нагрузку и собирает метрики до завершения всех генераторов.
+
+        :return: Общее хранилище метрик.
+        """
+        if self.server is None:
+            await self.start()
+        await self._all_connected.wait()
+        self.server.close()
+
+        # Генераторы с несколькими процессами получают пропорционально большую долю нагрузки
+        total = sum(processes for _, _, processes in self._connections)
+        start_at = time.time() + self.start_delay
+        offset = 0
+        for _, writer, processes in self._connections:
+            plan = self.plan.share(offset, total, processes)
+            await send_message(writer, {"type": "plan", "plan": plan, "start_at": start_at})
+            offset += processes
+
+        self.recorder.started_at = time.perf_counter() + self.start_delay
+        await asyncio.gather(*(self._collect(reader) for reader, _, _ in self._connections))
+        for _, writer, _ in self._connections:
+            writer.close()
+        return self.recorder
+
+    async def _collect(self, reader: asyncio.StreamReader) -> None:
+        while True:
+            message = await receive_message(reader)
+            if message["type"] == "metrics":
+                self.recorder.merge_encoded(message["data"])
+                if self.on_update is not None:
+                    self.on_update(self.recorder)
+            elif message["type"] == "failed":
+                raise RuntimeError(f"Load worker failed: {message['error']}")
+            elif message["type"] == "done":
+                return
+
+
+class LoadWorker:
+    """
+    Генератор нагрузки распределённого теста: подключается к контроллеру, получает свою долю плана,
+    стартует в назначенный момент и раз в interval секунд отправляет приращения метрик.
+
+    :param host: Адрес контроллера.
+    :param port: Порт контроллера.
+    :param processes: Сколько процессов использовать на этой машине (см. MultiprocessRunner).
+    :param interval: Период отправки метрик в секундах.
+    :param connect_timeout: Сколько секунд пытаться подключиться к ещё не запущенному контроллеру.
+    """
+
+    def __init__(
+            self,
+            host: str = "localhost",
+            port: int = 5557,
+            processes: int = 1,
+            interval: float = 1,
+            connect_timeout: float = 60
+    ) -> None:
+        self.host = host
+        self.port = port
+        self.processes = processes
+        self.interval = interval
+        self.connect_timeout = connect_timeout
+
+    async def _connect(self) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        deadline = time.monotonic() + self.connect_timeout
+        while True:
+            try:
+                return await asyncio.open_connection(self.host, self.port)
+            except OSError:
+                if time.monotonic() > deadline:
+                    raise
+                await asyncio.sleep(0.5)
+
+    async def run(self) -> None:
+        """
+        Выполняет одну сессию распределённого теста.
+        """
+        reader, writer = await self._connect()
+        await send_message(writer, {"type": "hello", "processes": self.processes})
+        message = await receive_message(reader)
+        if message["type"] != "plan":
+            raise RuntimeError(f"Controller rejected worker: {message.get('reason')}")
+
+        await asyncio.sleep(max(0.0, message["start_at"] - time.time()))
+        try:
+            if self.processes > 1:
+                await self._run_processes(message["plan"], writer)
+            else:
+                await self._run_single(message["plan"], writer)
+        except Exception as error:
+            await send_message(writer, {"type": "failed", "error": repr(error)})
+            raise
+        await send_message(writer, {"type": "done"})
+        writer.close()
+
+    async def _run_single(self, plan: LoadPlan, writer: asyncio.StreamWriter) -> None:
+        recorder = MetricsRecorder(trace_phases=plan.trace_phases, warmup=plan.warmup)
+        task = asyncio.create_task(run_plan(plan, recorder))
+        while not task.done():
+            await asyncio.wait([task], timeout=self.interval)
+            await send_message(writer, {"type": "metrics", "data": recorder.drain()})
+        task.result()
+
+    async def _run_processes(self, plan: LoadPlan, writer: asyncio.StreamWriter) -> None:
+        loop = asyncio.get_running_loop()
+        deltas: asyncio.Queue[bytes | None] = asyncio.Queue()
+
+        def forward(recorder: MetricsRecorder) -> None:
+            loop.call_soon_threadsafe(deltas.put_nowait, recorder.drain())
+
+        runner = MultiprocessRunner(plan, workers=self.processes, interval=self.interval, on_update=forward)
+        task = asyncio.create_task(asyncio.to_thread(runner.run))
+        task.add_done_callback(lambda _: deltas.put_nowait(None))
+        while (delta := await deltas.get()) is not None:
+            await send_message(writer, {"type": "metrics", "data": delta})
+        await task
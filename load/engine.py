@@ -0,0 +1,146 @@
+import asyncio
+import itertools
+import random
+import time
+from typing import Any
+
+from load.arrival import Setup
+from load.scenario import Scenario, ScenarioContext, GatewayClients
+from load.stages import Stage, target_at
+from metrics.recorder import MetricsRecorder
+
+
+class VirtualUser:
+    """
+    Виртуальный пользователь: в цикле выбирает сценарий по весам и выполняет его итерацию.
+    Состояние пользователя начинается с копии общего состояния движка (см. LoadEngine.setup).
+
+    :param vu_id: Номер виртуального пользователя.
+    :param engine: Движок, которому принадлежит пользователь.
+    """
+
+    def __init__(self, vu_id: int, engine: "LoadEngine") -> None:
+        self.vu_id = vu_id
+        self.engine = engine
+        self.state: dict[str, Any] = dict(engine.state)
+        self.stopping = False
+        self.task: asyncio.Task | None = None
+
+    async def run(self) -> None:
+        engine = self.engine
+        while not self.stopping:
+            scenario = engine.choose_scenario()
+            ctx = ScenarioContext(engine.clients, engine.recorder, scenario.name, self.vu_id, self.state)
+            started = time.perf_counter_ns()
+            error = False
+            try:
+                await scenario.flow(ctx)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                error = True
+            engine.recorder.record(scenario.name, time.perf_counter_ns() - started, error)
+
+            if scenario.think_time:
+                await asyncio.sleep(scenario.think_time)
+            else:
+                # Сценарий, упавший до первого await, иначе не отдаёт управление event loop
+                # и останавливает все остальные задачи, включая управление этапами
+                await asyncio.sleep(0)
+
+
+class LoadEngine:
+    """
+    Движок нагрузки по закрытой модели: поддерживает заданное этапами количество виртуальных пользователей,
+    каждый из которых выполняет взвешенные сценарии один за другим.
+
+    :param scenarios: Сценарии с весами.
+    :param stages: Этапы нагрузки (разгон, удержание, снижение).
+    :param clients: Набор клиентов http-gateway, общий для всех виртуальных пользователей.
+    :param recorder: Хранилище замеров сценариев и их шагов.
+    :param tick: Как часто (в секундах) пересчитывается нужное количество виртуальных пользователей.
+    :param graceful_stop: Сколько секунд ждать завершения текущих итераций после окончания этапов.
+    :param setup: Подготовка общего состояния: выполняется один раз перед первым этапом,
+        и каждый виртуальный пользователь получает копию результата в ctx.state.
+    """
+
+    def __init__(
+            self,
+            scenarios: list[Scenario],
+            stages: list[Stage],
+            clients: GatewayClients,
+            recorder: MetricsRecorder | None = None,
+            tick: float = 0.1,
+            graceful_stop: float = 30,
+            setup: Setup | None = None
+    ) -> None:
+        if not scenarios:
+            raise ValueError("At least one scenario is required")
+
+        self.scenarios = scenarios
+        self.stages = stages
+        self.clients = clients
+        self.recorder = recorder or MetricsRecorder()
+        self.tick = tick
+        self.graceful_stop = graceful_stop
+        self.setup = setup
+        self.state: dict[str, Any] = {}
+        self._cum_weights = list(itertools.accumulate(scenario.weight for scenario in scenarios))
+        self._active: list[VirtualUser] = []
+        self._stopping: list[VirtualUser] = []
+        self._ids = itertools.count()
+
+    def choose_scenario(self) -> Scenario:
+        return random.choices(self.scenarios, cum_weights=self._cum_weights)[0]
+
+    @property
+    def active_users(self) -> int:
+        return len(self._active)
+
+    def scale_to(self, target: int) -> None:
+        """
+        Запускает или останавливает виртуальных пользователей, чтобы активных стало target.
+        Остановленные пользователи завершают текущую итерацию.
+        """
+        while len(self._active) < target:
+            user = VirtualUser(next(self._ids), self)
+            user.task = asyncio.create_task(user.run())
+            self._active.append(user)
+
+        while len(self._active) > target:
+            user = self._active.pop()
+            user.stopping = True
+            self._stopping.append(user)
+
+        self._stopping = [user for user in self._stopping if not user.task.done()]
+
+    async def run(self) -> MetricsRecorder:
+        """
+        Выполняет все этапы нагрузки.
+
+        :return: Хранилище с замерами сценариев и шагов.
+        """
+        if self.setup is not None:
+            self.state.update(await self.setup(self.clients))
+        self.recorder.start()
+
+        started = time.monotonic()
+        while (target := target_at(self.stages, time.monotonic() - started)) is not None:
+            self.scale_to(target)
+            await asyncio.sleep(self.tick)
+
+        await self.shutdown()
+        return self.recorder
+
+    async def shutdown(self) -> None:
+        """
+        Останавливает всех виртуальных пользователей и ждёт завершения их итераций не дольше graceful_stop.
+        """
+        self.scale_to(0)
+        tasks = [user.task for user in self._stopping]
+        if tasks:
+            _, pending = await asyncio.wait(tasks, timeout=self.graceful_stop)
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+        self._stopping.clear()
@@ -0,0 +1,112 @@
+from load.dag import FlowGraph, FlowStep, ref
+from load.scenario import ScenarioContext, GatewayClients
+
+GET_DOCUMENTS_GRAPH = FlowGraph(
+    [
+        FlowStep("create_user", "users", "create_user"),
+        FlowStep(
+            "open_debit_card_account", "accounts", "open_debit_card_account",
+            {"user_id": ref("create_user", "user", "id")}
+        ),
+        FlowStep(
+            "get_tariff_document", "documents", "get_tariff_document",
+            {"account_id": ref("open_debit_card_account", "account", "id")}
+        ),
+        FlowStep(
+            "get_contract_document", "documents", "get_contract_document",
+            {"account_id": ref("open_debit_card_account", "account", "id")}
+        ),
+    ]
+)
+
+
+async def get_user_flow(ctx: ScenarioContext) -> None:
+    """
+    Создание пользователя и получение его данных (api_client_get_user.py).
+    """
+    create_user_response = await ctx.step("create_user", ctx.clients.users.create_user())
+    await ctx.step("get_user", ctx.clients.users.get_user(create_user_response['user']['id']))
+
+
+async def issue_physical_card_flow(ctx: ScenarioContext) -> None:
+    """
+    Создание пользователя, открытие дебетового счёта и выпуск физической карты
+    (api_client_issue_physical_card.py).
+    """
+    create_user_response = await ctx.step("create_user", ctx.clients.users.create_user())
+    open_debit_card_account_response = await ctx.step(
+        "open_debit_card_account",
+        ctx.clients.accounts.open_debit_card_account(user_id=create_user_response['user']['id'])
+    )
+    await ctx.step(
+        "issue_physical_card",
+        ctx.clients.cards.issue_physical_card(
+            user_id=create_user_response['user']['id'],
+            account_id=open_debit_card_account_response['account']['id']
+        )
+    )
+
+
+async def make_top_up_operation_flow(ctx: ScenarioContext) -> None:
+    """
+    Создание пользователя, открытие дебетового счёта и пополнение
+    (api_client_make_top_up_operation.py).
+    """
+    create_user_response = await ctx.step("create_user", ctx.clients.users.create_user())
+    open_debit_card_account_response = await ctx.step(
+        "open_debit_card_account",
+        ctx.clients.accounts.open_debit_card_account(user_id=create_user_response['user']['id'])
+    )
+    await ctx.step(
+        "make_top_up_operation",
+        ctx.clients.operations.make_top_up_operation(
+            account_id=open_debit_card_account_response['account']['id'],
+            card_id=open_debit_card_account_response['account']['cards'][0]['id']
+        )
+    )
+
+
+async def get_documents_flow(ctx: ScenarioContext) -> None:
+    """
+    Создание пользователя, открытие дебетового счёта и получение документов по нему
+    (api_client_get_documents.py); тариф и договор запрашиваются одновременно (см. GET_DOCUMENTS_GRAPH).
+    """
+    await GET_DOCUMENTS_GRAPH(ctx)
+
+
+async def setup_debit_card_account(clients: GatewayClients) -> dict[str, str]:
+    """
+    Создаёт пользователя с дебетовым счётом, на которых выполняются операции в open-model сценариях.
+
+    :return: Словарь с user_id, account_id и card_id.
+    """
+    create_user_response = await clients.users.create_user()
+    open_debit_card_account_response = await clients.accounts.open_debit_card_account(
+        user_id=create_user_response['user']['id']
+    )
+    return {
+        "user_id": create_user_response['user']['id'],
+        "account_id": open_debit_card_account_response['account']['id'],
+        "card_id": open_debit_card_account_response['account']['cards'][0]['id'],
+    }
+
+
+async def make_purchase_operation_flow(ctx: ScenarioContext) -> None:
+    """
+    Операция покупки по заранее подготовленной карте (см. setup_debit_card_account).
+    """
+    await ctx.step(
+        "make_purchase_operation",
+        ctx.clients.operations.make_purchase_operation(card_id=ctx.state["card_id"], account_id=ctx.state["account_id"])
+    )
+
+
+async def get_operations_flow(ctx: ScenarioContext) -> None:
+    """
+    Получение списка операций и статистики по заранее подготовленному счёту (см. setup_debit_card_account).
+    """
+    await ctx.step("get_operations", ctx.clients.operations.get_operations(account_id=ctx.state["account_id"]))
+    await ctx.step(
+        "get_operations_summary",
+        ctx.clients.operations.get_operations_summary(account_id=ctx.state["account_id"])
+    )
@@ -0,0 +1,162 @@
+import asyncio
+import multiprocessing
+import os
+import queue
+import time
+from typing import Callable
+
+from load.plan import LoadPlan, run_plan
+from metrics.recorder import MetricsRecorder
+
+READY, METRICS, DONE, FAILED = "ready", "metrics", "done", "failed"
+
+
+async def _run_worker(plan: LoadPlan, index: int, events: multiprocessing.Queue, interval: float) -> None:
+    recorder = MetricsRecorder(trace_phases=plan.trace_phases, warmup=plan.warmup)
+    task = asyncio.create_task(run_plan(plan, recorder))
+    while not task.done():
+        await asyncio.wait([task], timeout=interval)
+        events.put((METRICS, index, recorder.drain()))
+    task.result()
+
+
+def _worker_main(
+        plan: LoadPlan,
+        index: int,
+        workers: int,
+        events: multiprocessing.Queue,
+        start: multiprocessing.Event,
+        interval: float
+) -> None:
+    try:
+        share = plan.share(index, workers)
+        events.put((READY, index, b""))
+        start.wait()
+        asyncio.run(_run_worker(share, index, events, interval))
+    except BaseException as error:
+        events.put((FAILED, index, repr(error).encode()))
+        raise
+    events.put((DONE, index, b""))
+
+
+class MultiprocessRunner:
+    """
+    Запускает план нагрузки в нескольких процессах (по умолчанию по одному на ядро),
+    чтобы генератор не упирался в одно ядро CPython.
+
+    Каждый воркер выполняет свою долю плана (см. LoadPlan.share) со своими клиентами http-gateway
+    и раз в interval секунд отправляет координатору приращения гистограмм.
+    Координатор объединяет их в общее хранилище, доступное во время теста и после него.
+
+    :param plan: План нагрузки.
+    :param workers: Количество процессов-воркеров.
+    :param interval: Период отправки метрик воркерами в секундах.
+    :param on_update: Вызывается после каждого объединения метрик (например, для вывода текущей статистики).
+    :param start_method: Способ запуска процессов multiprocessing (fork, spawn, forkserver).
+        При forkserver модули воркера импортируются один раз в сервере, и воркеры стартуют без импорта httpx.
+    """
+
+    def __init__(
+            self,
+            plan: LoadPlan,
+            workers: int | None = None,
+            interval: float = 1,
+            on_update: Callable[[MetricsRecorder], None] | None = None,
+            start_method: str | None = None
+    ) -> None:
+        self.plan = plan
+        self.workers = workers or os.cpu_count() or 1
+        self.interval = interval
+        self.on_update = on_update
+        self.context = multiprocessing.get_context(start_method)
+        if self.context.get_start_method() == "forkserver":
+            self.context.set_forkserver_preload([__name__])
+        self.recorder = MetricsRecorder(trace_phases=plan.trace_phases, warmup=plan.warmup)
+
+    def run(self) -> MetricsRecorder:
+        """
+        Запускает воркеры, дожидается их готовности, одновременно стартует нагрузку
+        и собирает метрики до завершения всех воркеров.
+
+        :return: Общее хранилище метрик.
+        """
+        events = self.context.Queue()
+        start = self.context.Event()
+        processes = [
+            self.context.Process(
+                target=_worker_main,
+                args=(self.plan, index, self.workers, events, start, self.interval),
+                name=f"load-worker-{index}",
+                daemon=True
+            )
+            for index in range(self.workers)
+        ]
+        for process in processes:
+            process.start()
+
+        try:
+            self._wait_ready(events, processes)
+            self.recorder.started_at = time.perf_counter()
+            start.set()
+            self._collect(events, processes)
+        finally:
+            for process in processes:
+                if process.is_alive():
+                    process.terminate()
+                process.join()
+
+        return self.recorder
+
+    def _next_event(self, events: multiprocessing.Queue, processes: list) -> tuple[str, int, bytes] | None:
+        try:
+            return events.get(timeout=self.interval)
+        except queue.Empty:
+            dead = [process.name for process in processes if process.exitcode not in (None, 0)]
+            if dead:
+                raise RuntimeError(f"Load workers exited unexpectedly: {', '.join(dead)}")
+            return None
+
+    def _wait_ready(self, events: multiprocessing.Queue, processes: list) -> None:
+        ready = 0
+        while ready < self.workers:
+            event = self._next_event(events, processes)
+            if event is None:
+                continue
+            kind, index, payload = event
+            if kind == FAILED:
+                raise RuntimeError(f"Load worker {index} failed: {payload.decode()}")
+            ready += kind == READY
+
+    def _collect(self, events: multiprocessing.Queue, processes: list) -> None:
+        done = 0
+        while done < self.workers:
+            event = self._next_event(events, processes)
+            if event is None:
+                continue
+            kind, index, payload = event
+            if kind == METRICS:
+                self.recorder.merge_encoded(payload)
+                if self.on_update is not None:
+                    self.on_update(self.recorder)
+            elif kind == FAILED:
+                raise RuntimeError(f"Load worker {index} failed: {payload.decode()}")
+            elif kind == DONE:
+                done += 1
+
+
+def run_multiprocess(
+        plan: LoadPlan,
+        workers: int | None = None,
+        interval: float = 1,
+        on_update: Callable[[MetricsRecorder], None] | None = None
+) -> MetricsRecorder:
+    """
+    Выполняет план нагрузки в нескольких процессах.
+
+    :param plan: План нагрузки.
+    :param workers: Количество процессов (по умолчанию по числу ядер).
+    :param interval: Период отправки метрик воркерами в секундах.
+    :param on_update: Вызывается после каждого объединения метрик.
+    :return: Общее хранилище метрик.
+    """
+    return MultiprocessRunner(plan, workers=workers, interval=interval, on_update=on_update).run()
@@ -0,0 +1,147 @@
+import itertools
+import random
+from dataclasses import dataclass, field
+from typing import Any
+
+from httpx import Response
+
+from fixtures.payloads import AmountDistribution, PayloadFactory, DEFAULT_CATEGORIES, DEFAULT_STATUSES
+from fixtures.seeding import Fixtures
+from load.scenario import GatewayClients, ScenarioContext
+from metrics.recorder import MetricSnapshotDict
+
+OPERATION_TYPES = ("fee", "top_up", "cashback", "transfer", "purchase", "bill_payment", "cash_withdrawal")
+DEFAULT_OPERATION_WEIGHTS = {
+    "purchase": 50, "top_up": 15, "transfer": 10, "bill_payment": 10, "cash_withdrawal": 7, "cashback": 5, "fee": 3,
+}
+TARGETS_KEY = "operation_targets"
+
+
+@dataclass(frozen=True)
+class OperationTargetsSetup:
+    """
+    Подготовка пула карт и счетов, по которым bulk_operations_flow распределяет операции.
+
+    Передаётся в LoadPlan.setup; пары (card_id, account_id) загружаются из файла с данными
+    один раз на процесс и сохраняются в общем состоянии сценариев.
+
+    :param path: Файл, сохранённый через Fixtures.save().
+    :param account_types: Типы счетов, карты которых попадают в пул (по умолчанию все).
+    """
+    path: str
+    account_types: tuple[str, ...] = ()
+
+    async def __call__(self, clients: GatewayClients) -> dict[str, Any]:
+        targets = [
+            (card["id"], account["id"])
+            for user in Fixtures.load(self.path).users
+            for account in user["accounts"]
+            if not self.account_types or account["type"] in self.account_types
+            for card in account["cards"]
+        ]
+        if not targets:
+            raise ValueError(f"No cards in {self.path} for account types {', '.join(self.account_types) or 'any'}")
+        return {TARGETS_KEY: targets}
+
+
+@dataclass(frozen=True)
+class OperationMix:
+    """
+    Состав потока операций: доли типов, статусов, категорий покупок и распределение сумм.
+
+    :param weights: Веса типов операций из OPERATION_TYPES.
+    :param statuses: Веса статусов операций.
+    :param amounts: Распределение сумм.
+    :param categories: Веса категорий покупок.
+    :param seed: Начальное значение генератора случайных чисел для воспроизводимого потока.
+    """
+    weights: dict[str, float] = field(default_factory=lambda: dict(DEFAULT_OPERATION_WEIGHTS))
+    statuses: dict[str, float] = field(default_factory=lambda: dict(DEFAULT_STATUSES))
+    amounts: AmountDistribution = AmountDistribution()
+    categories: dict[str, float] = field(default_factory=lambda: dict(DEFAULT_CATEGORIES))
+    seed: int | None = None
+
+    def __post_init__(self) -> None:
+        unknown = set(self.weights) - set(OPERATION_TYPES)
+        if unknown:
+            raise ValueError(f"Unknown operation types: {', '.join(sorted(unknown))}")
+        if not any(weight > 0 for weight in self.weights.values()):
+            raise ValueError("At least one operation type must have a positive weight")
+
+
+class BulkOperationsFlow:
+    """
+    Сценарий записи операций: каждая итерация создаёт одну операцию случайного типа
+    с долями из OperationMix по случайной карте из пула (см. OperationTargetsSetup)
+    или по карте из setup_debit_card_account, если пул не подготовлен.
+
+    Шаг итерации называется по типу операции ("make_<тип>_operation"), поэтому пропускная способность
+    и латентность каждого типа видны отдельно (см. operation_stats). Ответ с кодом ошибки
+    засчитывается как ошибка шага.
+
+    Генератор тел создаётся заново в каждом процессе, поэтому сценарий можно передавать в LoadPlan
+    для запуска в нескольких процессах и на нескольких машинах.
+
+    :param mix: Состав потока операций.
+    """
+
+    def __init__(self, mix: OperationMix | None = None) -> None:
+        self.mix = mix or OperationMix()
+        self._types = [name for name in OPERATION_TYPES if self.mix.weights.get(name, 0) > 0]
+        self._cum_weights = list(itertools.accumulate(self.mix.weights[name] for name in self._types))
+        self._random = random.Random(self.mix.seed)
+        self._factory = PayloadFactory(
+            seed=self.mix.seed,
+            amounts=self.mix.amounts,
+            categories=self.mix.categories,
+            statuses=self.mix.statuses
+        )
+
+    def __getstate__(self) -> dict[str, Any]:
+        return {"mix": self.mix}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__init__(**state)
+
+    def next_type(self) -> str:
+        return self._random.choices(self._types, cum_weights=self._cum_weights)[0]
+
+    async def __call__(self, ctx: ScenarioContext) -> None:
+        targets = ctx.state.get(TARGETS_KEY)
+        if targets:
+            card_id, account_id = self._random.choice(targets)
+        else:
+            card_id, account_id = ctx.state["card_id"], ctx.state["account_id"]
+
+        operation_type = self.next_type()
+        if operation_type == "purchase":
+            request = self._factory.make_purchase_operation_request(card_id, account_id)
+        else:
+            request = self._factory.make_operation_request(card_id, account_id)
+        api = getattr(ctx.clients.operations, f"make_{operation_type}_operation_api")
+        await ctx.step(f"make_{operation_type}_operation", _checked(api(request)))
+
+
+async def _checked(request: Any) -> Response:
+    response = await request
+    response.raise_for_status()
+    return response
+
+
+def operation_stats(
+        snapshot: dict[str, MetricSnapshotDict],
+        scenario: str = "bulk_operations"
+) -> dict[str, MetricSnapshotDict]:
+    """
+    Выбирает из статистики теста шаги сценария записи операций.
+
+    :param snapshot: Результат MetricsRecorder.snapshot().
+    :param scenario: Имя сценария с BulkOperationsFlow.
+    :return: Словарь {тип операции: статистика}, например для format_snapshot().
+    """
+    stats = {}
+    for operation_type in OPERATION_TYPES:
+        metric = snapshot.get(f"{scenario}/make_{operation_type}_operation")
+        if metric is not None:
+            stats[operation_type] = metric
+    return stats
@@ -0,0 +1,147 @@
+import importlib
+from dataclasses import dataclass, replace
+from typing import Any
+
+from clients.http.decoding import ResponseDecoder
+from clients.http.gateway.client import GatewayHTTPPoolConfig, DEFAULT_GATEWAY_HTTP_POOL_CONFIG
+from load.arrival import ArrivalRate, OpenModelScheduler, Setup
+from load.engine import LoadEngine
+from load.scenario import Scenario, build_gateway_clients
+from load.stages import Stage
+from metrics.recorder import MetricsRecorder
+from metrics.steady import WarmupPolicy
+
+
+@dataclass(frozen=True)
+class LoadPlan:
+    """
+    Полное описание нагрузки, которое можно передать в другой процесс или на другую машину.
+
+    Задаётся либо stages (закрытая модель, виртуальные пользователи), либо rate (открытая модель).
+
+    :param scenarios: Сценарии с весами.
+    :param stages: Этапы изменения количества виртуальных пользователей.
+    :param rate: Интенсивность запусков итераций.
+    :param setup: Подготовка общего состояния: выполняется один раз в процессе перед нагрузкой,
+        в закрытой модели каждый виртуальный пользователь получает копию результата. Подготовка с методом
+        share(worker, workers, count) получает от LoadPlan.share долю воркера (см. fixtures.store.FixtureStoreSetup),
+        а подготовка с методом async close(state) освобождает ресурсы состояния после нагрузки (см. close_setup).
+    :param pool: Настройки пула соединений с http-gateway.
+    :param trace_phases: Собирать ли разбивку запросов по стадиям.
+    :param max_in_flight: Ограничение одновременных итераций в открытой модели.
+    :param decoder: Проверка тел ответов по схемам: ResponseDecoder("sampled", 1000) проверяет
+        каждый тысячный ответ, не нагружая генератор (по умолчанию без проверки).
+    :param warmup: Исключение прогрева из результатов: WarmupPolicy(duration=30) отбрасывает
+        первые 30 секунд, WarmupPolicy(detect=True) — замеры до установившегося режима.
+        Замеры прогрева доступны через MetricsRecorder.warmup_snapshot().
+    """
+    scenarios: tuple[Scenario, ...]
+    stages: tuple[Stage, ...] = ()
+    rate: ArrivalRate | None = None
+    setup: Setup | None = None
+    pool: GatewayHTTPPoolConfig = DEFAULT_GATEWAY_HTTP_POOL_CONFIG
+    trace_phases: bool = False
+    max_in_flight: int = 10_000
+    decoder: ResponseDecoder | None = None
+    warmup: WarmupPolicy | None = None
+
+    def __post_init__(self) -> None:
+        if bool(self.stages) == (self.rate is not None):
+            raise ValueError("Exactly one of stages or rate must be set")
+
+    def share(self, worker: int, workers: int, count: int = 1) -> "LoadPlan":
+        """
+        Часть нагрузки для count подряд идущих воркеров, начиная с worker, из workers:
+        виртуальные пользователи делятся поровну (остаток достаётся первым воркерам),
+        интенсивность делится пропорционально, подготовка с методом share получает свою долю данных.
+
+        :param worker: Номер первого воркера, от 0 до workers - 1.
+        :param workers: Общее количество воркеров.
+        :param count: Сколько долей отдать (например, генератору с несколькими процессами).
+        :return: План для воркера.
+        """
+        share_setup = getattr(self.setup, "share", None)
+        setup = share_setup(worker, workers, count) if share_setup is not None else self.setup
+        if self.rate is not None:
+            return replace(
+                self,
+                rate=self.rate.scaled(count / workers, worker),
+                setup=setup,
+                max_in_flight=max(1, self.max_in_flight * count // workers)
+            )
+
+        stages = tuple(
+            replace(
+                stage,
+                target=count * (stage.target // workers)
+                + max(0, min(worker + count, stage.target % workers) - worker)
+            )
+            for stage in self.stages
+        )
+        return replace(self, stages=stages, setup=setup)
+
+
+async def run_plan(plan: LoadPlan, recorder: MetricsRecorder) -> MetricsRecorder:
+    """
+    Выполняет план в текущем процессе.
+
+    :param plan: План нагрузки.
+    :param recorder: Хранилище для метрик сценариев, шагов и запросов.
+    :return: То же хранилище с результатами.
+    """
+    clients = build_gateway_clients(plan.pool, recorder, plan.decoder)
+    if plan.rate is not None:
+        runner = OpenModelScheduler(
+            rate=plan.rate,
+            scenarios=list(plan.scenarios),
+            clients=clients,
+            recorder=recorder,
+            setup=plan.setup,
+            max_in_flight=plan.max_in_flight
+        )
+    else:
+        runner = LoadEngine(
+            scenarios=list(plan.scenarios),
+            stages=list(plan.stages),
+            clients=clients,
+            recorder=recorder,
+            setup=plan.setup
+        )
+
+    try:
+        return await runner.run()
+    finally:
+        await close_setup(plan.setup, runner.state)
+
+
+async def close_setup(setup: Setup | None, state: dict[str, Any]) -> None:
+    """
+    Освобождает ресурсы, созданные подготовкой: вызывает её метод close(state), если он есть.
+    Вызывается и после ошибки или отмены нагрузки, поэтому состояние может быть неполным.
+
+    :param setup: Подготовка из LoadPlan.setup.
+    :param state: Общее состояние сценариев.
+    """
+    close = getattr(setup, "close", None)
+    if close is not None:
+        await close(state)
+
+
+def import_plan(reference: str) -> LoadPlan:
+    """
+    Импортирует план по ссылке вида "модуль:атрибут", например "load_run_gateway_flows:plan",
+    или загружает его из файла сценария .yaml/.yml/.json (см. load.spec.compile_plan).
+
+    :param reference: Ссылка на план или путь к файлу сценария.
+    :return: Найденный LoadPlan.
+    """
+    from load.spec import SPEC_SUFFIXES, load_plan_file
+
+    if reference.endswith(SPEC_SUFFIXES):
+        return load_plan_file(reference)
+
+    module_name, _, attribute = reference.partition(":")
+    plan = getattr(importlib.import_module(module_name), attribute or "plan")
+    if not isinstance(plan, LoadPlan):
+        raise TypeError(f"{reference} is not a LoadPlan")
+    return plan
@@ -0,0 +1,119 @@
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable
+
+from clients.http.decoding import ResponseDecoder
+from clients.http.gateway.accounts.client import AccountsGatewayAsyncHTTPClient, build_accounts_gateway_async_http_client
+from clients.http.gateway.cards.client import CardsGatewayAsyncHTTPClient, build_cards_gateway_async_http_client
+from clients.http.gateway.client import GatewayHTTPPoolConfig, DEFAULT_GATEWAY_HTTP_POOL_CONFIG
+from clients.http.gateway.documents.client import (
+    DocumentsGatewayAsyncHTTPClient,
+    build_documents_gateway_async_http_client
+)
+from clients.http.gateway.operations.client import (
+    OperationsGatewayAsyncHTTPClient,
+    build_operations_gateway_async_http_client
+)
+from clients.http.gateway.users.client import UsersGatewayAsyncHTTPClient, build_users_gateway_async_http_client
+from fixtures.payloads import get_payload_factory
+from metrics.recorder import MetricsRecorder
+
+
+@dataclass
+class GatewayClients:
+    """
+    Набор асинхронных клиентов http-gateway, которые используют сценарии.
+    """
+    users: UsersGatewayAsyncHTTPClient
+    accounts: AccountsGatewayAsyncHTTPClient
+    cards: CardsGatewayAsyncHTTPClient
+    documents: DocumentsGatewayAsyncHTTPClient
+    operations: OperationsGatewayAsyncHTTPClient
+
+
+def build_gateway_clients(
+        config: GatewayHTTPPoolConfig = DEFAULT_GATEWAY_HTTP_POOL_CONFIG,
+        recorder: MetricsRecorder | None = None,
+        decoder: ResponseDecoder | None = None
+) -> GatewayClients:
+    """
+    Функция создаёт набор асинхронных клиентов http-gateway с общим пулом соединений.
+    Тела запросов create_user создаёт генератор текущего процесса (см. fixtures.payloads.get_payload_factory).
+
+    :param config: Настройки общего пула соединений.
+    :param recorder: Хранилище метрик запросов по эндпоинтам (по умолчанию метрики не собираются).
+    :param decoder: Разбор и проверка тел ответов (по умолчанию без проверки по схеме).
+    :return: Готовый к использованию GatewayClients.
+    """
+    return GatewayClients(
+        users=build_users_gateway_async_http_client(
+            config, recorder, decoder, get_payload_factory().create_user_request
+        ),
+        accounts=build_accounts_gateway_async_http_client(config, recorder, decoder),
+        cards=build_cards_gateway_async_http_client(config, recorder, decoder),
+        documents=build_documents_gateway_async_http_client(config, recorder, decoder),
+        operations=build_operations_gateway_async_http_client(config, recorder, decoder)
+    )
+
+
+class ScenarioContext:
+    """
+    Контекст одной итерации сценария: клиенты, состояние виртуального пользователя и замер шагов.
+
+    :param clients: Набор клиентов http-gateway.
+    :param recorder: Хранилище замеров шагов.
+    :param scenario: Имя выполняемого сценария.
+    :param vu_id: Номер виртуального пользователя.
+    :param state: Состояние виртуального пользователя, сохраняющееся между итерациями.
+    """
+
+    def __init__(
+            self,
+            clients: GatewayClients,
+            recorder: MetricsRecorder,
+            scenario: str,
+            vu_id: int,
+            state: dict[str, Any]
+    ) -> None:
+        self.clients = clients
+        self.recorder = recorder
+        self.scenario = scenario
+        self.vu_id = vu_id
+        self.state = state
+
+    async def step(self, name: str, awaitable: Awaitable[Any]) -> Any:
+        """
+        Выполняет шаг сценария и замеряет его длительность.
+
+        :param name: Имя шага, метрика сохраняется как "<сценарий>/<шаг>".
+        :param awaitable: Вызов клиента, например ctx.clients.users.create_user().
+        :return: Результат вызова.
+        """
+        started = time.perf_counter_ns()
+        error = False
+        try:
+            return await awaitable
+        except Exception:
+            error = True
+            raise
+        finally:
+            self.recorder.record(f"{self.scenario}/{name}", time.perf_counter_ns() - started, error)
+
+
+Flow = Callable[[ScenarioContext], Awaitable[None]]
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """
+    Сценарий нагрузки: пользовательский путь и его вес в общем потоке итераций.
+
+    :param name: Имя сценария.
+    :param flow: Асинхронная функция, выполняющая одну итерацию пользовательского пути.
+    :param weight: Относительная частота выбора сценария.
+    :param think_time: Пауза между итерациями в секундах.
+    """
+    name: str
+    flow: Flow
+    weight: float = 1
+    think_time: float = 0
@@ -0,0 +1,308 @@
+import importlib
+import json
+import math
+import re
+from pathlib import Path
+from typing import Any
+
+from clients.http.decoding import ResponseDecoder
+from clients.http.gateway.client import GatewayHTTPPoolConfig
+from fixtures.seeding import FixturesSetup
+from fixtures.store import FixtureStoreSetup
+from load.arrival import ArrivalRate, ConstantRate, PoissonRate, StepRate, Setup
+from load.dag import FlowGraph, FlowStep, Ref, STATE
+from load.plan import LoadPlan
+from load.scenario import Scenario
+from load.stages import Stage
+from metrics.steady import WarmupPolicy
+
+SPEC_SUFFIXES = (".yaml", ".yml", ".json")
+
+# Привязка к результату шага или к общему состоянию: "${open_account.account.cards.0.id}", "${state.card_id}"
+_BINDING = re.compile(r"^\$\{([A-Za-z_][\w-]*)((?:\.[\w-]+)*)}$")
+
+
+class ScenarioSpecError(ValueError):
+    """
+    Файл сценария не соответствует формату; сообщение содержит путь к ошибочному полю.
+    """
+
+
+def _fields(data: Any, location: str, required: tuple[str, ...], optional: tuple[str, ...] = ()) -> dict[str, Any]:
+    if not isinstance(data, dict):
+        raise ScenarioSpecError(f"{location}: expected a mapping, got {type(data).__name__}")
+    unknown = set(data) - set(required) - set(optional)
+    if unknown:
+        raise ScenarioSpecError(f"{location}: unknown fields {', '.join(sorted(unknown))}")
+    missing = [name for name in required if name not in data]
+    if missing:
+        raise ScenarioSpecError(f"{location}: missing fields {', '.join(missing)}")
+    return data
+
+
+def _list(data: Any, location: str) -> list[Any]:
+    if not isinstance(data, list):
+        raise ScenarioSpecError(f"{location}: expected a list, got {type(data).__name__}")
+    return data
+
+
+def _string(data: Any, location: str) -> str:
+    if not isinstance(data, str):
+        raise ScenarioSpecError(f"{location}: expected a string, got {data!r}")
+    return data
+
+
+def _number(data: Any, location: str, positive: bool = False, integer: bool = False) -> float:
+    # bool — подкласс int, но true вместо числа почти всегда опечатка в файле сценария
+    types = int if integer else (int, float)
+    if isinstance(data, bool) or not isinstance(data, types) or not math.isfinite(data):
+        raise ScenarioSpecError(f"{location}: expected {'an integer' if integer else 'a number'}, got {data!r}")
+    if data < 0 or (positive and data == 0):
+        expected = "positive" if positive else "non-negative"
+        raise ScenarioSpecError(f"{location}: expected a {expected} value, got {data}")
+    return data
+
+
+def _import(reference: str, location: str) -> Any:
+    module_name, _, attribute = reference.partition(":")
+    if not attribute:
+        raise ScenarioSpecError(f"{location}: expected a reference like module:attribute, got {reference!r}")
+    try:
+        return getattr(importlib.import_module(module_name), attribute)
+    except (ImportError, AttributeError) as error:
+        raise ScenarioSpecError(f"{location}: cannot import {reference}: {error}") from error
+
+
+def _argument(value: Any) -> Any:
+    if not isinstance(value, str):
+        return value
+    match = _BINDING.match(value)
+    if match is None:
+        return value
+    step, path = match.group(1), tuple(
+        int(key) if key.isdigit() else key for key in match.group(2).split(".")[1:]
+    )
+    return Ref(STATE if step == "state" else step, path)
+
+
+def _step(data: Any, location: str) -> FlowStep:
+    data = _fields(data, location, ("call",), ("name", "args", "after"))
+    client, _, method = _string(data["call"], f"{location}.call").partition(".")
+    if not method:
+        raise ScenarioSpecError(f"{location}.call: expected client.method, got {data['call']!r}")
+
+    arguments = data.get("args") or {}
+    if not isinstance(arguments, dict):
+        raise ScenarioSpecError(f"{location}.args: expected a mapping, got {type(arguments).__name__}")
+    # Одна зависимость записывается строкой: after: create_user
+    after = data.get("after", [])
+    after = [after] if isinstance(after, str) else _list(after, f"{location}.after")
+
+    return FlowStep(
+        name=_string(data.get("name", method), f"{location}.name"),
+        client=client,
+        method=method,
+        arguments={name: _argument(value) for name, value in arguments.items()},
+        after=tuple(_string(step, f"{location}.after[{index}]") for index, step in enumerate(after))
+    )
+
+
+def _scenario(data: Any, location: str) -> Scenario:
+    data = _fields(data, location, ("name",), ("steps", "flow", "weight", "think_time"))
+    if ("steps" in data) == ("flow" in data):
+        raise ScenarioSpecError(f"{location}: exactly one of steps or flow must be set")
+
+    if "flow" in data:
+        flow = _import(data["flow"], f"{location}.flow")
+    else:
+        steps = [
+            _step(step, f"{location}.steps[{index}]")
+            for index, step in enumerate(_list(data["steps"], f"{location}.steps"))
+        ]
+        try:
+            flow = FlowGraph(steps)
+        except ValueError as error:
+            raise ScenarioSpecError(f"{location}.steps: {error}") from error
+
+    return Scenario(
+        name=_string(data["name"], f"{location}.name"),
+        flow=flow,
+        weight=float(_number(data.get("weight", 1), f"{location}.weight")),
+        think_time=float(_number(data.get("think_time", 0), f"{location}.think_time"))
+    )
+
+
+def _stage(data: Any, location: str) -> Stage:
+    data = _fields(data, location, ("duration", "target"))
+    return Stage(
+        duration=_number(data["duration"], f"{location}.duration"),
+        target=int(_number(data["target"], f"{location}.target", integer=True))
+    )
+
+
+def _rate(data: Any, location: str) -> ArrivalRate:
+    try:
+        return _build_rate(data, location)
+    except ValueError as error:
+        if isinstance(error, ScenarioSpecError):
+            raise
+        raise ScenarioSpecError(f"{location}: {error}") from error
+
+
+def _build_rate(data: Any, location: str) -> ArrivalRate:
+    kind = data.get("type", "constant") if isinstance(data, dict) else None
+    if kind == "constant":
+        data = _fields(data, location, ("rps", "duration"), ("type", "phase"))
+        return ConstantRate(
+            rps=_number(data["rps"], f"{location}.rps", positive=True),
+            duration=_number(data["duration"], f"{location}.duration", positive=True),
+            phase=_number(data.get("phase", 0), f"{location}.phase")
+        )
+    if kind == "poisson":
+        data = _fields(data, location, ("rps", "duration"), ("type", "seed"))
+        seed = data.get("seed")
+        return PoissonRate(
+            rps=_number(data["rps"], f"{location}.rps", positive=True),
+            duration=_number(data["duration"], f"{location}.duration", positive=True),
+            seed=None if seed is None else int(_number(seed, f"{location}.seed", integer=True))
+        )
+    if kind == "step":
+        data = _fields(data, location, ("steps",), ("type",))
+        steps = []
+        for index, step in enumerate(_list(data["steps"], f"{location}.steps")):
+            step_location = f"{location}.steps[{index}]"
+            if not isinstance(step, list) or len(step) != 2:
+                raise ScenarioSpecError(f"{step_location}: expected a [duration, rps] pair, got {step!r}")
+            steps.append(
+                (
+                    float(_number(step[0], f"{step_location}[0]", positive=True)),
+                    float(_number(step[1], f"{step_location}[1]"))
+                )
+            )
+        if not any(rps for _, rps in steps):
+            raise ScenarioSpecError(f"{location}.steps: at least one step with positive rps is required")
+        return StepRate(steps=tuple(steps))
+    raise ScenarioSpecError(f"{location}.type: expected constant, poisson or step, got {kind!r}")
+
+
+def _setup(data: Any, location: str) -> Setup:
+    if isinstance(data, str):
+        return _import(data, location)
+    if isinstance(data, dict) and "store" in data:
+        return FixtureStoreSetup(path=_fields(data, location, ("store",))["store"])
+    data = _fields(data, location, ("fixtures",), ("account_type",))
+    return FixturesSetup(path=data["fixtures"], account_type=data.get("account_type", "DEBIT_CARD"))
+
+
+def compile_plan(data: Any, location: str = "plan") -> LoadPlan:
+    """
+    Проверяет описание нагрузки и собирает из него LoadPlan.
+
+    Формат (YAML или JSON):
+
+        scenarios:
+          - name: get_documents
+            weight: 2
+            think_time: 0.5
+            steps:
+              - call: users.create_user
+              - call: accounts.open_debit_card_account
+                args: {user_id: "${create_user.user.id}"}
+              - call: documents.get_tariff_document
+                args: {account_id: "${open_debit_card_account.account.id}"}
+          - name: top_up
+            flow: load.flows:make_top_up_operation_flow
+        stages:                         # закрытая модель
+          - {duration: 30, target: 50}
+        rate: {type: constant, rps: 100, duration: 60}   # или открытая модель
+        setup: {fixtures: fixtures.json}                 # или {store: fixtures.db}, или module:attribute
+        pool: {base_url: "http://localhost:8003", max_connections: 200}
+        decoder: {mode: sampled, sample_every: 1000}
+        warmup: {duration: 10, detect: true}              # исключение прогрева из результатов
+        trace_phases: false
+        max_in_flight: 10000
+
+    Шаг вызывает высокоуровневый метод клиента GatewayClients ("client.method", имя шага по умолчанию —
+    имя метода); "${шаг.ключ.0.ключ}" подставляет часть результата другого шага, "${state.ключ}" —
+    значение из общего состояния (setup). Шаги без зависимостей друг от друга выполняются одновременно.
+    Все ссылки и методы разрешаются при компиляции (см. FlowGraph).
+
+    :param data: Разобранный YAML или JSON.
+    :param location: Имя источника для сообщений об ошибках.
+    :raises ScenarioSpecError: Если описание некорректно.
+    """
+    data = _fields(
+        data,
+        location,
+        ("scenarios",),
+        ("stages", "rate", "setup", "pool", "decoder", "warmup", "trace_phases", "max_in_flight")
+    )
+    if not _list(data["scenarios"], f"{location}.scenarios"):
+        raise ScenarioSpecError(f"{location}.scenarios: at least one scenario is required")
+
+    scenarios = tuple(
+        _scenario(scenario, f"{location}.scenarios[{index}]") for index, scenario in enumerate(data["scenarios"])
+    )
+    names = [scenario.name for scenario in scenarios]
+    if len(set(names)) != len(names):
+        raise ScenarioSpecError(f"{location}.scenarios: duplicate scenario names")
+    # Нулевой вес отключает сценарий, но выбирать итерации должно быть из чего
+    if not any(scenario.weight for scenario in scenarios):
+        raise ScenarioSpecError(f"{location}.scenarios: at least one scenario must have a positive weight")
+
+    stages = tuple(
+        _stage(stage, f"{location}.stages[{index}]")
+        for index, stage in enumerate(_list(data.get("stages") or [], f"{location}.stages"))
+    )
+    rate = _rate(data["rate"], f"{location}.rate") if data.get("rate") is not None else None
+    setup = _setup(data["setup"], f"{location}.setup") if data.get("setup") is not None else None
+
+    options: dict[str, Any] = {}
+    if "pool" in data:
+        try:
+            options["pool"] = GatewayHTTPPoolConfig(**data["pool"])
+        except TypeError as error:
+            raise ScenarioSpecError(f"{location}.pool: {error}") from error
+    if "decoder" in data:
+        try:
+            options["decoder"] = ResponseDecoder(**data["decoder"])
+        except (TypeError, ValueError) as error:
+            raise ScenarioSpecError(f"{location}.decoder: {error}") from error
+    if "warmup" in data:
+        try:
+            options["warmup"] = WarmupPolicy(**data["warmup"])
+        except (TypeError, ValueError) as error:
+            raise ScenarioSpecError(f"{location}.warmup: {error}") from error
+    if "trace_phases" in data:
+        if not isinstance(data["trace_phases"], bool):
+            raise ScenarioSpecError(f"{location}.trace_phases: expected true or false, got {data['trace_phases']!r}")
+        options["trace_phases"] = data["trace_phases"]
+    if "max_in_flight" in data:
+        options["max_in_flight"] = _number(
+            data["max_in_flight"], f"{location}.max_in_flight", positive=True, integer=True
+        )
+
+    try:
+        return LoadPlan(scenarios=scenarios, stages=stages, rate=rate, setup=setup, **options)
+    except ValueError as error:
+        raise ScenarioSpecError(f"{location}: {error}") from error
+
+
+def load_plan_file(path: str | Path) -> LoadPlan:
+    """
+    Загружает план нагрузки из файла .yaml, .yml или .json (см. compile_plan).
+    Для YAML нужен пакет PyYAML.
+    """
+    path = Path(path)
+    text = path.read_text(encoding="utf-8")
+    if path.suffix == ".json":
+        data = json.loads(text)
+    elif path.suffix in (".yaml", ".yml"):
+        try:
+            import yaml
+        except ImportError as error:
+            raise ImportError("PyYAML is required for YAML scenario files: pip install pyyaml") from error
+        data = yaml.safe_load(text)
+    else:
+        raise ScenarioSpecError(f"{path}: unsupported file type, expected one of {', '.join(SPEC_SUFFIXES)}")
+    return compile_plan(data, str(path))
@@ -0,0 +1,59 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class Stage:
+    """
+    Этап нагрузки: за duration секунд количество виртуальных пользователей
+    линейно меняется от значения предыдущего этапа до target.
+
+    :param duration: Длительность этапа в секундах.
+    :param target: Количество виртуальных пользователей в конце этапа.
+    """
+    duration: float
+    target: int
+
+
+def ramp_up(duration: float, target: int) -> Stage:
+    """
+    Плавное увеличение количества виртуальных пользователей до target.
+    """
+    return Stage(duration=duration, target=target)
+
+
+def hold(duration: float, target: int) -> Stage:
+    """
+    Удержание постоянного количества виртуальных пользователей.
+    """
+    return Stage(duration=duration, target=target)
+
+
+def ramp_down(duration: float) -> Stage:
+    """
+    Плавное уменьшение количества виртуальных пользователей до нуля.
+    """
+    return Stage(duration=duration, target=0)
+
+
+def total_duration(stages: list[Stage]) -> float:
+    """
+    Суммарная длительность всех этапов в секундах.
+    """
+    return sum(stage.duration for stage in stages)
+
+
+def target_at(stages: list[Stage], elapsed: float) -> int | None:
+    """
+    Вычисляет, сколько виртуальных пользователей должно быть активно в момент elapsed.
+
+    :param stages: Этапы нагрузки.
+    :param elapsed: Время с начала теста в секундах.
+    :return: Количество виртуальных пользователей или None, если все этапы завершены.
+    """
+    previous = 0
+    for stage in stages:
+        if elapsed < stage.duration:
+            return round(previous + (stage.target - previous) * elapsed / stage.duration)
+        elapsed -= stage.duration
+        previous = stage.target
+    return None
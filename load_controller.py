@@ -0,0 +1,28 @@
+import argparse
+import asyncio
+
+from load.distributed import LoadController
+from load.plan import import_plan
+from metrics.report import format_snapshot, format_progress
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Контроллер распределённого нагрузочного теста")
+    parser.add_argument(
+        "--plan",
+        default="load_run_gateway_flows:plan",
+        help="План нагрузки в виде модуль:атрибут или файл сценария (scenarios/*.yaml)"
+    )
+    parser.add_argument("--workers", type=int, required=True, help="Сколько генераторов дождаться перед стартом")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=5557)
+    args = parser.parse_args()
+
+    controller = LoadController(
+        plan=import_plan(args.plan),
+        workers=args.workers,
+        host=args.host,
+        port=args.port,
+        on_update=lambda live: print(format_progress(live.snapshot()))
+    )
+    recorder = asyncio.run(controller.run())
+    print(format_snapshot(recorder.snapshot()))
@@ -0,0 +1,40 @@
+import os
+
+from load.arrival import ConstantRate
+from load.flows import setup_debit_card_account
+from load.multiprocess import run_multiprocess
+from load.operations import BulkOperationsFlow, OperationMix, OperationTargetsSetup, operation_stats
+from load.plan import LoadPlan
+from load.scenario import Scenario
+from fixtures.payloads import AmountDistribution
+from metrics.report import format_snapshot, format_progress
+
+# Файл с картами и счетами, подготовленный через python -m fixtures; без него все операции идут по одной карте
+FIXTURES_PATH = "fixtures.json"
+
+plan = LoadPlan(
+    scenarios=(
+        Scenario(
+            name="bulk_operations",
+            flow=BulkOperationsFlow(
+                OperationMix(
+                    weights={
+                        "purchase": 50, "top_up": 15, "transfer": 10, "bill_payment": 10,
+                        "cash_withdrawal": 7, "cashback": 5, "fee": 3,
+                    },
+                    statuses={"COMPLETED": 90, "IN_PROGRESS": 7, "FAILED": 3},
+                    amounts=AmountDistribution(kind="lognormal", mean=1500, spread=1.2)
+                )
+            )
+        ),
+    ),
+    rate=ConstantRate(rps=200, duration=60),
+    setup=OperationTargetsSetup(FIXTURES_PATH) if os.path.exists(FIXTURES_PATH) else setup_debit_card_account
+)
+
+if __name__ == "__main__":
+    recorder = run_multiprocess(plan, on_update=lambda live: print(format_progress(live.snapshot())))
+    snapshot = recorder.snapshot()
+    print(format_snapshot(snapshot))
+    print()
+    print(format_snapshot(operation_stats(snapshot)))
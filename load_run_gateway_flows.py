@@ -0,0 +1,23 @@
+from load.flows import issue_physical_card_flow, make_top_up_operation_flow, get_documents_flow
+from load.multiprocess import run_multiprocess
+from load.plan import LoadPlan
+from load.scenario import Scenario
+from load.stages import ramp_up, hold, ramp_down
+from metrics.report import format_snapshot, format_progress
+
+plan = LoadPlan(
+    scenarios=(
+        Scenario(name="issue_physical_card", flow=issue_physical_card_flow, weight=3),
+        Scenario(name="make_top_up_operation", flow=make_top_up_operation_flow, weight=5),
+        Scenario(name="get_documents", flow=get_documents_flow, weight=2),
+    ),
+    stages=(
+        ramp_up(duration=30, target=50),
+        hold(duration=60, target=50),
+        ramp_down(duration=10),
+    )
+)
+
+if __name__ == "__main__":
+    recorder = run_multiprocess(plan, on_update=lambda live: print(format_progress(live.snapshot())))
+    print(format_snapshot(recorder.snapshot()))
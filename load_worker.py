@@ -0,0 +1,13 @@
+import argparse
+import asyncio
+
+from load.distributed import LoadWorker
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Генератор нагрузки распределённого теста")
+    parser.add_argument("--host", default="localhost", help="Адрес контроллера")
+    parser.add_argument("--port", type=int, default=5557)
+    parser.add_argument("--processes", type=int, default=1, help="Сколько процессов использовать на этой машине")
+    args = parser.parse_args()
+
+    asyncio.run(LoadWorker(host=args.host, port=args.port, processes=args.processes).run())
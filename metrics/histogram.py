@@ -0,0 +1,166 @@
+from array import array
+
+SUB_BUCKET_BITS = 8
+SUB_BUCKET_HALF = 1 << (SUB_BUCKET_BITS - 1)
+MAX_VALUE = (1 << 36) - 1
+BUCKETS = ((MAX_VALUE.bit_length() - SUB_BUCKET_BITS + 1) << (SUB_BUCKET_BITS - 1)) + SUB_BUCKET_HALF
+
+
+def bucket_index(value: int) -> int:
+    """
+    Номер корзины для значения: значения меньше 2^SUB_BUCKET_BITS хранятся точно,
+    большие значения — с относительной погрешностью не больше 1 / 2^(SUB_BUCKET_BITS - 1) (~0.8%).
+    """
+    shift = value.bit_length() - SUB_BUCKET_BITS
+    if shift <= 0:
+        return value
+    return (shift << (SUB_BUCKET_BITS - 1)) + (value >> shift)
+
+
+def bucket_bounds(index: int) -> tuple[int, int]:
+    """
+    Минимальное и максимальное значение, попадающее в корзину index.
+    """
+    if index < 2 * SUB_BUCKET_HALF:
+        return index, index
+    shift = (index >> (SUB_BUCKET_BITS - 1)) - 1
+    lowest = (index - (shift << (SUB_BUCKET_BITS - 1))) << shift
+    return lowest, lowest + (1 << shift) - 1
+
+
+class LatencyHistogram:
+    """
+    Гистограмма в стиле HDR Histogram с фиксированным объёмом памяти.
+
+    Значения (обычно микросекунды) от 0 до ~19 часов раскладываются по лог-линейным корзинам,
+    поэтому запись занимает O(1), а гистограммы разных потоков, процессов и машин можно складывать без потерь.
+    """
+
+    __slots__ = ("counts", "count", "total", "min", "max")
+
+    def __init__(self) -> None:
+        self.counts = array("Q", bytes(8 * BUCKETS))
+        self.count = 0
+        self.total = 0
+        self.min = MAX_VALUE
+        self.max = 0
+
+    def record(self, value: int) -> None:
+        """
+        Сохраняет одно значение.
+
+        :param value: Неотрицательное целое значение, большие MAX_VALUE обрезаются.
+        """
+        if value > MAX_VALUE:
+            value = MAX_VALUE
+        elif value < 0:
+            value = 0
+        shift = value.bit_length() - SUB_BUCKET_BITS
+        self.counts[value if shift <= 0 else (shift << (SUB_BUCKET_BITS - 1)) + (value >> shift)] += 1
+        self.count += 1
+        self.total += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, percentile: float) -> int:
+        """
+        Значение, не больше которого percentile процентов замеров.
+
+        :param percentile: Перцентиль от 0 до 100.
+        :return: Верхняя граница корзины, в которую попал перцентиль (но не больше максимума).
+        """
+        if not self.count:
+            return 0
+        rank = max(1, round(self.count * percentile / 100))
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            if bucket_count:
+                seen += bucket_count
+                if seen >= rank:
+                    return min(bucket_bounds(index)[1], self.max)
+        return self.max
+
+    def percentiles(self, *percentiles: float) -> list[int]:
+        """
+        Несколько перцентилей за один проход по корзинам.
+        """
+        if not self.count:
+            return [0] * len(percentiles)
+        ranks = sorted((max(1, round(self.count * p / 100)), position) for position, p in enumerate(percentiles))
+        result = [self.max] * len(percentiles)
+        seen = 0
+        cursor = 0
+        for index, bucket_count in enumerate(self.counts):
+            if not bucket_count:
+                continue
+            seen += bucket_count
+            while cursor < len(ranks) and seen >= ranks[cursor][0]:
+                result[ranks[cursor][1]] = min(bucket_bounds(index)[1], self.max)
+                cursor += 1
+            if cursor == len(ranks):
+                break
+        return result
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        """
+        Добавляет в гистограмму все значения другой гистограммы.
+        """
+        if not other.count:
+            return
+        counts = self.counts
+        for index, bucket_count in enumerate(other.counts):
+            if bucket_count:
+                counts[index] += bucket_count
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def reset(self) -> None:
+        self.__init__()
+
+    def copy(self) -> "LatencyHistogram":
+        histogram = LatencyHistogram()
+        histogram.merge(self)
+        return histogram
+
+    def encode(self) -> bytes:
+        """
+        Компактное представление для передачи между процессами: только непустые корзины.
+        """
+        indexes = array("I")
+        counts = array("Q")
+        for index, bucket_count in enumerate(self.counts):
+            if bucket_count:
+                indexes.append(index)
+                counts.append(bucket_count)
+        header = array("Q", [len(indexes), self.count, self.total, self.min, self.max])
+        return header.tobytes() + indexes.tobytes() + counts.tobytes()
+
+    @classmethod
+    def decode(cls, data: bytes) -> "LatencyHistogram":
+        """
+        Восстанавливает гистограмму из результата encode().
+        """
+        header = array("Q")
+        header.frombytes(data[:40])
+        size, count, total, minimum, maximum = header
+        indexes = array("I")
+        indexes.frombytes(data[40:40 + 4 * size])
+        counts = array("Q")
+        counts.frombytes(data[40 + 4 * size:40 + 12 * size])
+
+        histogram = cls()
+        for index, bucket_count in zip(indexes, counts):
+            histogram.counts[index] = bucket_count
+        histogram.count = count
+        histogram.total = total
+        histogram.min = minimum
+        histogram.max = maximum
+        return histogram
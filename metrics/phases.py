@@ -0,0 +1,60 @@
+import time
+
+PHASES = ("pool", "connect", "write", "ttfb", "read")
+
+
+class PhaseTimer:
+    """
+    Обработчик trace-событий httpcore, который запоминает моменты начала и окончания
+    стадий выполнения одного запроса.
+
+    Передаётся в запрос через extensions={"trace": timer}; для асинхронного клиента
+    используется метод atrace, так как httpcore ожидает корутину.
+    """
+
+    __slots__ = ("started", "marks")
+
+    def __init__(self) -> None:
+        self.started = time.perf_counter_ns()
+        self.marks: dict[str, int] = {}
+
+    def __call__(self, event: str, info: dict) -> None:
+        # Событие приходит в виде "<модуль>.<стадия>.<started|complete|failed>", модуль (http11/http2) не важен
+        self.marks[event.partition(".")[2]] = time.perf_counter_ns()
+
+    async def atrace(self, event: str, info: dict) -> None:
+        self.marks[event.partition(".")[2]] = time.perf_counter_ns()
+
+    def phases(self, finished: int) -> dict[str, int]:
+        """
+        Раскладывает время запроса по стадиям (в наносекундах):
+
+        - pool: ожидание соединения из пула (от начала запроса до первого сетевого события);
+        - connect: установка TCP и TLS соединения (0, если соединение взято из пула);
+        - write: отправка заголовков и тела запроса;
+        - ttfb: ожидание первого байта ответа после отправки запроса (время обработки на сервере и сеть);
+        - read: чтение тела ответа.
+
+        :param finished: Момент завершения запроса (time.perf_counter_ns()).
+        :return: Словарь {стадия: длительность}.
+        """
+        marks = self.marks
+        connect_started = marks.get("connect_tcp.started")
+        write_started = marks.get("send_request_headers.started", finished)
+        write_finished = marks.get("send_request_body.complete", write_started)
+        headers_received = marks.get("receive_response_headers.complete", write_finished)
+        body_received = marks.get("receive_response_body.complete", finished)
+
+        if connect_started is None:
+            pool, connect = write_started - self.started, 0
+        else:
+            connected = marks.get("start_tls.complete") or marks.get("connect_tcp.complete", connect_started)
+            pool, connect = connect_started - self.started, connected - connect_started
+
+        return {
+            "pool": max(pool, 0),
+            "connect": max(connect, 0),
+            "write": max(write_finished - write_started, 0),
+            "ttfb": max(headers_received - write_finished, 0),
+            "read": max(body_received - headers_received, 0),
+        }
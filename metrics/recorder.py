@@ -0,0 +1,349 @@
+import pickle
+import threading
+import time
+import uuid
+from collections import defaultdict
+from typing import TypedDict
+
+from metrics.histogram import LatencyHistogram
+from metrics.steady import SteadyStateDetector, WarmupPolicy
+
+
+class PhaseSnapshotDict(TypedDict):
+    """
+    Описание структуры статистики по одной стадии запроса (в миллисекундах).
+    """
+    mean: float
+    p50: float
+    p90: float
+    p99: float
+
+
+class MetricSnapshotDict(TypedDict):
+    """
+    Описание структуры статистики по одной метрике (латентности в миллисекундах).
+    """
+    count: int
+    errors: int
+    rps: float
+    bytes: int
+    mean: float
+    p50: float
+    p90: float
+    p99: float
+    p999: float
+    max: float
+    statuses: dict[str, int]
+    phases: dict[str, PhaseSnapshotDict]
+
+
+class MetricStats:
+    """
+    Накопленная статистика одной метрики: гистограмма латентности в микросекундах,
+    количество ошибок, коды ответов, объём полученных данных и, если включено, гистограммы стадий запроса.
+    """
+
+    __slots__ = ("histogram", "errors", "bytes", "statuses", "phases")
+
+    def __init__(self) -> None:
+        self.histogram = LatencyHistogram()
+        self.errors = 0
+        self.bytes = 0
+        self.statuses: dict[int, int] = defaultdict(int)
+        self.phases: dict[str, LatencyHistogram] = {}
+
+    def record_phases(self, phases: dict[str, int]) -> None:
+        for phase, duration_ns in phases.items():
+            histogram = self.phases.get(phase)
+            if histogram is None:
+                histogram = self.phases[phase] = LatencyHistogram()
+            histogram.record(duration_ns // 1000)
+
+    def merge(self, other: "MetricStats") -> None:
+        self.histogram.merge(other.histogram)
+        self.errors += other.errors
+        self.bytes += other.bytes
+        for status, count in other.statuses.items():
+            self.statuses[status] += count
+        for phase, histogram in other.phases.items():
+            self.phases.setdefault(phase, LatencyHistogram()).merge(histogram)
+
+    def encode(self) -> tuple:
+        return (
+            self.histogram.encode(),
+            self.errors,
+            self.bytes,
+            dict(self.statuses),
+            {phase: histogram.encode() for phase, histogram in self.phases.items()}
+        )
+
+    @classmethod
+    def decode(cls, data: tuple) -> "MetricStats":
+        histogram, errors, size, statuses, phases = data
+        stats = cls()
+        stats.histogram = LatencyHistogram.decode(histogram)
+        stats.errors = errors
+        stats.bytes = size
+        stats.statuses.update(statuses)
+        stats.phases = {phase: LatencyHistogram.decode(encoded) for phase, encoded in phases.items()}
+        return stats
+
+    def snapshot(self, elapsed: float) -> MetricSnapshotDict:
+        histogram = self.histogram
+        p50, p90, p99, p999 = histogram.percentiles(50, 90, 99, 99.9)
+        return MetricSnapshotDict(
+            count=histogram.count,
+            errors=self.errors,
+            rps=histogram.count / elapsed,
+            bytes=self.bytes,
+            mean=histogram.mean / 1e3,
+            p50=p50 / 1e3,
+            p90=p90 / 1e3,
+            p99=p99 / 1e3,
+            p999=p999 / 1e3,
+            max=histogram.max / 1e3,
+            statuses={str(status): count for status, count in sorted(self.statuses.items())},
+            phases={phase: _phase_snapshot(histogram) for phase, histogram in self.phases.items()}
+        )
+
+
+def _phase_snapshot(histogram: LatencyHistogram) -> PhaseSnapshotDict:
+    p50, p90, p99 = histogram.percentiles(50, 90, 99)
+    return PhaseSnapshotDict(mean=histogram.mean / 1e3, p50=p50 / 1e3, p90=p90 / 1e3, p99=p99 / 1e3)
+
+
+class MetricsRecorder:
+    """
+    Хранилище замеров латентности, сгруппированных по имени метрики
+    (шаг сценария, сценарий целиком, шаблон эндпоинта и т.д.).
+
+    Каждая метрика хранится в гистограмме фиксированного размера,
+    поэтому память не растёт с количеством замеров, а хранилища можно объединять через merge().
+
+    Если задан warmup, замеры прогрева сохраняются отдельно: snapshot() считает статистику
+    только по установившемуся режиму, а warmup_snapshot() — по прогреву.
+
+    Хранилище, которое объединяет замеры воркеров, помнит момент окончания прогрева каждого источника
+    и длительность его работы по часам самого источника на момент последней передачи замеров:
+    интенсивность считается за среднее время установившегося режима источников, а прогрев
+    заканчивается, когда он закончился у всех. Такое хранилище само замеры не записывает.
+
+    :param trace_phases: Собирать ли для HTTP-запросов разбивку времени по стадиям
+        (ожидание пула, соединение, отправка, ожидание первого байта, чтение ответа).
+    :param warmup: Как определять окончание прогрева (по умолчанию все замеры входят в результат).
+    """
+
+    def __init__(self, trace_phases: bool = False, warmup: WarmupPolicy | None = None) -> None:
+        self.trace_phases = trace_phases
+        self.warmup = warmup
+        self.started_at = time.perf_counter()
+        # Через сколько секунд от started_at начался установившийся режим (None — ещё идёт прогрев)
+        self.steady_after: float | None = None if warmup is not None and warmup.enabled else 0.0
+        self._lock = threading.Lock()
+        self._metrics: dict[str, MetricStats] = {}
+        self._warmup_metrics: dict[str, MetricStats] = {}
+        # Источник замеров этого хранилища и объединённые источники:
+        # {источник: (окончание прогрева, сколько секунд источник работал к последней передаче замеров)}
+        self._source = uuid.uuid4().hex
+        self._sources: dict[str, tuple[float | None, float]] = {}
+        self._detectors: dict[str, SteadyStateDetector] = {}
+        self._window_started: float | None = None
+        # Замеры текущего окна детектора: {имя метрики: [количество, суммарная латентность в наносекундах]}
+        self._window: dict[str, list[int]] = {}
+
+    @property
+    def warming_up(self) -> bool:
+        return self.steady_after is None
+
+    def start(self) -> None:
+        """
+        Отмечает начало нагрузки: время до него (например, подготовка состояния сценариев)
+        не входит ни в прогрев, ни во время, за которое считается интенсивность.
+        """
+        with self._lock:
+            self.started_at = time.perf_counter()
+
+    def record(
+            self,
+            name: str,
+            latency_ns: int,
+            error: bool = False,
+            status: int | None = None,
+            size: int = 0,
+            phases: dict[str, int] | None = None
+    ) -> None:
+        """
+        Сохраняет один замер.
+
+        :param name: Имя метрики.
+        :param latency_ns: Латентность в наносекундах.
+        :param error: Завершился ли замер ошибкой.
+        :param status: HTTP-код ответа, если замер относится к запросу.
+        :param size: Размер тела ответа в байтах.
+        :param phases: Длительности стадий запроса в наносекундах (см. metrics.phases.PhaseTimer).
+        """
+        with self._lock:
+            metrics = self._metrics if self.steady_after is not None else self._warmup_target(name, latency_ns)
+            stats = metrics.get(name)
+            if stats is None:
+                stats = metrics[name] = MetricStats()
+            stats.histogram.record(latency_ns // 1000)
+            if error:
+                stats.errors += 1
+            if status is not None:
+                stats.statuses[status] += 1
+            stats.bytes += size
+            if phases is not None:
+                stats.record_phases(phases)
+
+    def _warmup_target(self, name: str, latency_ns: int) -> dict[str, MetricStats]:
+        # Вызывается под блокировкой, пока идёт прогрев: решает, куда записать замер
+        now = time.perf_counter()
+        elapsed = now - self.started_at
+        if elapsed < self.warmup.duration:
+            return self._warmup_metrics
+        if not self.warmup.detect:
+            self.steady_after = self.warmup.duration
+            return self._metrics
+        if elapsed >= self.warmup.max_duration:
+            self.steady_after = elapsed
+            return self._metrics
+
+        if self._window_started is None:
+            self._window_started = now
+        elif now - self._window_started >= self.warmup.window:
+            if self._close_window(now - self._window_started):
+                self.steady_after = elapsed
+                return self._metrics
+            self._window_started, self._window = now, {}
+        if self.warmup.metric is None or name == self.warmup.metric:
+            window = self._window.get(name)
+            if window is None:
+                window = self._window[name] = [0, 0]
+            window[0] += 1
+            window[1] += latency_ns
+        return self._warmup_metrics
+
+    def _close_window(self, duration: float) -> bool:
+        # Передаёт окно детекторам всех метрик: метрика без замеров в окне получает нулевую интенсивность
+        for name in self._window:
+            if name not in self._detectors:
+                self._detectors[name] = self.warmup.detector()
+        steady = bool(self._detectors)
+        for name, detector in self._detectors.items():
+            count, latency_ns = self._window.get(name, (0, 0))
+            steady = detector.add(count / duration, latency_ns / count if count else 0) and steady
+        return steady
+
+    def _steady_sources(self) -> dict[str, tuple[float | None, float]]:
+        # Время работы источник измеряет по своим часам: у воркеров и координатора разные started_at
+        if self._sources:
+            return dict(self._sources)
+        return {self._source: (self.steady_after, time.perf_counter() - self.started_at)}
+
+    def _mark_steady(self, sources: dict[str, tuple[float | None, float]]) -> None:
+        # Объединённое хранилище считается установившимся, когда прогрев закончился у всех источников
+        self._sources.update(sources)
+        offsets = [steady_after for steady_after, _ in self._sources.values()]
+        self.steady_after = None if None in offsets else max(offsets)
+
+    def merge(self, other: "MetricsRecorder") -> None:
+        """
+        Добавляет в хранилище все замеры другого хранилища.
+        """
+        with other._lock:
+            metrics, warmup = list(other._metrics.items()), list(other._warmup_metrics.items())
+            sources = other._steady_sources()
+        with self._lock:
+            for name, stats in metrics:
+                self._metrics.setdefault(name, MetricStats()).merge(stats)
+            for name, stats in warmup:
+                self._warmup_metrics.setdefault(name, MetricStats()).merge(stats)
+            self._mark_steady(sources)
+
+    def drain(self) -> bytes:
+        """
+        Забирает все накопленные с прошлого вызова замеры в компактном виде и очищает хранилище.
+
+        Используется для передачи приращений метрик из воркеров координатору,
+        который добавляет их к общему хранилищу через merge_encoded().
+        Замеры прогрева и моменты его окончания у источников передаются вместе с остальными.
+
+        :return: Сериализованные гистограммы и счётчики.
+        """
+        with self._lock:
+            metrics, self._metrics = self._metrics, {}
+            warmup, self._warmup_metrics = self._warmup_metrics, {}
+            sources = self._steady_sources()
+        return pickle.dumps(
+            (
+                {name: stats.encode() for name, stats in metrics.items()},
+                {name: stats.encode() for name, stats in warmup.items()},
+                sources
+            )
+        )
+
+    def take(self) -> dict[str, MetricStats]:
+        """
+        Забирает все накопленные с прошлого вызова замеры установившегося режима и очищает хранилище.
+
+        :return: Словарь {имя метрики: статистика}.
+        """
+        with self._lock:
+            metrics, self._metrics = self._metrics, {}
+        return metrics
+
+    def merge_encoded(self, data: bytes) -> None:
+        """
+        Добавляет в хранилище замеры, полученные через drain() другого хранилища.
+        """
+        metrics, warmup, sources = pickle.loads(data)
+        with self._lock:
+            for target, encoded_metrics in ((self._metrics, metrics), (self._warmup_metrics, warmup)):
+                for name, encoded in encoded_metrics.items():
+                    stats = MetricStats.decode(encoded)
+                    current = target.get(name)
+                    if current is None:
+                        target[name] = stats
+                    else:
+                        current.merge(stats)
+            self._mark_steady(sources)
+
+    def snapshot(self) -> dict[str, MetricSnapshotDict]:
+        """
+        Считает статистику по всем метрикам установившегося режима на текущий момент
+        (интенсивность — за время после прогрева).
+
+        Гистограммы объединённого хранилища содержат замеры источников, у которых прогрев закончился
+        в разное время, поэтому интенсивность считается за среднее время установившегося режима
+        источников: сумма замеров, делённая на него, равна сумме интенсивностей источников.
+        Время установившегося режима источника считается по его часам до момента последней передачи замеров,
+        то есть за тот же промежуток, что и полученные от него замеры.
+
+        :return: Словарь {имя метрики: статистика}.
+        """
+        with self._lock:
+            windows = [
+                running - steady_after
+                for steady_after, running in self._steady_sources().values()
+                if steady_after is not None
+            ]
+            elapsed = sum(windows) / len(windows) if windows else time.perf_counter() - self.started_at
+            elapsed = max(elapsed, 1e-9)
+            return {name: stats.snapshot(elapsed) for name, stats in self._metrics.items() if stats.histogram.count}
+
+    def warmup_snapshot(self) -> dict[str, MetricSnapshotDict]:
+        """
+        Считает статистику по замерам прогрева, не вошедшим в snapshot().
+
+        :return: Словарь {имя метрики: статистика}.
+        """
+        with self._lock:
+            if self.steady_after is None:
+                elapsed = time.perf_counter() - self.started_at
+            else:
+                elapsed = self.steady_after
+            elapsed = max(elapsed, 1e-9)
+            return {
+                name: stats.snapshot(elapsed) for name, stats in self._warmup_metrics.items() if stats.histogram.count
+            }
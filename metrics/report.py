@@ -0,0 +1,196 @@
+import json
+import sys
+import time
+from pathlib import Path
+from typing import TypedDict
+
+from metrics.phases import PHASES
+from metrics.recorder import MetricSnapshotDict
+
+REPORT_VERSION = 1
+
+COLUMNS = ("count", "errors", "rps", "mean", "p50", "p90", "p99", "p999", "max")
+HTTP_METHODS = ("GET", "POST", "PUT", "PATCH", "DELETE", "HEAD", "OPTIONS")
+
+
+class ReportDict(TypedDict):
+    """
+    Описание структуры JSON-отчёта о запуске нагрузки.
+    """
+    version: int
+    plan: str
+    created_at: str
+    duration: float
+    workers: int
+    python: str
+    steady_after: float
+    metrics: dict[str, MetricSnapshotDict]
+    warmup: dict[str, MetricSnapshotDict]
+
+
+class RegressionDict(TypedDict):
+    """
+    Описание структуры ухудшения метрики относительно базового отчёта.
+    """
+    name: str
+    value: str
+    baseline: float
+    current: float
+    change: float
+
+
+def format_snapshot(snapshot: dict[str, MetricSnapshotDict]) -> str:
+    """
+    Форматирует статистику по метрикам в текстовую таблицу (латентности в миллисекундах).
+
+    :param snapshot: Результат MetricsRecorder.snapshot().
+    :return: Таблица в виде строки.
+    """
+    width = max([len("name"), *(len(name) for name in snapshot)])
+    lines = [f"{'name':<{width}} " + " ".join(f"{column:>10}" for column in COLUMNS)]
+    for name in sorted(snapshot):
+        stats = snapshot[name]
+        cells = [
+            f"{stats[column]:>10}" if isinstance(stats[column], int) else f"{stats[column]:>10.2f}"
+            for column in COLUMNS
+        ]
+        lines.append(f"{name:<{width}} " + " ".join(cells))
+    return "\n".join(lines)
+
+
+def format_phases(snapshot: dict[str, MetricSnapshotDict], percentile: str = "p99") -> str:
+    """
+    Форматирует разбивку времени запросов по стадиям в текстовую таблицу (в миллисекундах).
+
+    :param snapshot: Результат MetricsRecorder.snapshot() с включённым trace_phases.
+    :param percentile: Какое значение показывать для каждой стадии: mean, p50, p90 или p99.
+    :return: Таблица в виде строки.
+    """
+    names = [name for name in sorted(snapshot) if snapshot[name]["phases"]]
+    width = max([len("name"), *(len(name) for name in names)])
+    lines = [f"{'name':<{width}} " + " ".join(f"{phase:>10}" for phase in PHASES) + f"  ({percentile})"]
+    for name in names:
+        phases = snapshot[name]["phases"]
+        lines.append(
+            f"{name:<{width}} " + " ".join(
+                f"{phases[phase][percentile]:>10.2f}" if phase in phases else f"{'-':>10}" for phase in PHASES
+            )
+        )
+    return "\n".join(lines)
+
+
+def format_progress(snapshot: dict[str, MetricSnapshotDict]) -> str:
+    """
+    Краткая строка о ходе теста по HTTP-запросам: количество, интенсивность, ошибки и худший p99 среди эндпоинтов.
+
+    :param snapshot: Результат MetricsRecorder.snapshot().
+    :return: Строка для вывода в консоль.
+    """
+    requests = [stats for name, stats in snapshot.items() if name.partition(" ")[0] in HTTP_METHODS]
+    return (
+        f"requests={sum(stats['count'] for stats in requests)} "
+        f"rps={sum(stats['rps'] for stats in requests):.1f} "
+        f"errors={sum(stats['errors'] for stats in requests)} "
+        f"max_p99={max((stats['p99'] for stats in requests), default=0):.2f}ms"
+    )
+
+
+def build_report(
+        snapshot: dict[str, MetricSnapshotDict],
+        plan: str,
+        duration: float,
+        workers: int,
+        warmup: dict[str, MetricSnapshotDict] | None = None,
+        steady_after: float = 0
+) -> ReportDict:
+    """
+    Собирает отчёт о запуске для сохранения в JSON и последующего сравнения.
+
+    :param snapshot: Результат MetricsRecorder.snapshot() — статистика установившегося режима.
+    :param plan: Ссылка на план или путь к файлу сценария.
+    :param duration: Длительность теста в секундах.
+    :param workers: Количество процессов-генераторов.
+    :param warmup: Результат MetricsRecorder.warmup_snapshot(), сохраняется для разбора, но не сравнивается.
+    :param steady_after: Через сколько секунд от начала теста закончился прогрев.
+    """
+    return ReportDict(
+        version=REPORT_VERSION,
+        plan=plan,
+        created_at=time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        duration=round(duration, 3),
+        workers=workers,
+        python=".".join(map(str, sys.version_info[:3])),
+        steady_after=round(steady_after, 3),
+        metrics=snapshot,
+        warmup=warmup or {}
+    )
+
+
+def save_report(report: ReportDict, path: str | Path) -> None:
+    Path(path).write_text(json.dumps(report, indent=2, ensure_ascii=False), encoding="utf-8")
+
+
+def load_report(path: str | Path) -> ReportDict:
+    report = json.loads(Path(path).read_text(encoding="utf-8"))
+    if report.get("version") != REPORT_VERSION:
+        raise ValueError(f"Unsupported report version: {report.get('version')}")
+    # Отчёты, сохранённые до разделения прогрева и установившегося режима
+    report.setdefault("steady_after", 0.0)
+    report.setdefault("warmup", {})
+    return report
+
+
+def compare_reports(
+        current: ReportDict,
+        baseline: ReportDict,
+        threshold: float = 0.1,
+        percentile: str = "p99"
+) -> list[RegressionDict]:
+    """
+    Находит метрики, ухудшившиеся относительно базового отчёта больше чем на threshold:
+    выросший перцентиль латентности, выросшая доля ошибок или упавшая пропускная способность.
+    Сравниваются только метрики, которые есть в обоих отчётах.
+
+    :param current: Отчёт проверяемого запуска.
+    :param baseline: Базовый отчёт.
+    :param threshold: Допустимое относительное ухудшение (0.1 — 10%).
+    :param percentile: Перцентиль латентности: p50, p90, p99 или p999.
+    :return: Список ухудшений.
+    """
+    regressions = []
+    for name, stats in sorted(current["metrics"].items()):
+        base = baseline["metrics"].get(name)
+        if base is None:
+            continue
+        values = (
+            (percentile, base[percentile], stats[percentile], 1),
+            ("error_rate", base["errors"] / max(base["count"], 1), stats["errors"] / max(stats["count"], 1), 1),
+            ("rps", base["rps"], stats["rps"], -1),
+        )
+        for value, before, after, direction in values:
+            if before <= 0:
+                if value == "error_rate" and after > 0:
+                    regressions.append(RegressionDict(name=name, value=value, baseline=0, current=after, change=1))
+                continue
+            change = (after - before) / before
+            if change * direction > threshold:
+                regressions.append(
+                    RegressionDict(name=name, value=value, baseline=before, current=after, change=change)
+                )
+    return regressions
+
+
+def format_regressions(regressions: list[RegressionDict]) -> str:
+    """
+    Форматирует найденные ухудшения в текстовую таблицу.
+    """
+    if not regressions:
+        return "No regressions"
+    width = max([len("name"), *(len(item["name"]) for item in regressions)])
+    lines = [f"{'name':<{width}} {'value':>10} {'baseline':>10} {'current':>10} {'change':>8}"]
+    for item in regressions:
+        lines.append(
+            f"{item['name']:<{width}} {item['value']:>10} {item['baseline']:>10.2f} "
+            f"{item['current']:>10.2f} {item['change']:>+8.1%}"
+        )
+    return "\n".join(lines)
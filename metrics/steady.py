@@ -0,0 +1,124 @@
+import math
+from collections import deque
+from dataclasses import dataclass
+
+
+class SteadyStateDetector:
+    """
+    Определяет установившийся режим по последовательности окон измерения.
+
+    Для каждого окна (например, одной секунды теста) передаются пропускная способность и средняя латентность.
+    Режим считается установившимся, когда в последних windows окнах у каждой величины коэффициент вариации
+    (стандартное отклонение, делённое на среднее) и дрейф (разница средних старшей и младшей половины окон,
+    делённая на общее среднее) не превышают допуск: пул соединений прогрет, кэши сервиса заполнены
+    и значения колеблются вокруг постоянного уровня, а не плавно снижаются или растут.
+
+    :param windows: Сколько последних окон должны быть стабильными.
+    :param throughput_tolerance: Допустимый коэффициент вариации пропускной способности.
+    :param latency_tolerance: Допустимый коэффициент вариации латентности.
+    """
+
+    def __init__(self, windows: int = 5, throughput_tolerance: float = 0.1, latency_tolerance: float = 0.2) -> None:
+        if windows < 2:
+            raise ValueError("At least two windows are required to detect steady state")
+
+        self.windows = windows
+        self.throughput_tolerance = throughput_tolerance
+        self.latency_tolerance = latency_tolerance
+        self.throughput: deque[float] = deque(maxlen=windows)
+        self.latency: deque[float] = deque(maxlen=windows)
+
+    def add(self, throughput: float, latency: float) -> bool:
+        """
+        Добавляет очередное окно.
+
+        :param throughput: Пропускная способность в окне, например запросов в секунду.
+        :param latency: Средняя латентность в окне.
+        :return: Установился ли режим с учётом этого окна.
+        """
+        self.throughput.append(throughput)
+        self.latency.append(latency)
+        return self.steady
+
+    @property
+    def steady(self) -> bool:
+        return (
+            len(self.throughput) == self.windows
+            and _stable(self.throughput, self.throughput_tolerance)
+            and _stable(self.latency, self.latency_tolerance)
+        )
+
+    def reset(self) -> None:
+        self.throughput.clear()
+        self.latency.clear()
+
+
+@dataclass(frozen=True)
+class WarmupPolicy:
+    """
+    Исключение прогрева из результатов теста (см. MetricsRecorder).
+
+    Замеры первых duration секунд считаются прогревом: холодный пул соединений, прогрев JIT и кэшей
+    сервиса, первые создания пользователей. При detect после этого окна прогрев продолжается,
+    пока SteadyStateDetector не увидит установившийся режим по окнам длиной window секунд,
+    но не дольше max_duration секунд от начала теста. Режим определяется для каждой метрики отдельно
+    и считается установившимся, когда установился у всех метрик: иначе медленно прогревающийся
+    редкий запрос теряется на фоне частых. Если у сценария есть редкие метрики (например, ошибки),
+    режим лучше определять по одной метрике metric.
+
+    :param duration: Явное окно прогрева в секундах.
+    :param detect: Определять окончание прогрева по установившемуся режиму.
+    :param window: Длительность окна детектора в секундах.
+    :param windows: Сколько последних окон должны быть стабильными.
+    :param throughput_tolerance: Допустимый коэффициент вариации пропускной способности.
+    :param latency_tolerance: Допустимый коэффициент вариации средней латентности.
+    :param max_duration: Максимальная длительность прогрева в секундах.
+    :param metric: Метрика, по которой определяется установившийся режим, например
+        "make_purchase_operation" (по умолчанию все метрики).
+    """
+    duration: float = 0
+    detect: bool = False
+    window: float = 1
+    windows: int = 5
+    throughput_tolerance: float = 0.1
+    latency_tolerance: float = 0.2
+    max_duration: float = 120
+    metric: str | None = None
+
+    def __post_init__(self) -> None:
+        if self.duration < 0 or self.window <= 0:
+            raise ValueError("Warm-up duration must not be negative and window must be positive")
+
+    @property
+    def enabled(self) -> bool:
+        return self.duration > 0 or self.detect
+
+    def detector(self) -> SteadyStateDetector:
+        return SteadyStateDetector(self.windows, self.throughput_tolerance, self.latency_tolerance)
+
+
+def variation(values: deque[float] | list[float]) -> float:
+    """
+    Коэффициент вариации: стандартное отклонение, делённое на среднее (inf для нулевого среднего).
+    """
+    mean = sum(values) / len(values)
+    if mean <= 0:
+        return math.inf
+    return math.sqrt(sum((value - mean) ** 2 for value in values) / len(values)) / mean
+
+
+def drift(values: deque[float] | list[float]) -> float:
+    """
+    Относительный дрейф: разница средних второй и первой половины значений, делённая на общее среднее
+    (inf для нулевого среднего).
+    """
+    mean = sum(values) / len(values)
+    if mean <= 0:
+        return math.inf
+    values, half = list(values), len(values) // 2
+    older, newer = values[:half], values[len(values) - half:]
+    return abs(sum(newer) / half - sum(older) / half) / mean
+
+
+def _stable(values: deque[float], tolerance: float) -> bool:
+    return variation(values) <= tolerance and drift(values) <= tolerance
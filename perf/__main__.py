@@ -0,0 +1,41 @@
+import argparse
+import importlib
+import sys
+
+# Подкоманды и их модули: модуль импортируется только при вызове своей подкоманды,
+# поэтому perf --help и запуск лёгких подкоманд не загружают httpx, asyncio и клиентов
+COMMANDS = {
+    "run": ("perf.run", "Запуск плана нагрузки в нескольких процессах с сохранением JSON-отчёта"),
+    "seed": ("fixtures.__main__", "Подготовка тестовых данных в http-gateway"),
+    "capacity": ("perf.capacity", "Поиск максимальной нагрузки в рамках SLO (p99, ошибки, насыщение)"),
+    "report": ("perf.report", "Вывод сохранённого отчёта"),
+    "compare": ("perf.compare", "Сравнение отчёта с базовым, код выхода 1 при ухудшении"),
+    "fake-gateway": ("fake_gateway.__main__", "Фейковый http-gateway с состоянием в памяти"),
+}
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="perf",
+        description="Нагрузочное тестирование http-gateway",
+        epilog="\n".join(f"  {name:<14}{description}" for name, (_, description) in COMMANDS.items()),
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("command", choices=list(COMMANDS), metavar="command", help="Подкоманда (см. ниже)")
+    parser.add_argument("args", nargs=argparse.REMAINDER, help="Аргументы подкоманды, perf <command> --help")
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    """
+    Разбирает имя подкоманды и передаёт остальные аргументы функции cli() её модуля.
+
+    :return: Код выхода.
+    """
+    args = build_parser().parse_args(argv)
+    module = importlib.import_module(COMMANDS[args.command][0])
+    return module.cli(args.args, prog=f"perf {args.command}") or 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
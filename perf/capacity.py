@@ -0,0 +1,68 @@
+import argparse
+import asyncio
+import json
+import sys
+from dataclasses import replace
+from pathlib import Path
+
+from load.capacity import CapacityPointDict, CapacitySearch, CapacitySLO, format_curve
+from load.plan import import_plan
+
+
+def build_parser(prog: str = "perf capacity") -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog=prog,
+        description="Поиск максимальной нагрузки в рамках SLO: ступени виртуальных пользователей "
+                    "(план с stages) или запусков в секунду (план с rate)"
+    )
+    parser.add_argument("plan", help="План в виде модуль:атрибут или файл сценария (scenarios/*.yaml)")
+    parser.add_argument("--scenario", help="Нагружать только этот сценарий плана")
+    parser.add_argument("--metric", help="Метрика для проверки SLO (по умолчанию итерация сценария)")
+    parser.add_argument("--p99", type=float, required=True, help="Максимальный p99 в миллисекундах")
+    parser.add_argument("--error-rate", type=float, default=0.01, help="Максимальная доля ошибок")
+    parser.add_argument("--min-scaling", type=float, default=0.5, help="Минимальная отдача от роста нагрузки")
+    parser.add_argument("--start", type=float, help="Первая ступень")
+    parser.add_argument("--factor", type=float, default=2, help="Во сколько раз увеличивать нагрузку")
+    parser.add_argument("--max-level", type=float, help="Максимальная ступень")
+    parser.add_argument("--refine", type=int, default=3, help="Ступеней на уточнение границы")
+    parser.add_argument("--window", type=float, default=2, help="Длительность окна измерения в секундах")
+    parser.add_argument("--steady-windows", type=int, default=5, help="Стабильных окон в точке кривой")
+    parser.add_argument("--max-step-duration", type=float, default=60, help="Максимальная длительность ступени")
+    parser.add_argument("--base-url", help="Адрес http-gateway вместо указанного в плане")
+    parser.add_argument("--report", help="Файл для сохранения результата в JSON")
+    return parser
+
+
+def cli(argv: list[str] | None = None, prog: str = "perf capacity") -> int:
+    args = build_parser(prog).parse_args(argv)
+    plan = import_plan(args.plan)
+    if args.base_url:
+        plan = replace(plan, pool=replace(plan.pool, base_url=args.base_url))
+
+    def progress(point: CapacityPointDict) -> None:
+        print(
+            f"level={point['level']:g} rps={point['rps']:.1f} p99={point['p99']:.2f}ms "
+            f"errors={point['error_rate']:.2%} steady={point['steady']} {'ok' if point['passed'] else point['reason']}",
+            file=sys.stderr
+        )
+
+    search = CapacitySearch(
+        plan=plan,
+        slo=CapacitySLO(p99=args.p99, error_rate=args.error_rate, min_scaling=args.min_scaling),
+        scenario=args.scenario,
+        metric=args.metric,
+        start=args.start,
+        factor=args.factor,
+        max_level=args.max_level,
+        refine=args.refine,
+        window=args.window,
+        steady_windows=args.steady_windows,
+        max_step_duration=args.max_step_duration,
+        on_point=progress
+    )
+    result = asyncio.run(search.run())
+    print(format_curve(result))
+    if args.report:
+        Path(args.report).write_text(json.dumps(result, indent=2), encoding="utf-8")
+        print(f"Report saved to {args.report}", file=sys.stderr)
+    return 0
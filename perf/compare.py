@@ -0,0 +1,19 @@
+import argparse
+
+from metrics.report import compare_reports, format_regressions, load_report
+
+
+def build_parser(prog: str = "perf compare") -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog=prog, description="Сравнение отчёта о запуске с базовым")
+    parser.add_argument("report", help="Отчёт проверяемого запуска")
+    parser.add_argument("baseline", help="Базовый отчёт")
+    parser.add_argument("--threshold", type=float, default=0.1, help="Допустимое ухудшение (0.1 — 10%%)")
+    parser.add_argument("--percentile", default="p99", choices=("p50", "p90", "p99", "p999"))
+    return parser
+
+
+def cli(argv: list[str] | None = None, prog: str = "perf compare") -> int:
+    args = build_parser(prog).parse_args(argv)
+    regressions = compare_reports(load_report(args.report), load_report(args.baseline), args.threshold, args.percentile)
+    print(format_regressions(regressions))
+    return 1 if regressions else 0
@@ -0,0 +1,32 @@
+import argparse
+
+from metrics.report import format_phases, format_snapshot, load_report
+
+
+def build_parser(prog: str = "perf report") -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog=prog, description="Вывод сохранённого отчёта о запуске")
+    parser.add_argument("report", help="JSON-отчёт, сохранённый через perf run --report")
+    parser.add_argument("-k", "--filter", default="", help="Показывать только метрики, содержащие подстроку")
+    parser.add_argument("--warmup", action="store_true", help="Показать также замеры прогрева")
+    parser.add_argument("--phases", default=None, metavar="PERCENTILE", help="Разбивка по стадиям: mean, p50, p90, p99")
+    return parser
+
+
+def cli(argv: list[str] | None = None, prog: str = "perf report") -> int:
+    args = build_parser(prog).parse_args(argv)
+    report = load_report(args.report)
+    metrics = {name: stats for name, stats in report["metrics"].items() if args.filter in name}
+    print(
+        f"plan={report['plan']} created_at={report['created_at']} "
+        f"duration={report['duration']:.1f}s steady_after={report['steady_after']:.1f}s "
+        f"workers={report['workers']} python={report['python']}"
+    )
+    print(format_snapshot(metrics))
+    warmup = {name: stats for name, stats in report["warmup"].items() if args.filter in name}
+    if args.warmup and warmup:
+        print("\nWarm-up (excluded from the results above):")
+        print(format_snapshot(warmup))
+    if args.phases:
+        print()
+        print(format_phases(metrics, args.phases))
+    return 0
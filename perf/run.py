@@ -0,0 +1,88 @@
+import argparse
+import asyncio
+import os
+import sys
+import time
+from dataclasses import replace
+
+from load.multiprocess import run_multiprocess
+from load.plan import import_plan, run_plan
+from metrics.recorder import MetricsRecorder
+from metrics.report import build_report, format_phases, format_progress, format_snapshot, save_report
+from metrics.steady import WarmupPolicy
+
+
+def build_parser(prog: str = "perf run") -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog=prog, description="Запуск плана нагрузки")
+    parser.add_argument(
+        "plan",
+        nargs="?",
+        default="load_run_gateway_flows:plan",
+        help="План в виде модуль:атрибут или файл сценария (scenarios/*.yaml)"
+    )
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Количество процессов")
+    parser.add_argument("--base-url", help="Адрес http-gateway вместо указанного в плане")
+    parser.add_argument("--warmup", type=float, help="Исключить из результатов первые WARMUP секунд")
+    parser.add_argument(
+        "--detect-steady-state",
+        action="store_true",
+        help="Исключить из результатов замеры до установившегося режима (после --warmup, если задан)"
+    )
+    parser.add_argument(
+        "--steady-metric",
+        help="Определять установившийся режим по одной метрике, например итерации сценария (по умолчанию по всем)"
+    )
+    parser.add_argument("--report", help="Файл для сохранения JSON-отчёта")
+    parser.add_argument("--interval", type=float, default=1, help="Период вывода промежуточной статистики")
+    parser.add_argument("--quiet", action="store_true", help="Не выводить промежуточную статистику")
+    return parser
+
+
+def cli(argv: list[str] | None = None, prog: str = "perf run") -> int:
+    args = build_parser(prog).parse_args(argv)
+    plan = import_plan(args.plan)
+    if args.base_url:
+        plan = replace(plan, pool=replace(plan.pool, base_url=args.base_url))
+    if args.warmup is not None or args.detect_steady_state or args.steady_metric:
+        warmup = plan.warmup or WarmupPolicy()
+        if args.warmup is not None:
+            warmup = replace(warmup, duration=args.warmup)
+        if args.detect_steady_state or args.steady_metric:
+            warmup = replace(warmup, detect=True)
+        if args.steady_metric:
+            warmup = replace(warmup, metric=args.steady_metric)
+        plan = replace(plan, warmup=warmup)
+
+    def progress(recorder: MetricsRecorder) -> None:
+        if args.quiet:
+            return
+        snapshot = recorder.snapshot()
+        if snapshot:
+            print(format_progress(snapshot), file=sys.stderr)
+        else:
+            print(f"warm-up {format_progress(recorder.warmup_snapshot())}", file=sys.stderr)
+
+    started = time.perf_counter()
+    if args.workers == 1:
+        recorder = MetricsRecorder(trace_phases=plan.trace_phases, warmup=plan.warmup)
+        recorder = asyncio.run(run_plan(plan, recorder))
+    else:
+        recorder = run_multiprocess(plan, workers=args.workers, interval=args.interval, on_update=progress)
+    duration = time.perf_counter() - started
+
+    snapshot, warmup = recorder.snapshot(), recorder.warmup_snapshot()
+    # Если установившийся режим так и не наступил, весь тест остался прогревом
+    steady_after = recorder.steady_after if recorder.steady_after is not None else duration
+    if warmup:
+        print(f"Warm-up ({steady_after:.1f}s, excluded from the results below):")
+        print(format_snapshot(warmup))
+        print()
+    print(format_snapshot(snapshot))
+    if plan.trace_phases:
+        print()
+        print(format_phases(snapshot))
+    if args.report:
+        report = build_report(snapshot, args.plan, duration, args.workers, warmup, steady_after)
+        save_report(report, args.report)
+        print(f"Report saved to {args.report}", file=sys.stderr)
+    return 0
@@ -0,0 +1,56 @@
+import pytest
+
+from load.arrival import ConstantRate, PoissonRate, StepRate
+from load.spec import ScenarioSpecError, compile_plan
+
+
+def merged_arrivals(rate, workers: int) -> list[float]:
+    return sorted(offset for worker in range(workers) for offset in rate.scaled(1 / workers, worker).arrivals())
+
+
+@pytest.mark.parametrize("rate", [ConstantRate(rps=100, duration=1), StepRate(steps=((0.5, 100), (0.5, 200)))])
+def test_worker_shares_are_evenly_staggered(rate):
+    expected = list(rate.arrivals())
+    merged = merged_arrivals(rate, workers=4)
+
+    assert len(merged) == len(expected)
+    assert merged == pytest.approx(expected)
+
+
+def test_step_rate_stagger_survives_nested_sharing():
+    rate = StepRate(steps=((1, 120),))
+    # Два генератора по три процесса
+    merged = sorted(
+        offset
+        for generator in range(2)
+        for worker in range(3)
+        for offset in rate.scaled(1 / 2, generator).scaled(1 / 3, worker).arrivals()
+    )
+    assert merged == pytest.approx(list(rate.arrivals()))
+
+
+def test_step_rate_allows_pauses():
+    rate = StepRate(steps=((1, 0), (1, 2)))
+    assert list(rate.arrivals()) == [1.0, 1.5]
+
+
+@pytest.mark.parametrize(
+    "factory",
+    [
+        lambda: ConstantRate(rps=0, duration=1),
+        lambda: PoissonRate(rps=-1, duration=1),
+        lambda: StepRate(steps=((1, -5),)),
+    ]
+)
+def test_non_positive_rps_is_rejected(factory):
+    with pytest.raises(ValueError):
+        factory()
+
+
+def test_spec_reports_invalid_rps_with_location():
+    data = {
+        "scenarios": [{"name": "get_user", "flow": "load.flows:get_user_flow"}],
+        "rate": {"type": "constant", "rps": 0, "duration": 1}
+    }
+    with pytest.raises(ScenarioSpecError, match="plan.rate"):
+        compile_plan(data)
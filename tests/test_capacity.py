@@ -0,0 +1,33 @@
+from collections import deque
+
+from load.arrival import ConstantRate
+from load.capacity import CapacitySearch, CapacitySLO
+from load.plan import LoadPlan
+from load.scenario import Scenario, ScenarioContext
+from metrics.recorder import MetricsRecorder
+
+
+async def noop_flow(ctx: ScenarioContext) -> None:
+    pass
+
+
+def build_windows(count: int, latency_ms: float) -> deque:
+    recorder = MetricsRecorder()
+    for _ in range(count):
+        recorder.record("noop", int(latency_ms * 1_000_000))
+    return deque([(recorder.take(), 1.0)])
+
+
+def test_unsteady_point_is_not_reported_as_capacity():
+    plan = LoadPlan(scenarios=(Scenario("noop", noop_flow),), rate=ConstantRate(rps=1, duration=1))
+    search = CapacitySearch(plan, CapacitySLO(p99=100, min_scaling=0))
+
+    search.points = [
+        search._point(10, build_windows(10, 5), steady=True),
+        search._point(20, build_windows(20, 5), steady=False),
+        search._point(40, build_windows(40, 500), steady=False)
+    ]
+
+    assert [point["reason"] for point in search.points] == ["", "unsteady", "p99"]
+    result = search.result()
+    assert (result["max_rps"], result["level"], result["limit"]) == (10, 10, "unsteady")
@@ -0,0 +1,45 @@
+from pathlib import Path
+
+import pytest
+
+from load.dag import FlowGraph, FlowStep
+from load.spec import load_plan_file
+
+SCENARIOS = Path(__file__).resolve().parent.parent / "scenarios"
+
+
+@pytest.mark.parametrize(
+    "client, method",
+    [
+        ("users", "__init__"),
+        ("users", "_missing"),
+        ("users", "request"),
+        ("users", "get"),
+        ("users", "create_user_api"),
+        ("accounts", "get_accounts_api"),
+        ("operations", "get_operations_api_summary"),
+        ("operations", "get_operations_many"),
+        ("operations", "iter_operations"),
+        ("operations", "missing")
+    ]
+)
+def test_rejects_non_step_methods(client: str, method: str):
+    with pytest.raises(ValueError, match="is not a high-level coroutine method"):
+        FlowGraph([FlowStep("step", client, method)])
+
+
+def test_accepts_high_level_coroutine_methods():
+    graph = FlowGraph(
+        [
+            FlowStep("create_user", "users", "create_user"),
+            FlowStep("get_operations", "operations", "get_operations", {"account_id": "account-1"}),
+            FlowStep("get_tariff_document", "documents", "get_tariff_document", {"account_id": "account-1"})
+        ]
+    )
+
+    assert [step.name for step in graph.order] == ["create_user", "get_operations", "get_tariff_document"]
+
+
+@pytest.mark.parametrize("path", sorted(SCENARIOS.glob("*.yaml")), ids=lambda path: path.name)
+def test_bundled_scenario_files_compile(path: Path):
+    assert load_plan_file(path).scenarios
@@ -0,0 +1,34 @@
+import asyncio
+
+from load.arrival import ConstantRate
+from load.distributed import LoadController, LoadWorker
+from load.plan import LoadPlan
+from load.scenario import Scenario, ScenarioContext
+
+
+async def sleep_flow(ctx: ScenarioContext) -> None:
+    await ctx.step("sleep", asyncio.sleep(0.001))
+
+
+def test_controller_merges_metrics_of_two_workers_over_tcp():
+    plan = LoadPlan(
+        scenarios=(Scenario(name="sleep", flow=sleep_flow),),
+        rate=ConstantRate(rps=200, duration=0.5)
+    )
+
+    async def run():
+        controller = LoadController(plan, workers=2, host="127.0.0.1", port=0, start_delay=0.2)
+        await controller.start()
+        workers = [LoadWorker(host="127.0.0.1", port=controller.port, interval=0.1) for _ in range(2)]
+        recorder, *_ = await asyncio.wait_for(
+            asyncio.gather(controller.run(), *(worker.run() for worker in workers)),
+            timeout=30
+        )
+        return recorder
+
+    snapshot = asyncio.run(run()).snapshot()
+
+    expected = len(list(plan.rate.arrivals()))
+    assert snapshot["sleep"]["count"] == expected
+    assert snapshot["sleep/sleep"]["count"] == expected
+    assert snapshot["sleep"]["errors"] == 0
@@ -0,0 +1,90 @@
+import asyncio
+import threading
+import time
+
+from load.arrival import ConstantRate
+from load.engine import LoadEngine
+from load.plan import LoadPlan, run_plan
+from load.scenario import GatewayClients, Scenario, ScenarioContext
+from load.spec import compile_plan
+from load.stages import hold
+from metrics.recorder import MetricsRecorder
+
+SEEN: list[tuple[int, str, int]] = []
+
+
+async def failing_flow(ctx: ScenarioContext) -> None:
+    # Ошибка до первого await, как у сценария без подготовленного состояния
+    ctx.state["card_id"]
+
+
+def test_synchronously_failing_flow_does_not_block_the_loop():
+    recorder = MetricsRecorder()
+    engine = LoadEngine(
+        scenarios=[Scenario(name="failing", flow=failing_flow)],
+        stages=[hold(duration=0.3, target=2)],
+        clients=None,
+        recorder=recorder,
+        tick=0.05
+    )
+    # Зависший event loop нельзя прервать изнутри, поэтому движок запускается в отдельном потоке
+    thread = threading.Thread(target=asyncio.run, args=(engine.run(),), daemon=True)
+    thread.start()
+    thread.join(timeout=5)
+
+    assert not thread.is_alive(), "event loop is blocked by the failing flow"
+    stats = recorder.snapshot()["failing"]
+    assert stats["count"] > 0
+    assert stats["errors"] == stats["count"]
+
+
+async def seed_state(clients: GatewayClients) -> dict[str, str]:
+    return {"card_id": "card-1"}
+
+
+async def state_flow(ctx: ScenarioContext) -> None:
+    # Каждый пользователь меняет только свою копию состояния
+    ctx.state["iterations"] = ctx.state.get("iterations", 0) + 1
+    SEEN.append((ctx.vu_id, ctx.state["card_id"], ctx.state["iterations"]))
+    await asyncio.sleep(0.01)
+
+
+def test_closed_model_plan_runs_setup_for_virtual_users():
+    SEEN.clear()
+    plan = compile_plan(
+        {
+            "scenarios": [{"name": "state", "flow": "tests.test_engine:state_flow"}],
+            "stages": [{"duration": 0.05, "target": 2}, {"duration": 0.3, "target": 2}],
+            "setup": "tests.test_engine:seed_state"
+        }
+    )
+
+    recorder = asyncio.run(run_plan(plan, MetricsRecorder()))
+
+    assert recorder.snapshot()["state"]["errors"] == 0
+    assert {vu_id for vu_id, _, _ in SEEN} == {0, 1}
+    assert {card_id for _, card_id, _ in SEEN} == {"card-1"}
+    for vu_id in (0, 1):
+        iterations = [count for user, _, count in SEEN if user == vu_id]
+        assert iterations == list(range(1, len(iterations) + 1))
+
+
+def test_load_starts_after_setup():
+    finished: list[float] = []
+
+    async def slow_setup(clients: GatewayClients) -> dict[str, str]:
+        await asyncio.sleep(0.05)
+        finished.append(time.perf_counter())
+        return {"card_id": "card-1"}
+
+    plan = LoadPlan(
+        scenarios=(Scenario("state", state_flow),),
+        rate=ConstantRate(rps=20, duration=0.1),
+        setup=slow_setup
+    )
+    recorder = MetricsRecorder()
+
+    asyncio.run(run_plan(plan, recorder))
+
+    # Время подготовки не входит во время, за которое считается интенсивность
+    assert recorder.started_at >= finished[0]
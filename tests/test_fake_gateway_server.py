@@ -0,0 +1,137 @@
+import asyncio
+import json
+import time
+
+import pytest
+
+from fake_gateway.server import (
+    FakeGatewayApp,
+    FakeGatewayConfig,
+    LatencyDistribution,
+    RouteBehaviour,
+    serve
+)
+
+USER = {"email": "user@example.com", "lastName": "A", "firstName": "B", "middleName": "C", "phoneNumber": "1"}
+
+
+def post(app: FakeGatewayApp, path: str, body: dict) -> tuple[int, dict]:
+    status, payload, _ = app.handle("POST", path, json.dumps(body).encode())
+    return status, json.loads(payload)
+
+
+def test_routes_requests_to_state():
+    app = FakeGatewayApp()
+    status, created = post(app, "/api/v1/users", USER)
+    assert status == 200
+    user_id = created["user"]["id"]
+
+    status, account = post(app, "/api/v1/accounts/open-debit-card-account", {"userId": user_id})
+    assert status == 200
+    assert account["account"]["type"] == "DEBIT_CARD"
+
+    status, payload, delay = app.handle("GET", f"/api/v1/users/{user_id}", b"")
+    assert (status, json.loads(payload)["user"]["email"], delay) == (200, USER["email"], 0)
+    status, payload, _ = app.handle("GET", f"/api/v1/accounts?userId={user_id}", b"")
+    assert status == 200
+    assert [item["type"] for item in json.loads(payload)["accounts"]] == ["DEBIT_CARD"]
+
+
+@pytest.mark.parametrize(
+    "method, target, body, status",
+    [
+        ("GET", "/api/v1/unknown", b"", 404),
+        ("DELETE", "/api/v1/users", b"", 404),
+        ("GET", "/api/v1/users/missing", b"", 404),
+        ("GET", "/api/v1/users/a/b", b"", 404),
+        ("POST", "/api/v1/users", json.dumps(USER).encode(), 409),
+        ("POST", "/api/v1/accounts/open-deposit-account", b"{}", 422),
+        ("POST", "/api/v1/users", b"not json", 422),
+        ("GET", "/api/v1/accounts", b"", 422)
+    ]
+)
+def test_error_statuses(method: str, target: str, body: bytes, status: int):
+    app = FakeGatewayApp()
+    assert post(app, "/api/v1/users", USER)[0] == 200
+
+    assert app.handle(method, target, body)[0] == status
+
+
+def test_injects_errors_and_latency_per_route():
+    app = FakeGatewayApp(
+        config=FakeGatewayConfig(
+            default=RouteBehaviour(latency=LatencyDistribution("constant", 5)),
+            routes={"GET /api/v1/users/{user_id}": RouteBehaviour(error_rate=1)}
+        )
+    )
+
+    status, _, delay = app.handle("POST", "/api/v1/users", json.dumps(USER).encode())
+    assert (status, delay) == (200, 0.005)
+    status, payload, delay = app.handle("GET", "/api/v1/users/any", b"")
+    assert (status, json.loads(payload), delay) == (500, {"detail": "Injected error"}, 0)
+
+
+def test_parses_latency_distributions():
+    assert LatencyDistribution.parse("3") == LatencyDistribution("constant", 3)
+    assert LatencyDistribution.parse("lognormal:5,0.5") == LatencyDistribution("lognormal", 5, 0.5)
+    with pytest.raises(ValueError):
+        LatencyDistribution("unknown").sample()
+
+
+async def exchange(port: int, data: bytes) -> bytes:
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(data)
+    await writer.drain()
+    # Чтение до закрытия соединения сервером: зависание означает, что соединение не закрыто
+    response = await asyncio.wait_for(reader.read(), timeout=5)
+    writer.close()
+    return response
+
+
+def run_with_server(scenario, app: FakeGatewayApp | None = None):
+    async def run():
+        server = await serve(port=0, app=app)
+        try:
+            return await scenario(server.sockets[0].getsockname()[1])
+        finally:
+            server.close()
+
+    return asyncio.run(run())
+
+
+def test_keep_alive_serves_pipelined_requests_in_order():
+    app = FakeGatewayApp(config=FakeGatewayConfig(default=RouteBehaviour(latency=LatencyDistribution("constant", 50))))
+
+    async def scenario(port: int) -> tuple[bytes, float]:
+        started = time.perf_counter()
+        response = await exchange(
+            port,
+            b"GET /api/v1/users/a HTTP/1.1\r\nHost: x\r\n\r\n"
+            b"GET /api/v1/users/b HTTP/1.1\r\nHost: x\r\nConnection: close\r\n\r\n"
+        )
+        return response, time.perf_counter() - started
+
+    response, elapsed = run_with_server(scenario, app)
+
+    assert response.count(b"HTTP/1.1 404 Not Found") == 2
+    assert response.index(b"User a not found") < response.index(b"User b not found")
+    assert response.rstrip().endswith(b'"}')
+    assert b"Connection: close" in response.split(b"User a not found")[1]
+    assert elapsed >= 0.1
+
+
+@pytest.mark.parametrize(
+    "request_head",
+    [
+        b"GARBAGE\r\n\r\n",
+        b"GET /api/v1/users/a\r\n\r\n",
+        b"POST /api/v1/users HTTP/1.1\r\nContent-Length: ten\r\n\r\n",
+        b"POST /api/v1/users HTTP/1.1\r\nContent-Length: -1\r\n\r\n"
+    ]
+)
+def test_malformed_request_gets_400_and_connection_is_closed(request_head: bytes):
+    response = run_with_server(lambda port: exchange(port, request_head + b"GET /api/v1/users/a HTTP/1.1\r\n\r\n"))
+
+    assert response.startswith(b"HTTP/1.1 400 Bad Request\r\n")
+    assert b"Connection: close" in response
+    assert response.count(b"HTTP/1.1") == 1
@@ -0,0 +1,13 @@
+from datetime import date
+
+from fake_gateway.state import expiry_date
+
+
+def test_expiry_date_keeps_day_and_month():
+    assert expiry_date(date(2025, 6, 15)) == date(2028, 6, 15)
+
+
+def test_expiry_date_of_leap_day_is_clamped():
+    assert expiry_date(date(2024, 2, 29)) == date(2027, 2, 28)
+    # Через 4 года 29 февраля существует
+    assert expiry_date(date(2024, 2, 29), years=4) == date(2028, 2, 29)
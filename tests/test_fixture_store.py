@@ -0,0 +1,119 @@
+import asyncio
+import pickle
+
+import pytest
+
+from fixtures.seeding import Fixtures, SeededUserDict
+from fixtures.store import STORE_KEY, FixtureStore, FixtureStoreSetup
+from load.plan import LoadPlan
+from load.scenario import Scenario
+from load.stages import Stage
+
+
+def build_users(count: int) -> list[SeededUserDict]:
+    return [
+        SeededUserDict(
+            id=f"user-{index}",
+            email=f"user-{index}@example.com",
+            accounts=[
+                {
+                    "id": f"debit-{index}",
+                    "userId": f"user-{index}",
+                    "type": "DEBIT_CARD",
+                    "status": "ACTIVE",
+                    "cards": [
+                        {"id": f"virtual-{index}", "type": "VIRTUAL", "status": "ACTIVE", "paymentSystem": "VISA"},
+                        {
+                            "id": f"physical-{index}",
+                            "type": "PHYSICAL",
+                            "status": "ACTIVE",
+                            "paymentSystem": "MASTERCARD"
+                        }
+                    ]
+                },
+                {
+                    "id": f"deposit-{index}",
+                    "userId": f"user-{index}",
+                    "type": "DEPOSIT",
+                    "status": "ACTIVE",
+                    "cards": []
+                }
+            ]
+        )
+        for index in range(count)
+    ]
+
+
+@pytest.fixture
+def database(tmp_path) -> str:
+    path = str(tmp_path / "fixtures.db")
+    store = FixtureStore(path)
+    store.add_users(build_users(10))
+    store.close()
+    return path
+
+
+def test_sample_matches_filters(database: str) -> None:
+    store = FixtureStore(database)
+
+    for _ in range(20):
+        card = store.sample_card("DEBIT_CARD", "PHYSICAL", "ACTIVE")
+        assert card["id"].startswith("physical-")
+        assert card["paymentSystem"] == "MASTERCARD"
+        assert store.sample_account("DEPOSIT")["id"].startswith("deposit-")
+
+    assert store.count_cards(card_type="VIRTUAL", payment_system="VISA") == 10
+    with pytest.raises(LookupError):
+        store.sample_account("CREDIT_CARD")
+
+
+def test_checkout_cycles_through_all_entities(database: str) -> None:
+    store = FixtureStore(database)
+
+    first = [store.checkout_account("DEBIT_CARD")["id"] for _ in range(10)]
+    second = [store.checkout_account("DEBIT_CARD")["id"] for _ in range(10)]
+
+    assert len(set(first)) == 10
+    assert second == first
+
+
+def test_workers_get_disjoint_parts(database: str) -> None:
+    stores = [FixtureStore(database, worker, 3) for worker in range(3)]
+    parts = [{store.checkout_card(card_type="VIRTUAL")["id"] for _ in range(4)} for store in stores]
+
+    assert [len(part) for part in parts] == [3, 3, 4]
+    assert set.union(*parts) == {f"virtual-{index}" for index in range(10)}
+
+
+def test_from_fixtures_file_honours_worker(tmp_path) -> None:
+    path = tmp_path / "fixtures.json"
+    Fixtures(build_users(10)).save(path)
+
+    store = FixtureStore.from_fixtures_file(path, worker=1, workers=2)
+
+    assert store.count_accounts("DEBIT_CARD") == 5
+    assert store.checkout_account("DEBIT_CARD")["id"] == "debit-5"
+
+
+def test_plan_share_partitions_setup(database: str) -> None:
+    async def flow(ctx) -> None:
+        pass
+
+    plan = LoadPlan(
+        scenarios=(Scenario("noop", flow),),
+        stages=(Stage(duration=1, target=4),),
+        setup=FixtureStoreSetup(database)
+    )
+    # Две машины: первая с тремя процессами, вторая с одним, как у LoadController и MultiprocessRunner
+    shares = [plan.share(0, 4, 3).share(index, 3) for index in range(3)] + [plan.share(3, 4, 1).share(0, 1)]
+
+    accounts = []
+    for share in shares:
+        setup = pickle.loads(pickle.dumps(share.setup))
+        store = asyncio.run(setup(None))[STORE_KEY]
+        count = store.count_accounts("DEBIT_CARD")
+        accounts.append({store.checkout_account("DEBIT_CARD")["id"] for _ in range(count)})
+        store.close()
+
+    assert sum(len(part) for part in accounts) == 10
+    assert set.union(*accounts) == {f"debit-{index}" for index in range(10)}
@@ -0,0 +1,103 @@
+import asyncio
+
+import httpx
+import pytest
+
+from clients.http.gateway import client as gateway_client
+from clients.http.gateway.client import (
+    GatewayHTTPPoolConfig,
+    SharedAsyncHTTPTransport,
+    aclose_gateway_http_transports,
+    get_gateway_async_http_transport,
+    get_gateway_http_transport
+)
+
+
+def test_failed_warm_up_is_not_cached():
+    # На порту 1 никто не слушает: прогрев падает с ошибкой соединения
+    config = GatewayHTTPPoolConfig(base_url="http://127.0.0.1:1", warm_connections=2, connect_timeout=1)
+    for _ in range(2):
+        with pytest.raises(httpx.ConnectError):
+            get_gateway_http_transport(config)
+    assert config not in gateway_client._transports
+
+
+def test_aclose_keeps_pools_of_other_running_loops():
+    config = GatewayHTTPPoolConfig(base_url="http://gateway.test", max_connections=7)
+    transport = get_gateway_async_http_transport(config)
+    other_loop = asyncio.new_event_loop()
+    try:
+        transport._pools[other_loop] = httpx.AsyncHTTPTransport()
+
+        async def close_current() -> None:
+            transport._pools[asyncio.get_running_loop()] = httpx.AsyncHTTPTransport()
+            await aclose_gateway_http_transports()
+
+        asyncio.run(close_current())
+        assert other_loop in transport._pools
+        assert gateway_client._async_transports[config] is transport
+
+        other_loop.run_until_complete(aclose_gateway_http_transports())
+        assert not transport._pools
+        assert config not in gateway_client._async_transports
+    finally:
+        other_loop.close()
+
+
+def test_aclose_forgets_pools_of_closed_loops():
+    transport = SharedAsyncHTTPTransport(limits=httpx.Limits())
+    closed_loop = asyncio.new_event_loop()
+    closed_loop.close()
+    transport._pools[closed_loop] = httpx.AsyncHTTPTransport()
+    assert asyncio.run(transport.aclose_pool())
+    assert not transport._pools
+
+
+async def start_counting_server(paths: list[str]) -> tuple[asyncio.base_events.Server, list[int]]:
+    connections = [0]
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        connections[0] += 1
+        while line := await reader.readline():
+            paths.append(line.split()[1].decode())
+            while (await reader.readline()) not in (b"\r\n", b""):
+                pass
+            writer.write(b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\n\r\n{}")
+            await writer.drain()
+        writer.close()
+
+    return await asyncio.start_server(handle, "127.0.0.1", 0), connections
+
+
+def test_async_pool_is_warmed_up_on_first_use_in_each_loop():
+    async def run() -> tuple[list[str], int]:
+        paths: list[str] = []
+        server, connections = await start_counting_server(paths)
+        port = server.sockets[0].getsockname()[1]
+        config = GatewayHTTPPoolConfig(base_url=f"http://127.0.0.1:{port}", warm_connections=3, warm_up_path="/warm")
+        client = gateway_client.build_gateway_async_http_client(config)
+        try:
+            await asyncio.gather(client.get("/a"), client.get("/b"))
+        finally:
+            await aclose_gateway_http_transports()
+            server.close()
+        return paths, connections[0]
+
+    for _ in range(2):
+        paths, connections = asyncio.run(run())
+        assert paths[:3] == ["/warm"] * 3
+        assert sorted(paths[3:]) == ["/a", "/b"]
+        assert connections == 3
+
+
+def test_failed_async_warm_up_is_not_cached():
+    config = GatewayHTTPPoolConfig(base_url="http://127.0.0.1:1", warm_connections=2, connect_timeout=1)
+
+    async def run() -> None:
+        client = gateway_client.build_gateway_async_http_client(config)
+        for _ in range(2):
+            with pytest.raises(httpx.ConnectError):
+                await client.get("/")
+            assert not get_gateway_async_http_transport(config)._pools
+
+    asyncio.run(run())
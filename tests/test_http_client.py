@@ -0,0 +1,52 @@
+import asyncio
+
+import httpx
+
+from clients.http.client import AsyncHTTPClient, HTTPClient
+from metrics.recorder import MetricsRecorder
+
+CALLER_EXTENSIONS = {"timeout": {"connect": 1, "read": 2, "write": 3, "pool": 4}, "custom": "value"}
+
+
+def build_transport(seen: list[dict]) -> httpx.MockTransport:
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(dict(request.extensions))
+        return httpx.Response(200, json={})
+
+    return httpx.MockTransport(handler)
+
+
+def assert_merged(seen: list[dict]) -> None:
+    assert seen
+    for extensions in seen:
+        assert extensions["timeout"] == CALLER_EXTENSIONS["timeout"]
+        assert extensions["custom"] == "value"
+        assert "trace" in extensions
+
+
+def test_trace_phases_keeps_caller_extensions():
+    seen = []
+    client = HTTPClient(
+        httpx.Client(transport=build_transport(seen), base_url="http://gateway.test"),
+        recorder=MetricsRecorder(trace_phases=True)
+    )
+    client.request("GET", "/a", extensions=dict(CALLER_EXTENSIONS))
+    with client.stream("GET", "/b", extensions=dict(CALLER_EXTENSIONS)) as response:
+        response.read()
+    assert_merged(seen)
+
+
+def test_async_trace_phases_keeps_caller_extensions():
+    seen = []
+
+    async def run() -> None:
+        client = AsyncHTTPClient(
+            httpx.AsyncClient(transport=build_transport(seen), base_url="http://gateway.test"),
+            recorder=MetricsRecorder(trace_phases=True)
+        )
+        await client.request("GET", "/a", extensions=dict(CALLER_EXTENSIONS))
+        async with client.stream("GET", "/b", extensions=dict(CALLER_EXTENSIONS)) as response:
+            await response.aread()
+
+    asyncio.run(run())
+    assert_merged(seen)
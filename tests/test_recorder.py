@@ -0,0 +1,109 @@
+from types import SimpleNamespace
+
+import pytest
+
+from metrics import recorder as recorder_module
+from metrics.recorder import MetricsRecorder
+from metrics.steady import WarmupPolicy
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def perf_counter(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch) -> FakeClock:
+    clock = FakeClock()
+    monkeypatch.setattr(recorder_module, "time", SimpleNamespace(perf_counter=clock.perf_counter))
+    return clock
+
+
+def test_merged_rps_sums_workers_that_became_steady_at_different_times(clock: FakeClock):
+    coordinator = MetricsRecorder()
+    early, late = MetricsRecorder(), MetricsRecorder()
+    # Оба воркера делают по 10 запросов в секунду, но второй прогревался 5 секунд из 10
+    early.steady_after, late.steady_after = 0.0, 5.0
+    for _ in range(100):
+        early.record("GET /api/v1/users/{user_id}", 1_000_000)
+    for _ in range(50):
+        late.record("GET /api/v1/users/{user_id}", 1_000_000)
+
+    clock.now += 10
+    coordinator.merge_encoded(early.drain())
+    coordinator.merge_encoded(late.drain())
+
+    assert coordinator.steady_after == 5.0
+    assert coordinator.snapshot()["GET /api/v1/users/{user_id}"]["rps"] == pytest.approx(20)
+
+
+def test_merged_rps_uses_each_worker_clock_and_excludes_setup(clock: FakeClock):
+    coordinator = MetricsRecorder()
+    workers = [MetricsRecorder(), MetricsRecorder()]
+    # Координатор запущен раньше, а воркеры 3 секунды готовили состояние перед нагрузкой
+    clock.now += 3
+    for worker in workers:
+        worker.start()
+    for _ in range(100):
+        clock.now += 0.1
+        for worker in workers:
+            worker.record("GET /api/v1/accounts", 1_000_000)
+    for worker in workers:
+        coordinator.merge_encoded(worker.drain())
+
+    # Снимок, сделанный позже последней передачи, не занижает интенсивность
+    clock.now += 0.5
+    assert coordinator.snapshot()["GET /api/v1/accounts"]["rps"] == pytest.approx(20)
+
+
+def test_merged_recorder_warms_up_until_every_worker_is_steady(clock: FakeClock):
+    warmup = WarmupPolicy(detect=True)
+    coordinator, steady, warming = MetricsRecorder(warmup=warmup), MetricsRecorder(), MetricsRecorder(warmup=warmup)
+    steady.record("GET /api/v1/accounts", 1_000_000)
+    warming.record("GET /api/v1/accounts", 1_000_000)
+
+    coordinator.merge(steady)
+    coordinator.merge_encoded(warming.drain())
+    assert coordinator.warming_up
+
+    warming.steady_after = 3.0
+    coordinator.merge_encoded(warming.drain())
+    assert coordinator.steady_after == 3.0
+
+
+def record_window(recorder: MetricsRecorder, clock: FakeClock, slow_latency_ms: float) -> None:
+    # Окно в одну секунду: частая стабильная метрика и один редкий запрос, который ещё прогревается
+    for index in range(100):
+        clock.now += 0.01
+        recorder.record("fast", 1_000_000)
+        if index == 50:
+            recorder.record("slow", int(slow_latency_ms * 1_000_000))
+
+
+def test_detects_steady_state_per_metric(clock: FakeClock):
+    recorder = MetricsRecorder(warmup=WarmupPolicy(detect=True, window=1, windows=3))
+    recorder.started_at = clock.now
+
+    # В среднем по всем замерам латентность почти не меняется, но редкий запрос ещё ускоряется
+    for latency in (20, 14, 10, 7, 5):
+        record_window(recorder, clock, latency)
+        assert recorder.warming_up
+
+    for _ in range(4):
+        record_window(recorder, clock, 5)
+    assert not recorder.warming_up
+    assert recorder.warmup_snapshot()["slow"]["count"] >= 5
+
+
+def test_detects_steady_state_on_designated_metric(clock: FakeClock):
+    recorder = MetricsRecorder(warmup=WarmupPolicy(detect=True, window=1, windows=3, metric="fast"))
+    recorder.started_at = clock.now
+
+    for latency in (20, 14, 10, 7, 5):
+        record_window(recorder, clock, latency)
+
+    assert not recorder.warming_up
+    assert recorder.steady_after < 5
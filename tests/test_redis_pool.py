@@ -0,0 +1,207 @@
+import asyncio
+import json
+import pickle
+from typing import Any
+
+import pytest
+
+from fixtures.redis_pool import (
+    POOL_KEY,
+    EntityPoolEmpty,
+    EntityPoolSetup,
+    LocalEntityPool,
+    RedisEntityPool,
+    account_kind,
+    card_kind,
+    fill_entity_pool
+)
+from fixtures.seeding import Fixtures, SeededUserDict
+from load.arrival import ConstantRate
+from load.plan import LoadPlan, run_plan
+from load.scenario import Scenario, ScenarioContext
+from metrics.recorder import MetricsRecorder
+
+
+class FakePipeline:
+    """
+    Конвейер команд FakeRedis: команды копятся и выполняются в execute().
+    """
+
+    def __init__(self, redis: "FakeRedis") -> None:
+        self.redis = redis
+        self.commands: list[tuple[str, tuple]] = []
+
+    async def __aenter__(self) -> "FakePipeline":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        self.commands.clear()
+
+    def __getattr__(self, name: str):
+        def queue(*args: Any) -> "FakePipeline":
+            self.commands.append((name, args))
+            return self
+
+        return queue
+
+    async def execute(self) -> list[Any]:
+        self.redis.round_trips += 1
+        return [getattr(self.redis, name)(*args, round_trip=False) for name, args in self.commands]
+
+
+class FakeRedis:
+    """
+    Списки redis.asyncio.Redis в памяти с подсчётом обращений к серверу.
+    """
+
+    def __init__(self, version: str = "7.2.4") -> None:
+        self.version = version
+        self.lists: dict[str, list[bytes]] = {}
+        self.round_trips = 0
+        self.closed = False
+
+    def pipeline(self, transaction: bool = True) -> FakePipeline:
+        return FakePipeline(self)
+
+    def _call(self, result: Any, round_trip: bool) -> Any:
+        if not round_trip:
+            return result
+        self.round_trips += 1
+
+        async def reply() -> Any:
+            return result
+
+        return reply()
+
+    def rpush(self, key: str, *values: str, round_trip: bool = True) -> Any:
+        self.lists.setdefault(key, []).extend(value.encode() for value in values)
+        return self._call(len(self.lists[key]), round_trip)
+
+    def lpush(self, key: str, *values: str, round_trip: bool = True) -> Any:
+        self.lists[key] = [value.encode() for value in reversed(values)] + self.lists.get(key, [])
+        return self._call(len(self.lists[key]), round_trip)
+
+    def lpop(self, key: str, count: int, round_trip: bool = True) -> Any:
+        values = self.lists.get(key, [])
+        popped, self.lists[key] = values[:count], values[count:]
+        return self._call(popped or None, round_trip)
+
+    def llen(self, key: str, round_trip: bool = True) -> Any:
+        return self._call(len(self.lists.get(key, [])), round_trip)
+
+    def info(self, section: str, round_trip: bool = True) -> Any:
+        return self._call({"redis_version": self.version}, round_trip)
+
+    async def aclose(self) -> None:
+        self.closed = True
+
+
+def build_fixtures(count: int) -> Fixtures:
+    return Fixtures(
+        [
+            SeededUserDict(
+                id=f"user-{index}",
+                email=f"user-{index}@example.com",
+                accounts=[
+                    {
+                        "id": f"debit-{index}",
+                        "userId": f"user-{index}",
+                        "type": "DEBIT_CARD",
+                        "status": "ACTIVE",
+                        "cards": [
+                            {"id": f"card-{index}", "type": "VIRTUAL", "status": "ACTIVE", "paymentSystem": "VISA"}
+                        ]
+                    }
+                ]
+            )
+            for index in range(count)
+        ]
+    )
+
+
+def test_redis_pool_hands_out_each_entity_once() -> None:
+    async def scenario() -> None:
+        kind = card_kind("DEBIT_CARD", "VIRTUAL")
+        redis = FakeRedis()
+        await fill_entity_pool(RedisEntityPool(redis, batch=4), build_fixtures(10))
+        first, second = RedisEntityPool(redis, batch=4), RedisEntityPool(redis, batch=4)
+
+        round_trips = redis.round_trips
+        cards = [await first.checkout(kind) for _ in range(6)] + [await second.checkout(kind) for _ in range(2)]
+        # Два LPOP по batch у первого генератора и остаток у второго
+        assert redis.round_trips - round_trips == 3
+        assert len({card["id"] for card in cards}) == 8
+
+        with pytest.raises(EntityPoolEmpty):
+            await second.checkout(kind)
+
+        await first.release(kind, cards[0])
+        await first.close()
+        assert redis.closed
+        assert await second.size(kind) == 3
+        assert {(await second.checkout(kind))["id"] for _ in range(3)} == {"card-0", "card-6", "card-7"}
+
+    asyncio.run(scenario())
+
+
+def test_redis_pool_returns_surplus_to_redis() -> None:
+    async def scenario() -> None:
+        redis = FakeRedis()
+        pool = RedisEntityPool(redis, batch=2)
+        for index in range(4):
+            await pool.release(account_kind("DEPOSIT"), {"id": f"deposit-{index}"})
+
+        assert len(redis.lists["perf:pool:account:DEPOSIT"]) == 2
+        assert await pool.size(account_kind("DEPOSIT")) == 4
+
+    asyncio.run(scenario())
+
+
+def test_check_server_rejects_redis_without_lpop_count() -> None:
+    asyncio.run(RedisEntityPool(FakeRedis("6.2.0")).check_server())
+    with pytest.raises(RuntimeError, match="6.2 or newer"):
+        asyncio.run(RedisEntityPool(FakeRedis("6.0.16")).check_server())
+
+
+def test_local_setup_shares_fixtures_between_workers(tmp_path) -> None:
+    path = tmp_path / "fixtures.json"
+    build_fixtures(10).save(path)
+    setup = EntityPoolSetup(fixtures=str(path))
+
+    async def checkout_all(share: EntityPoolSetup) -> list[str]:
+        pool = (await share(None))[POOL_KEY]
+        assert isinstance(pool, LocalEntityPool)
+        kind = account_kind("DEBIT_CARD")
+        return [(await pool.checkout(kind))["id"] for _ in range(await pool.size(kind))]
+
+    parts = [asyncio.run(checkout_all(pickle.loads(pickle.dumps(setup.share(worker, 3))))) for worker in range(3)]
+
+    assert [len(part) for part in parts] == [3, 3, 4]
+    assert sorted(sum(parts, [])) == sorted(f"debit-{index}" for index in range(10))
+
+
+async def checkout_and_release(ctx: ScenarioContext) -> None:
+    pool, kind = ctx.state[POOL_KEY], card_kind("DEBIT_CARD", "VIRTUAL")
+    card = await pool.checkout(kind)
+    await asyncio.sleep(0.01)
+    await pool.release(kind, card)
+
+
+def test_plan_returns_buffered_entities_to_redis_after_run(monkeypatch) -> None:
+    redis = FakeRedis()
+    asyncio.run(fill_entity_pool(RedisEntityPool(redis), build_fixtures(10)))
+    monkeypatch.setattr(
+        RedisEntityPool, "from_url", classmethod(lambda cls, url, prefix, batch: cls(redis, prefix, batch))
+    )
+    plan = LoadPlan(
+        scenarios=(Scenario("pool", checkout_and_release),),
+        rate=ConstantRate(rps=100, duration=0.2),
+        setup=EntityPoolSetup(url="redis://redis:6379/0", batch=4)
+    )
+
+    recorder = asyncio.run(run_plan(plan, MetricsRecorder()))
+
+    assert recorder.snapshot()["pool"]["errors"] == 0
+    assert redis.closed
+    cards = {json.loads(value)["id"] for value in redis.lists["perf:pool:card:DEBIT_CARD:VIRTUAL"]}
+    assert cards == {f"card-{index}" for index in range(10)}
@@ -0,0 +1,63 @@
+import pytest
+
+from load.arrival import StepRate
+from load.spec import ScenarioSpecError, compile_plan
+
+FLOW = "load.flows:get_user_flow"
+
+
+def build_spec(scenario: dict | None = None, **fields) -> dict:
+    if "rate" not in fields:
+        fields.setdefault("stages", [{"duration": 30, "target": 5}])
+    return {"scenarios": [scenario or {"name": "get_user", "flow": FLOW}], **fields}
+
+
+def test_after_accepts_a_single_step_name():
+    plan = compile_plan(
+        build_spec(
+            {
+                "name": "documents",
+                "steps": [
+                    {"call": "users.create_user"},
+                    {"call": "users.create_user", "name": "second", "after": "create_user"}
+                ]
+            }
+        )
+    )
+
+    steps = {step.name: step for step in plan.scenarios[0].flow.steps}
+    assert steps["second"].after == ("create_user",)
+
+
+@pytest.mark.parametrize(
+    "spec, location",
+    [
+        (build_spec({"name": "get_user", "flow": FLOW, "weight": -1}), r"plan\.scenarios\[0\]\.weight"),
+        (build_spec({"name": "get_user", "flow": FLOW, "weight": "2"}), r"plan\.scenarios\[0\]\.weight"),
+        (build_spec({"name": "get_user", "flow": FLOW, "weight": 0}), r"plan\.scenarios:"),
+        (build_spec({"name": "get_user", "steps": "users.create_user"}), r"plan\.scenarios\[0\]\.steps"),
+        (
+            build_spec({"name": "get_user", "steps": [{"call": "users.create_user", "after": [1]}]}),
+            r"plan\.scenarios\[0\]\.steps\[0\]\.after\[0\]"
+        ),
+        (build_spec(rate={"rps": "fast", "duration": 10}), r"plan\.rate\.rps"),
+        (build_spec(rate={"rps": 10, "duration": None}), r"plan\.rate\.duration"),
+        (build_spec(rate={"type": "poisson", "rps": 10, "duration": 10, "seed": 1.5}), r"plan\.rate\.seed"),
+        (build_spec(rate={"type": "step", "steps": [[10, "x"]]}), r"plan\.rate\.steps\[0\]\[1\]"),
+        (build_spec(rate={"type": "step", "steps": [10, 20]}), r"plan\.rate\.steps\[0\]"),
+        (build_spec(rate={"type": "step", "steps": [[10, 0]]}), r"plan\.rate\.steps"),
+        (build_spec(stages=[{"duration": "30s", "target": 5}]), r"plan\.stages\[0\]\.duration"),
+        (build_spec(stages=[{"duration": 30, "target": 2.5}]), r"plan\.stages\[0\]\.target"),
+        (build_spec(stages=[{"duration": 30, "target": True}]), r"plan\.stages\[0\]\.target"),
+        (build_spec(max_in_flight=0), r"plan\.max_in_flight")
+    ]
+)
+def test_invalid_values_are_reported_with_location(spec: dict, location: str):
+    with pytest.raises(ScenarioSpecError, match=location):
+        compile_plan(spec)
+
+
+def test_step_rate_accepts_pauses():
+    plan = compile_plan(build_spec(rate={"type": "step", "steps": [[5, 10], [5, 0], [5, 20.5]]}))
+
+    assert plan.rate == StepRate(steps=((5.0, 10.0), (5.0, 0.0), (5.0, 20.5)))
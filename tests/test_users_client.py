@@ -0,0 +1,48 @@
+import asyncio
+import json
+import subprocess
+import sys
+
+import httpx
+
+from clients.http.gateway.users.client import UsersGatewayAsyncHTTPClient, UsersGatewayHTTPClient
+from fixtures.payloads import PayloadFactory
+
+
+def build_transport(bodies: list[dict]) -> httpx.MockTransport:
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        bodies.append(body)
+        return httpx.Response(200, json={"user": {"id": "user-1", **body}})
+
+    return httpx.MockTransport(handler)
+
+
+def test_create_user_uses_default_request_generator():
+    bodies = []
+    client = UsersGatewayHTTPClient(httpx.Client(transport=build_transport(bodies), base_url="http://gateway.test"))
+
+    client.create_user()
+    client.create_user()
+
+    assert bodies[0]["email"] != bodies[1]["email"]
+
+
+def test_create_user_uses_injected_request_generator():
+    bodies = []
+    factory = PayloadFactory(prefix="perf")
+    client = UsersGatewayAsyncHTTPClient(
+        httpx.AsyncClient(transport=build_transport(bodies), base_url="http://gateway.test"),
+        create_user_request=factory.create_user_request
+    )
+
+    response = asyncio.run(client.create_user())
+
+    assert ".perf." in bodies[0]["email"]
+    assert response["user"]["email"] == bodies[0]["email"]
+
+
+def test_users_client_does_not_import_fixtures():
+    code = "import sys, clients.http.gateway.users.client; print(any(m.startswith('fixtures') for m in sys.modules))"
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == "False"